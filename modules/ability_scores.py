@@ -4,8 +4,10 @@ Ability Scores Module
 Handles ability score calculations, bonuses, and final score computation for D&D characters.
 """
 
-from typing import Dict, List, Any, Tuple
-from dataclasses import dataclass
+import operator
+import sys
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 
 # D&D 2024 Point Buy cost table: score → points spent
 POINT_BUY_COSTS: Dict[int, int] = {
@@ -23,14 +25,148 @@ POINT_BUY_TOTAL = 27
 POINT_BUY_MIN = 8
 POINT_BUY_MAX = 15
 
-ABILITIES = [
-    "Strength",
-    "Dexterity",
-    "Constitution",
-    "Intelligence",
-    "Wisdom",
-    "Charisma",
-]
+# Interned so score-dict lookups with these keys can match by identity.
+ABILITIES = tuple(
+    sys.intern(ability)
+    for ability in (
+        "Strength",
+        "Dexterity",
+        "Constitution",
+        "Intelligence",
+        "Wisdom",
+        "Charisma",
+    )
+)
+
+_ABILITIES_SET = frozenset(ABILITIES)
+
+# Fetches the six ability values from a score dict in ABILITIES order.
+_GET_ABILITIES = operator.itemgetter(*ABILITIES)
+
+# Recommended ability score priority per class, highest first.
+_CLASS_RECOMMENDATIONS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "Barbarian": (
+        "Strength",
+        "Constitution",
+        "Dexterity",
+        "Wisdom",
+        "Charisma",
+        "Intelligence",
+    ),
+    "Bard": (
+        "Charisma",
+        "Dexterity",
+        "Constitution",
+        "Wisdom",
+        "Intelligence",
+        "Strength",
+    ),
+    "Cleric": (
+        "Wisdom",
+        "Constitution",
+        "Strength",
+        "Charisma",
+        "Dexterity",
+        "Intelligence",
+    ),
+    "Druid": (
+        "Wisdom",
+        "Constitution",
+        "Dexterity",
+        "Intelligence",
+        "Strength",
+        "Charisma",
+    ),
+    "Fighter": (
+        "Strength",
+        "Constitution",
+        "Dexterity",
+        "Wisdom",
+        "Charisma",
+        "Intelligence",
+    ),
+    "Monk": (
+        "Dexterity",
+        "Wisdom",
+        "Constitution",
+        "Strength",
+        "Intelligence",
+        "Charisma",
+    ),
+    "Paladin": (
+        "Strength",
+        "Charisma",
+        "Constitution",
+        "Wisdom",
+        "Dexterity",
+        "Intelligence",
+    ),
+    "Ranger": (
+        "Dexterity",
+        "Wisdom",
+        "Constitution",
+        "Strength",
+        "Intelligence",
+        "Charisma",
+    ),
+    "Rogue": (
+        "Dexterity",
+        "Constitution",
+        "Intelligence",
+        "Wisdom",
+        "Charisma",
+        "Strength",
+    ),
+    "Sorcerer": (
+        "Charisma",
+        "Constitution",
+        "Dexterity",
+        "Wisdom",
+        "Intelligence",
+        "Strength",
+    ),
+    "Warlock": (
+        "Charisma",
+        "Constitution",
+        "Dexterity",
+        "Wisdom",
+        "Intelligence",
+        "Strength",
+    ),
+    "Wizard": (
+        "Intelligence",
+        "Constitution",
+        "Dexterity",
+        "Wisdom",
+        "Charisma",
+        "Strength",
+    ),
+})
+
+# Signed modifier strings ("-5" … "+10") indexed by ability score.  Scores are
+# capped at 30, so display code can look the string up instead of formatting.
+_MOD_STR = tuple(f"{(score - 10) // 2:+d}" for score in range(31))
+
+
+def _format_modifier(score: int) -> str:
+    """Return the signed modifier string for an ability score."""
+    if 0 <= score <= 30:
+        return _MOD_STR[score]
+    return f"{(score - 10) // 2:+d}"
+
+
+# "<score> (<modifier>)" display strings, e.g. "14 (+2)", for scores 1-30.
+_SCORE_DISPLAY: Dict[int, str] = {
+    score: f"{score} ({_MOD_STR[score]})" for score in range(1, 31)
+}
+
+
+def format_score(score: int) -> str:
+    """Return an ability score with its signed modifier, e.g. ``"14 (+2)"``."""
+    display = _SCORE_DISPLAY.get(score)
+    if display is None:
+        display = f"{score} ({_format_modifier(score)})"
+    return display
 
 
 def validate_point_buy(scores: Dict[str, int]) -> Tuple[bool, str]:
@@ -56,236 +192,179 @@ def validate_point_buy(scores: Dict[str, int]) -> Tuple[bool, str]:
     return True, ""
 
 
-@dataclass
+# Serialized key -> AbilityScores attribute, used by from_dict.
+_FROM_DICT_FIELDS: Mapping[str, str] = MappingProxyType({
+    "base_ability_scores": "base_scores",
+    "species_ability_bonuses": "species_bonuses",
+    "background_ability_bonuses": "background_bonuses",
+    "additional_ability_modifiers": "additional_modifiers",
+    "final_ability_scores": "final_scores",
+    "ability_scores": "legacy_scores",  # For compatibility
+})
+
+
 class AbilityScores:
     """Manages all aspects of a character's ability scores"""
 
-    # Core ability names
-    ABILITIES = [
-        "Strength",
-        "Dexterity",
-        "Constitution",
-        "Intelligence",
-        "Wisdom",
-        "Charisma",
-    ]
+    # Core ability names (alias of the module-level tuple)
+    ABILITIES = ABILITIES
+
+    __slots__ = (
+        "base_scores",
+        "species_bonuses",
+        "background_bonuses",
+        "additional_modifiers",
+        "final_scores",
+        "legacy_scores",
+        "_modifier_cache",
+    )
 
     def __init__(self):
-        self.base_scores: Dict[str, int] = {ability: 10 for ability in self.ABILITIES}
-        self.species_bonuses: Dict[str, int] = {
-            ability: 0 for ability in self.ABILITIES
-        }
-        self.background_bonuses: Dict[str, int] = {
-            ability: 0 for ability in self.ABILITIES
-        }
-        self.additional_modifiers: Dict[str, int] = {
-            ability: 0 for ability in self.ABILITIES
-        }
-        self.final_scores: Dict[str, int] = {ability: 10 for ability in self.ABILITIES}
+        self.base_scores: Dict[str, int] = dict.fromkeys(ABILITIES, 10)
+        self.species_bonuses: Dict[str, int] = dict.fromkeys(ABILITIES, 0)
+        self.background_bonuses: Dict[str, int] = dict.fromkeys(ABILITIES, 0)
+        self.additional_modifiers: Dict[str, int] = dict.fromkeys(ABILITIES, 0)
+        self.final_scores: Dict[str, int] = dict.fromkeys(ABILITIES, 10)
 
         # Legacy compatibility
-        self.legacy_scores: Dict[str, int] = {ability: 0 for ability in self.ABILITIES}
+        self.legacy_scores: Dict[str, int] = dict.fromkeys(ABILITIES, 0)
+
+        # Modifiers derived from final_scores; rebuilt lazily after any change
+        self._modifier_cache: Optional[Dict[str, int]] = None
+
+    @staticmethod
+    def _copy_known(target: Dict[str, int], values: Dict[str, int]):
+        """Copy the recognised abilities from ``values`` into ``target``."""
+        for ability in ABILITIES:
+            if ability in values:
+                target[ability] = values[ability]
 
     def set_base_scores(self, scores: Dict[str, int]):
         """Set the base ability scores"""
-        for ability in self.ABILITIES:
-            if ability in scores:
-                self.base_scores[ability] = scores[ability]
+        self._copy_known(self.base_scores, scores)
         self._compute_final_scores()
 
     def apply_species_bonuses(self, bonuses: Dict[str, int]):
         """Apply species ability score bonuses"""
-        for ability in self.ABILITIES:
-            if ability in bonuses:
-                self.species_bonuses[ability] = bonuses[ability]
+        self._copy_known(self.species_bonuses, bonuses)
         self._compute_final_scores()
 
     def apply_background_bonuses(self, bonuses: Dict[str, int]):
         """Apply background ability score bonuses"""
-        for ability in self.ABILITIES:
-            if ability in bonuses:
-                self.background_bonuses[ability] = bonuses[ability]
+        self._copy_known(self.background_bonuses, bonuses)
         self._compute_final_scores()
 
     def apply_additional_modifiers(self, modifiers: Dict[str, int]):
         """Apply additional user ability score modifiers"""
-        for ability in self.ABILITIES:
-            if ability in modifiers:
-                self.additional_modifiers[ability] = modifiers[ability]
+        self._copy_known(self.additional_modifiers, modifiers)
+        self._compute_final_scores()
+
+    def load_scores(
+        self,
+        base: Optional[Dict[str, int]] = None,
+        species_bonuses: Optional[Dict[str, int]] = None,
+        background_bonuses: Optional[Dict[str, int]] = None,
+        additional_modifiers: Optional[Dict[str, int]] = None,
+    ):
+        """Set several score sources at once, recomputing final scores once.
+
+        Equivalent to calling the individual setters in order for every
+        argument that is not ``None``.
+        """
+        if base is not None:
+            self._copy_known(self.base_scores, base)
+        if species_bonuses is not None:
+            self._copy_known(self.species_bonuses, species_bonuses)
+        if background_bonuses is not None:
+            self._copy_known(self.background_bonuses, background_bonuses)
+        if additional_modifiers is not None:
+            self._copy_known(self.additional_modifiers, additional_modifiers)
         self._compute_final_scores()
 
     def _compute_final_scores(self):
         """Compute final ability scores from all sources"""
-        for ability in self.ABILITIES:
-            self.final_scores[ability] = (
-                self.base_scores[ability]
-                + self.species_bonuses[ability]
-                + self.background_bonuses[ability]
-                + self.additional_modifiers[ability]
+        # Update in place: callers hold references to final_scores.
+        self.final_scores.update(
+            zip(
+                ABILITIES,
+                map(
+                    sum,
+                    zip(
+                        _GET_ABILITIES(self.base_scores),
+                        _GET_ABILITIES(self.species_bonuses),
+                        _GET_ABILITIES(self.background_bonuses),
+                        _GET_ABILITIES(self.additional_modifiers),
+                    ),
+                ),
             )
+        )
 
         # Update legacy field for compatibility
         self.legacy_scores = self.background_bonuses.copy()
+        self._modifier_cache = None
+
+    def _modifiers(self) -> Dict[str, int]:
+        """Return the cached modifier map, computing it on first use."""
+        if self._modifier_cache is None:
+            self._modifier_cache = {
+                ability: (score - 10) // 2
+                for ability, score in self.final_scores.items()
+            }
+        return self._modifier_cache
 
     def get_modifier(self, ability: str) -> int:
         """Get the ability modifier for a given ability"""
-        return (self.final_scores.get(ability, 10) - 10) // 2
+        return self._modifiers().get(ability, 0)
 
     def get_all_modifiers(self) -> Dict[str, int]:
         """Get all ability modifiers"""
-        return {ability: self.get_modifier(ability) for ability in self.ABILITIES}
+        modifiers = self._modifiers()
+        return {ability: modifiers[ability] for ability in ABILITIES}
 
     def assign_standard_array(self, class_recommendations: List[str]) -> Dict[str, int]:
         """Assign ability scores using standard array and class recommendations"""
-        # D&D 2024 Standard Array
+        # D&D 2024 Standard Array, highest score first
         standard_array = [15, 14, 13, 12, 10, 8]
 
         # Create assignment mapping
         assignment = {}
-        used_scores = []
 
         # Assign recommended abilities first (highest scores)
-        for i, rec_ability in enumerate(class_recommendations[: len(standard_array)]):
-            if rec_ability in self.ABILITIES and standard_array:
-                score = max(standard_array)
-                assignment[rec_ability] = score
-                standard_array.remove(score)
-                used_scores.append(rec_ability)
+        for rec_ability in class_recommendations[: len(standard_array)]:
+            if rec_ability in _ABILITIES_SET and standard_array:
+                assignment[rec_ability] = standard_array.pop(0)
 
         # Assign remaining abilities
-        remaining_abilities = [a for a in self.ABILITIES if a not in used_scores]
-        for ability in remaining_abilities:
-            if standard_array:
-                assignment[ability] = standard_array.pop(0)
-            else:
-                assignment[ability] = 10
+        for ability in ABILITIES:
+            if ability not in assignment:
+                assignment[ability] = standard_array.pop(0) if standard_array else 10
 
         self.set_base_scores(assignment)
         return assignment
 
     def get_class_recommendations(self, class_name: str) -> List[str]:
         """Get recommended ability score priority for a class"""
-        recommendations = {
-            "Barbarian": [
-                "Strength",
-                "Constitution",
-                "Dexterity",
-                "Wisdom",
-                "Charisma",
-                "Intelligence",
-            ],
-            "Bard": [
-                "Charisma",
-                "Dexterity",
-                "Constitution",
-                "Wisdom",
-                "Intelligence",
-                "Strength",
-            ],
-            "Cleric": [
-                "Wisdom",
-                "Constitution",
-                "Strength",
-                "Charisma",
-                "Dexterity",
-                "Intelligence",
-            ],
-            "Druid": [
-                "Wisdom",
-                "Constitution",
-                "Dexterity",
-                "Intelligence",
-                "Strength",
-                "Charisma",
-            ],
-            "Fighter": [
-                "Strength",
-                "Constitution",
-                "Dexterity",
-                "Wisdom",
-                "Charisma",
-                "Intelligence",
-            ],
-            "Monk": [
-                "Dexterity",
-                "Wisdom",
-                "Constitution",
-                "Strength",
-                "Intelligence",
-                "Charisma",
-            ],
-            "Paladin": [
-                "Strength",
-                "Charisma",
-                "Constitution",
-                "Wisdom",
-                "Dexterity",
-                "Intelligence",
-            ],
-            "Ranger": [
-                "Dexterity",
-                "Wisdom",
-                "Constitution",
-                "Strength",
-                "Intelligence",
-                "Charisma",
-            ],
-            "Rogue": [
-                "Dexterity",
-                "Constitution",
-                "Intelligence",
-                "Wisdom",
-                "Charisma",
-                "Strength",
-            ],
-            "Sorcerer": [
-                "Charisma",
-                "Constitution",
-                "Dexterity",
-                "Wisdom",
-                "Intelligence",
-                "Strength",
-            ],
-            "Warlock": [
-                "Charisma",
-                "Constitution",
-                "Dexterity",
-                "Wisdom",
-                "Intelligence",
-                "Strength",
-            ],
-            "Wizard": [
-                "Intelligence",
-                "Constitution",
-                "Dexterity",
-                "Wisdom",
-                "Charisma",
-                "Strength",
-            ],
-        }
-
-        return recommendations.get(class_name, self.ABILITIES.copy())
+        return list(_CLASS_RECOMMENDATIONS.get(class_name, ABILITIES))
 
     def print_ability_breakdown(self, character_name: str = "Character"):
         """Print a detailed breakdown of ability scores"""
-        print(f"\nFinal Ability Scores for {character_name}:")
-        print(
-            f"{'Ability':<12} {'Base':<4} {'Species':<7} {'Background':<10} {'Final':<5} {'Modifier':<8}"
-        )
-        print("-" * 55)
+        lines = [
+            f"\nFinal Ability Scores for {character_name}:",
+            f"{'Ability':<12} {'Base':<4} {'Species':<7} {'Background':<10} {'Final':<5} {'Modifier':<8}",
+            "-" * 55,
+        ]
 
-        for ability in self.ABILITIES:
-            base = self.base_scores[ability]
-            species = self.species_bonuses[ability]
-            background = self.background_bonuses[ability]
+        for ability in ABILITIES:
             final = self.final_scores[ability]
-            modifier = self.get_modifier(ability)
-            mod_str = f"+{modifier}" if modifier >= 0 else str(modifier)
-
-            print(
-                f"{ability:<12} {base:<4} +{species:<6} +{background:<9} {final:<5} {mod_str:<8}"
+            lines.append(
+                f"{ability:<12} {self.base_scores[ability]:<4} "
+                f"+{self.species_bonuses[ability]:<6} "
+                f"+{self.background_bonuses[ability]:<9} "
+                f"{final:<5} {_format_modifier(final):<8}"
             )
 
+        print("\n".join(lines))
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         return {
@@ -299,15 +378,13 @@ class AbilityScores:
 
     def from_dict(self, data: Dict[str, Any]):
         """Load from dictionary"""
-        if "base_ability_scores" in data:
-            self.base_scores.update(data["base_ability_scores"])
-        if "species_ability_bonuses" in data:
-            self.species_bonuses.update(data["species_ability_bonuses"])
-        if "background_ability_bonuses" in data:
-            self.background_bonuses.update(data["background_ability_bonuses"])
-        if "additional_ability_modifiers" in data:
-            self.additional_modifiers.update(data["additional_ability_modifiers"])
-        if "final_ability_scores" in data:
-            self.final_scores.update(data["final_ability_scores"])
-        if "ability_scores" in data:
-            self.legacy_scores.update(data["ability_scores"])
+        for key, values in data.items():
+            attr = _FROM_DICT_FIELDS.get(key)
+            if attr is None:
+                continue
+            # Keys parsed from JSON are fresh strings; intern them so they
+            # share identity with the ABILITIES keys already in the dict.
+            getattr(self, attr).update(
+                (sys.intern(ability), value) for ability, value in values.items()
+            )
+        self._modifier_cache = None
@@ -23,13 +23,16 @@ Usage:
 """
 
 import json
+import os
 import re
 import random
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Any, Callable, Collection, Mapping, Optional, Tuple
 from copy import deepcopy
 
-from .ability_scores import AbilityScores
+from .ability_scores import ABILITIES, AbilityScores
 from .feature_manager import FeatureManager
 from .hp_calculator import HPCalculator
 from .variant_manager import VariantManager
@@ -39,8 +42,11 @@ from . import strict_mode
 import sys
 import math
 
-if str(Path(__file__).parent.parent) not in sys.path:
-    sys.path.insert(0, str(Path(__file__).parent.parent))
+# utils/ is a sibling of modules/; make sure the project root is importable
+# when this package was loaded some other way (e.g. by file path).
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 from utils.choice_resolver import (
     resolve_choice_options,
     get_option_descriptions,
@@ -67,6 +73,291 @@ def _humanize(snake: str) -> str:
 _CLASS_FEAT_SLOT_RE = re.compile(r"^class_feat_\d+$")
 _CLASS_FEAT_SUB_RE = re.compile(r"^(class_feat_\d+)_(.+)$")
 
+# "{name}" template variables in feature descriptions (see _apply_feature_scaling).
+_TEMPLATE_VAR_RE = re.compile(r"\{(\w+)\}")
+
+# Spell list named by a Magic Initiate feat, e.g. "Magic Initiate (Wizard)".
+_MAGIC_INITIATE_RE = re.compile(r"Magic Initiate \((\w+)\)")
+
+# Two-handed damage die of a Versatile weapon property, e.g. "Versatile (1d8)".
+_VERSATILE_DIE_RE = re.compile(r"\((\d+d\d+)\)")
+
+# ``features_by_level`` keys ("1" .. "20"), indexed by character level.
+_LEVEL_KEYS = tuple(str(level) for level in range(21))
+
+# Proficiency bonus by character level (index 0 mirrors level 1).
+_PROFICIENCY_BONUS = tuple(2 + max(level - 1, 0) // 4 for level in range(21))
+
+# Ability modifier by ability score, for the 0-30 range scores can reach.
+_ABILITY_MODIFIERS = tuple((score - 10) // 2 for score in range(31))
+
+# Starting-equipment items whose names mark them as armor or a shield.
+_ARMOR_KEYWORDS_RE = re.compile(r"armor|mail|leather|chain|scale|plate|shield")
+
+# Dependency order in which ``apply_choices`` dispatches the keys it knows
+# about (species → class → background → abilities → spells); every other
+# key is applied afterwards.
+_APPLY_CHOICES_ORDER = (
+    "character_name",
+    "name",
+    "level",
+    "species",
+    "lineage",
+    "lineage_spellcasting_ability",  # Must come after lineage is applied
+    "class",
+    "subclass",
+    # Class skill choices must come before background so overlap can be detected
+    "skill_choices",
+    "skills",
+    "background",
+    "background_skill_replacements",  # Must come after background is applied
+    # Ability scores: only apply method if no explicit scores provided
+    "ability_scores_method",  # This might apply standard array
+    "ability_scores",
+    "abilities",  # This overrides if present
+    # Background bonuses must come after base ability scores
+    "background_ability_score_assignment",
+    "background_bonuses_method",
+    "background_bonuses",
+    "additional_ability_modifiers",
+    "tool_choices",
+    "tools",
+    "spellcasting",
+    "spell_selections",  # Restore spell selections after class/subclass applied
+    "weapon mastery",
+    "weapon_mastery_selections",  # Restore mastery selections after class applied
+    "eldritch_invocation_selections",  # Restore invocation selections after class applied
+    "alignment",
+)
+
+# ``_APPLY_CHOICES_ORDER`` key -> position, for sorting a choices dict into
+# dispatch order.
+_APPLY_CHOICES_PRIORITY: Mapping[str, int] = MappingProxyType(
+    {key: index for index, key in enumerate(_APPLY_CHOICES_ORDER)}
+)
+
+
+# Phase 6: the structured bonus fields are *internal* calculation inputs.
+# They are derived purely from the effects already captured in
+# ``applied_effects`` (which is exported). ``to_character`` leaves them out
+# to keep the exported sheet stable and avoid leaking calculation
+# scaffolding into API consumers.
+_INTERNAL_EXPORT_KEYS = frozenset({
+    "damage_bonuses",
+    "attack_bonuses",
+    "ac_bonuses",
+    "hp_bonuses",
+    "initiative_bonuses",
+    "alternative_ac_options",
+    "fighting_style_flags",
+})
+
+
+# D&D 2024 skill -> governing ability, shared by every builder instance.
+_SKILL_ABILITIES = MappingProxyType({
+    "acrobatics": "dexterity",
+    "animal_handling": "wisdom",
+    "arcana": "intelligence",
+    "athletics": "strength",
+    "deception": "charisma",
+    "history": "intelligence",
+    "insight": "wisdom",
+    "intimidation": "charisma",
+    "investigation": "intelligence",
+    "medicine": "wisdom",
+    "nature": "intelligence",
+    "perception": "wisdom",
+    "performance": "charisma",
+    "persuasion": "charisma",
+    "religion": "intelligence",
+    "sleight_of_hand": "dexterity",
+    "stealth": "dexterity",
+    "survival": "wisdom",
+})
+
+# Effect/trait source -> character_data["features"] category.
+_FEATURE_SOURCE_CATEGORIES = MappingProxyType({
+    "species": "species",
+    "lineage": "lineage",
+    "class": "class",
+    "subclass": "subclass",
+    "class_choice": "class",
+})
+
+# Spell-granting source types whose display name is the character's chosen
+# option of that type (e.g. source_type "species" -> character_data["species"]).
+_CANTRIP_DISPLAY_SOURCE_TYPES = frozenset({"species", "lineage", "class", "subclass"})
+_SPELL_DISPLAY_SOURCE_TYPES = _CANTRIP_DISPLAY_SOURCE_TYPES | {"background"}
+_CLASS_DISPLAY_SOURCE_TYPES = frozenset({"class", "subclass"})
+
+# Trait sources whose feature entries are labelled with the chosen option
+# (e.g. the class name), falling back to these labels when none is set.
+_FEATURE_SOURCE_LABELS = MappingProxyType({
+    "class": "Class",
+    "subclass": "Subclass",
+    "species": "Species",
+    "lineage": "Lineage",
+})
+
+# Effect source types whose proficiency grants are credited to the species.
+_SPECIES_PROFICIENCY_SOURCE_TYPES = frozenset({"species", "species_choice", "lineage"})
+
+# Effect source types pruned from applied_effects when a species, lineage or
+# class is cleared.
+_SPECIES_EFFECT_SOURCE_TYPES = frozenset(
+    {"species", "species_choice", "lineage", "lineage_choice"}
+)
+_LINEAGE_EFFECT_SOURCE_TYPES = frozenset({"lineage", "lineage_choice"})
+_CLASS_EFFECT_SOURCE_TYPES = frozenset({"class", "class_choice"})
+
+# HTML table listing a feature's granted spells by character level.
+_SPELL_TABLE_TEMPLATE = (
+    "\n\n"
+    '<table class="table table-sm table-bordered mt-2">\n'
+    "<thead><tr><th>Character Level</th><th>Spells</th></tr></thead>\n"
+    "<tbody>\n{rows}</tbody>\n</table>"
+)
+_SPELL_TABLE_ROW = '<tr class="{cls}"><td>{lvl}</td><td>{mk}{sp}</td></tr>\n'
+# (row class, marker) for spell rows the character has / has not unlocked.
+_SPELL_ROW_UNLOCKED = ("table-success", "✓ ")
+_SPELL_ROW_LOCKED = ("table-secondary", "🔒 ")
+
+# Feature categories under character_data["features"], in search order.
+_FEATURE_CATEGORIES = ("class", "subclass", "species", "lineage", "background", "feats")
+# Categories whose features can own a bonus-cantrip choice.
+_CHOICE_PARENT_FEATURE_CATEGORIES = ("class", "subclass", "species", "lineage")
+
+
+try:
+    # orjson is optional; when installed it parses data files and clones
+    # JSON data faster than the stdlib module.
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parses JSON from bytes (or str); both parsers raise json.JSONDecodeError.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _clone_json_data(obj: Any) -> Any:
+    """Return an independent copy of JSON-compatible data.
+
+    A serialize/parse round-trip is cheaper than ``deepcopy`` for plain
+    dict/list/str/number trees, but it turns non-string dict keys into
+    strings, so only use it on data that was itself loaded from JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(orjson.dumps(obj))
+    return json.loads(json.dumps(obj, separators=(",", ":")))
+
+
+def _json_file_index(directory: str) -> Dict[str, Path]:
+    """Map the stem of every JSON file in *directory* to its path.
+
+    Entries are ordered by file name.  The listing is cached on the
+    directory's modification time, so files added or removed while the
+    process is running are picked up on the next lookup.
+    """
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        return {}
+    return _scan_json_file_index(directory, mtime)
+
+
+@lru_cache(maxsize=128)
+def _scan_json_file_index(directory: str, mtime_ns: int) -> Dict[str, Path]:
+    """Scan *directory* for JSON files, memoized on its path and modification time."""
+    try:
+        with os.scandir(directory) as entries:
+            names = sorted(
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            )
+    except OSError:
+        return {}
+    return {name[:-5]: Path(directory, name) for name in names}
+
+
+@lru_cache(maxsize=256)
+def _bonus_cantrip_parent_name(choice_key: str) -> str:
+    """Return the parent feature name for a ``*_bonus_cantrip`` choice key.
+
+    ``"Thaumaturge_bonus_cantrip"`` becomes ``"Thaumaturge"``.  The same
+    handful of keys recur on every rebuild, so the result is memoized.
+    """
+    return choice_key.replace("_bonus_cantrip", "").replace("_", " ").title()
+
+
+@lru_cache(maxsize=512)
+def _feature_name_variants(choice_key: str) -> Tuple[frozenset, Tuple[str, ...]]:
+    """Return the feature names a choice key can refer to, and their ``":"`` prefixes.
+
+    ``"species_trait_elven_lineage"`` matches ``"elven_lineage"``,
+    ``"Elven Lineage"``, ``"elven lineage"`` and the same forms of the full
+    key, either exactly or followed by ``": <choice>"``.
+    """
+    # Handle species_trait_ prefix
+    feature_base = choice_key.removeprefix("species_trait_")
+
+    # Normalize choice key to match feature names
+    spaced_base = feature_base.replace("_", " ")
+    spaced_key = choice_key.replace("_", " ")
+    variants = frozenset((
+        feature_base,
+        spaced_base.title(),
+        spaced_base,
+        choice_key,  # Also try original
+        spaced_key.title(),
+        spaced_key,
+    ))
+    return variants, tuple(variant + ":" for variant in variants)
+
+
+@lru_cache(maxsize=1024)
+def _average_damage(dice_expr: str, bonus: int, is_crit: bool, has_gwf: bool) -> float:
+    """Average damage for a dice expression; see ``_calculate_average_damage``.
+
+    Weapons share a handful of dice and small bonuses, so results are
+    memoized.
+    """
+    try:
+        if "d" not in dice_expr:
+            return float(bonus)
+
+        parts = dice_expr.lower().split("d")
+        num_dice = int(parts[0]) if parts[0] else 1
+        die_size = int(parts[1])
+
+        # For crits, double the number of dice
+        if is_crit:
+            num_dice *= 2
+
+        # Average of a die
+        if has_gwf:
+            # Great Weapon Fighting: reroll 1s and 2s
+            # Expected value = (2/N)*avg_reroll + sum(3 to N)/N
+            # Where avg_reroll is the normal die average
+            avg_all = (1 + die_size) / 2.0
+            sum_3_to_n = sum(range(3, die_size + 1))
+            avg_per_die = (2 * avg_all + sum_3_to_n) / die_size
+        else:
+            avg_per_die = (1 + die_size) / 2.0
+
+        total_avg = (num_dice * avg_per_die) + bonus
+
+        return round(total_avg, 1)
+    except (ValueError, IndexError):
+        return float(bonus)
+
+
+@lru_cache(maxsize=512)
+def _load_json_cached(path_str: str, mtime_ns: int) -> Any:
+    """Parse a JSON file, memoized on its path and modification time."""
+    with open(path_str, "rb") as f:
+        return _json_loads(f.read())
+
 
 class CharacterBuilder:
     """
@@ -140,11 +431,13 @@ class CharacterBuilder:
         else:
             self.data_dir = Path(data_dir)
 
-        # Initialize modular components
+        # Initialize modular components. The feature and variant managers
+        # load their own data files and are rarely needed, so they are
+        # created on first access (see the properties below).
         self.ability_scores = AbilityScores()
-        self.feature_manager = FeatureManager()
+        self._feature_manager: Optional[FeatureManager] = None
         self.hp_calculator = HPCalculator()
-        self.variant_manager = VariantManager()
+        self._variant_manager: Optional[VariantManager] = None
 
         # Load weapon and armor data for equipment processing
         self._weapon_data = self._load_weapon_data()
@@ -156,27 +449,15 @@ class CharacterBuilder:
         # Spell definitions cache
         self._spell_definitions_cache = {}
 
+        # Processed ability scores shared by the calculations of one
+        # to_character() call; None outside of it
+        self._processed_abilities: Optional[Dict[str, Dict[str, Any]]] = None
+
+        # Contexts already reported by _expect_dict
+        self._shape_warnings: set = set()
+
         # D&D 2024 skill to ability mappings for calculations
-        self.skill_abilities = {
-            "acrobatics": "dexterity",
-            "animal_handling": "wisdom",
-            "arcana": "intelligence",
-            "athletics": "strength",
-            "deception": "charisma",
-            "history": "intelligence",
-            "insight": "wisdom",
-            "intimidation": "charisma",
-            "investigation": "intelligence",
-            "medicine": "wisdom",
-            "nature": "intelligence",
-            "perception": "wisdom",
-            "performance": "charisma",
-            "persuasion": "charisma",
-            "religion": "intelligence",
-            "sleight_of_hand": "dexterity",
-            "stealth": "dexterity",
-            "survival": "wisdom",
-        }
+        self.skill_abilities = _SKILL_ABILITIES
 
         # Character data storage
         self.character_data = {
@@ -285,6 +566,20 @@ class CharacterBuilder:
         self.applied_effects = []
         self._ensure_base_language()
 
+    @property
+    def feature_manager(self) -> FeatureManager:
+        """Feature manager, created on first access."""
+        if self._feature_manager is None:
+            self._feature_manager = FeatureManager()
+        return self._feature_manager
+
+    @property
+    def variant_manager(self) -> VariantManager:
+        """Species variant index, created on first access."""
+        if self._variant_manager is None:
+            self._variant_manager = VariantManager()
+        return self._variant_manager
+
     def _ensure_base_language(self):
         """Ensure Common is always present and tracked as a baseline language."""
         languages = self.character_data["proficiencies"]["languages"]
@@ -294,37 +589,82 @@ class CharacterBuilder:
 
     # ==================== Data Loading Methods ====================
 
+    # Frequently used locations under data_dir, joined once per builder.
+    @cached_property
+    def _spell_definitions_dir(self) -> Path:
+        """Directory of per-spell definition files."""
+        return self.data_dir / "spells" / "definitions"
+
+    @cached_property
+    def _class_spell_lists_dir(self) -> Path:
+        """Directory of per-class spell list files."""
+        return self.data_dir / "spells" / "class_lists"
+
+    @cached_property
+    def _origin_feats_file(self) -> Path:
+        """Grouped origin feat definitions."""
+        return self.data_dir / "origin_feats.json"
+
+    @cached_property
+    def _general_feats_file(self) -> Path:
+        """Grouped general feat definitions."""
+        return self.data_dir / "general_feats.json"
+
     def _load_json_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
-        """Load a JSON file and return its contents."""
-        if not file_path.exists():
+        """Load a JSON file and return its contents.
+
+        Parsed files are cached process-wide and the cached object is
+        returned as-is, so callers must not mutate it; clone data that will
+        be stored in ``character_data`` or otherwise modified with
+        ``_clone_json_data``.
+        """
+        try:
+            mtime = file_path.stat().st_mtime_ns
+        except OSError:
             return None
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return _load_json_cached(str(file_path), mtime)
         except (json.JSONDecodeError, IOError) as e:
             print(f"Error loading {file_path}: {e}")
             return None
 
+    def _expect_dict(self, value: Any, context: str) -> Dict[str, Any]:
+        """Return *value* if it is a dict, otherwise an empty dict.
+
+        A malformed value is reported once per builder for each *context*,
+        so repeated rebuilds over the same bad data do not flood the log.
+        """
+        if isinstance(value, dict):
+            return value
+        if context not in self._shape_warnings:
+            self._shape_warnings.add(context)
+            print(f"Warning: {context} is not a dict: {type(value)}")
+        return {}
+
+    def _load_data_file(self, subdir: str, name: str) -> Optional[Dict[str, Any]]:
+        """Load the JSON file for *name* under ``data_dir/subdir``.
+
+        *name* is converted to its file slug (lowercase, spaces to
+        underscores) and looked up in a cached index of the directory.
+        """
+        index = _json_file_index(os.path.join(self.data_dir, subdir))
+        file_path = index.get(name.lower().replace(" ", "_"))
+        return self._load_json_file(file_path) if file_path else None
+
     def _load_species_data(self, species_name: str) -> Optional[Dict[str, Any]]:
         """Load species data from JSON file."""
-        filename = species_name.lower().replace(" ", "_")
-        file_path = self.data_dir / "species" / f"{filename}.json"
-        return self._load_json_file(file_path)
+        return self._load_data_file("species", species_name)
 
     def _load_lineage_data(
         self, species_name: str, lineage_name: str
     ) -> Optional[Dict[str, Any]]:
         """Load lineage/variant data from JSON file."""
-        filename = lineage_name.lower().replace(" ", "_")
-        file_path = self.data_dir / "species_variants" / f"{filename}.json"
-        return self._load_json_file(file_path)
+        return self._load_data_file("species_variants", lineage_name)
 
     def _load_class_data(self, class_name: str) -> Optional[Dict[str, Any]]:
         """Load class data from JSON file."""
-        filename = class_name.lower().replace(" ", "_")
-        file_path = self.data_dir / "classes" / f"{filename}.json"
-        return self._load_json_file(file_path)
+        return self._load_data_file("classes", class_name)
 
     def _load_subclass_data(
         self, class_name: str, subclass_name: str
@@ -338,24 +678,24 @@ class CharacterBuilder:
         (e.g. evocation.json whose "name" is "Evoker").
         """
         class_folder = class_name.lower().replace(" ", "_")
-        subclass_dir = self.data_dir / "subclasses" / class_folder
+        index = _json_file_index(
+            os.path.join(self.data_dir, "subclasses", class_folder)
+        )
         filename = subclass_name.lower().replace(" ", "_").replace(":", "-")
-        file_path = subclass_dir / f"{filename}.json"
-        if file_path.exists():
+        file_path = index.get(filename)
+        if file_path:
             return self._load_json_file(file_path)
         # Fallback: scan folder and match by the "name" field
-        if subclass_dir.exists():
-            for json_file in sorted(subclass_dir.glob("*.json")):
-                data = self._load_json_file(json_file)
-                if data and data.get("name", "").lower() == subclass_name.lower():
-                    return data
+        subclass_lower = subclass_name.lower()
+        for json_file in index.values():
+            data = self._load_json_file(json_file)
+            if data and data.get("name", "").lower() == subclass_lower:
+                return data
         return None
 
     def _load_background_data(self, background_name: str) -> Optional[Dict[str, Any]]:
         """Load background data from JSON file."""
-        filename = background_name.lower().replace(" ", "_")
-        file_path = self.data_dir / "backgrounds" / f"{filename}.json"
-        return self._load_json_file(file_path)
+        return self._load_data_file("backgrounds", background_name)
 
     @staticmethod
     def _background_feat_name(background_data: Optional[Dict[str, Any]]) -> Optional[str]:
@@ -425,15 +765,13 @@ class CharacterBuilder:
     def _load_feat_data(self, feat_name: str) -> Optional[Dict[str, Any]]:
         """Load feat data from grouped feat files."""
         # Load origin feats
-        origin_feats_file = self.data_dir / "origin_feats.json"
-        origin_data = self._load_json_file(origin_feats_file)
+        origin_data = self._load_json_file(self._origin_feats_file)
         if origin_data and "origin_feats" in origin_data:
             if feat_name in origin_data["origin_feats"]:
                 return origin_data["origin_feats"][feat_name]
         
         # Load general feats
-        general_feats_file = self.data_dir / "general_feats.json"
-        general_data = self._load_json_file(general_feats_file)
+        general_data = self._load_json_file(self._general_feats_file)
         if general_data and "general_feats" in general_data:
             if feat_name in general_data["general_feats"]:
                 return general_data["general_feats"][feat_name]
@@ -576,14 +914,14 @@ class CharacterBuilder:
             self.character_data["choices_made"][persist_choice_key] = values
 
         if choice_name == "skills_or_tools":
-            for item in values:
-                if item in self._ALL_SKILLS:
-                    if item not in self.character_data["proficiencies"]["skills"]:
-                        self.character_data["proficiencies"]["skills"].append(item)
-                        self.character_data["proficiency_sources"]["skills"][item] = feat_name
-                else:
-                    if item not in self.character_data["proficiencies"]["tools"]:
-                        self.character_data["proficiencies"]["tools"].append(item)
+            skill_sources = self.character_data["proficiency_sources"]["skills"]
+            for item in self._add_proficiencies(
+                "skills", [item for item in values if item in self._ALL_SKILLS]
+            ):
+                skill_sources[item] = feat_name
+            self._add_proficiencies(
+                "tools", [item for item in values if item not in self._ALL_SKILLS]
+            )
 
         elif choice_name == "cantrips":
             for cantrip in values:
@@ -627,7 +965,8 @@ class CharacterBuilder:
         choice_effect_map = feat_data["choice_effects"].get(choice_name, {})
         for value in values:
             if value in choice_effect_map:
-                for effect in choice_effect_map[value]:
+                # The parsed feat file is shared; applied_effects keeps its own copy.
+                for effect in _clone_json_data(choice_effect_map[value]):
                     self._apply_effect(effect, feat_name, "feat")
 
     # ==================== Species/Lineage Methods ====================
@@ -673,7 +1012,7 @@ class CharacterBuilder:
         # Clear applied effects from species and lineage source
         if hasattr(self, "applied_effects"):
             self._filter_applied_effects(
-                lambda e: e.get("source_type") in ["species", "species_choice", "lineage", "lineage_choice"]
+                lambda e: e.get("source_type") in _SPECIES_EFFECT_SOURCE_TYPES
             )
 
         # Clear species/lineage spells from always_prepared
@@ -747,7 +1086,7 @@ class CharacterBuilder:
         # Clear applied effects from lineage source
         if hasattr(self, "applied_effects"):
             self._filter_applied_effects(
-                lambda e: e.get("source_type") in ["lineage", "lineage_choice"]
+                lambda e: e.get("source_type") in _LINEAGE_EFFECT_SOURCE_TYPES
             )
 
         # Phase 9: re-derive darkvision from surviving (species-sourced)
@@ -795,7 +1134,7 @@ class CharacterBuilder:
         # Clear any existing species/lineage data first
         self._clear_species_features()
         
-        species_data = self._load_species_data(species_name)
+        species_data = _clone_json_data(self._load_species_data(species_name))
         if not species_data:
             return False
 
@@ -833,8 +1172,8 @@ class CharacterBuilder:
         # Clear any existing lineage data first
         self._clear_lineage_features()
         
-        lineage_data = self._load_lineage_data(
-            self.character_data["species"], lineage_name
+        lineage_data = _clone_json_data(
+            self._load_lineage_data(self.character_data["species"], lineage_name)
         )
         if not lineage_data:
             return False
@@ -885,6 +1224,33 @@ class CharacterBuilder:
         for trait_name, trait_data in traits.items():
             self._apply_trait_effects(trait_name, trait_data, "lineage")
 
+    def _lookup_trait_choice(
+        self, trait_name: str, trait_slug: str, choice_key: str
+    ) -> Any:
+        """Return the choice recorded for a trait's choice picker, or None.
+
+        Checks the canonical nested ``choices_made["species_trait_choices"]``
+        (P0-1) first, then the flat ``choices_made`` keys, including the
+        legacy ``species_trait_`` prefixed forms.  Within each mapping the
+        first key present wins, in the order listed below.
+        """
+        choices_made = self.character_data["choices_made"]
+        nested_traits = choices_made.get("species_trait_choices")
+        if isinstance(nested_traits, dict):
+            for key in (choice_key, trait_name, trait_slug):
+                if key in nested_traits:
+                    if nested_traits[key] is not None:
+                        return nested_traits[key]
+                    break
+
+        for key in (choice_key, trait_name, trait_slug):
+            if key in choices_made:
+                return choices_made[key]
+        key = f"species_trait_{trait_name}"
+        if key in choices_made:
+            return choices_made[key]
+        return choices_made.get(f"species_trait_{trait_name.replace(' ', '_')}")
+
     def _apply_trait_effects(
         self, trait_name: str, trait_data: Any, source: str, level: int = None
     ):
@@ -915,28 +1281,25 @@ class CharacterBuilder:
             trait_data: Trait data (string or dict with effects)
             source: Source of the trait ('species', 'lineage', 'class', etc.)
         """
-        # Get description and apply any template substitutions
-        description = (
-            trait_data
-            if isinstance(trait_data, str)
-            else trait_data.get("description", "")
-            if isinstance(trait_data, dict)
-            else ""
-        )
+        # Traits are either a bare description string or a dict. Resolve the
+        # shape once; string traits get an empty ``trait_dict`` so the checks
+        # below are plain key lookups.
+        if isinstance(trait_data, dict):
+            trait_dict = trait_data
+            description = trait_data.get("description", "")
+        else:
+            trait_dict = {}
+            description = trait_data if isinstance(trait_data, str) else ""
 
         # Apply scaling/template substitutions for class features
-        if (
-            source == "class"
-            and isinstance(trait_data, dict)
-            and "scaling" in trait_data
-        ):
+        if source == "class" and "scaling" in trait_dict:
             description = self._apply_feature_scaling(
-                description, trait_data["scaling"]
+                description, trait_dict["scaling"]
             )
 
         # Apply choice-based template substitutions (e.g., {damage_type} from Draconic Ancestry)
-        if isinstance(trait_data, dict) and "choice_substitutions" in trait_data:
-            for var_name, choice_name in trait_data["choice_substitutions"].items():
+        if "choice_substitutions" in trait_dict:
+            for var_name, choice_name in trait_dict["choice_substitutions"].items():
                 choice_value = self._resolve_choice_value(choice_name)
                 if choice_value:
                     resolved = self._extract_parenthetical(choice_value)
@@ -946,7 +1309,6 @@ class CharacterBuilder:
         # fields instead of name-matching or feature_override.json lookups. The kind
         # is authored in data/classes/*.json and data/subclasses/**/*.json.
         if source in ("class", "subclass", "class_choice"):
-            trait_dict = trait_data if isinstance(trait_data, dict) else {}
             feature_kind = trait_dict.get("feature_kind", "normal")
 
             # Explicit suppression
@@ -972,40 +1334,72 @@ class CharacterBuilder:
         # avoid skipping meaningful feature descriptions that happen to start with "Choose"
         # (e.g. Fiendish Resilience: "Choose one damage type when you finish a Short Rest...").
         CHOICE_PLACEHOLDER_MAX_LENGTH = 100
+        # Check the length first and lowercase only the six-character prefix,
+        # so long descriptions are never copied just to test how they start.
         if (
             isinstance(description, str)
-            and description.lower().startswith("choose")
             and len(description) < CHOICE_PLACEHOLDER_MAX_LENGTH
+            and description[:6].lower() == "choose"
         ):
             return
 
         # Map source to feature category and get descriptive source name
-        category_map = {
-            "species": "species",
-            "lineage": "lineage",
-            "class": "class",
-            "subclass": "subclass",
-            "class_choice": "class",
-        }
-        category = category_map.get(source, "class")
+        category = _FEATURE_SOURCE_CATEGORIES.get(source, "class")
+
+        # Check if feature already exists (avoid duplicates). Names are matched
+        # by prefix because choice picks rename entries to "<trait>: <choice>".
+        # The entry is only rendered when it is actually going to be added.
+        category_features = self.character_data["features"][category]
+        for existing in category_features:
+            if existing["name"].startswith(trait_name):
+                break
+        else:
+            category_features.append(
+                self._build_trait_feature_entry(
+                    trait_name, trait_dict, source, description, level
+                )
+            )
+
+        # String traits carry no effects
+        effects = trait_dict.get("effects")
+        if not effects:
+            return
+
+        # For class/subclass effects, capture which class the effect came from
+        # so per-level scaling (e.g., Draconic Resilience) can be scoped to that
+        # class's level in multiclass builds rather than total character level.
+        source_class_name = None
+        if source in ("class", "subclass"):
+            source_class_name = self.character_data.get("class")
+        for effect in effects:
+            self._apply_effect(effect, trait_name, source, source_class_name=source_class_name)
 
+    def _build_trait_feature_entry(
+        self,
+        trait_name: str,
+        trait_dict: Dict[str, Any],
+        source: str,
+        description: str,
+        level: Optional[int],
+    ) -> Dict[str, Any]:
+        """Render the ``character_data["features"]`` entry for a trait.
+
+        Resolves the display name and description from any recorded choice,
+        then appends granted-spell and option listings to the description.
+        ``trait_dict`` is empty for plain string traits.
+        """
         # Get descriptive source name
-        if source == "class":
-            source_display = self.character_data.get("class", "Class")
-        elif source == "subclass":
-            source_display = f"{self.character_data.get('subclass', 'Subclass')}"
-        elif source == "species":
-            source_display = self.character_data.get("species", "Species")
-        elif source == "lineage":
-            source_display = self.character_data.get("lineage", "Lineage")
-        else:
+        default_label = _FEATURE_SOURCE_LABELS.get(source)
+        if default_label is None:
             source_display = source
+        else:
+            source_display = self.character_data.get(source, default_label)
 
         # Check if this feature has a choice and if a choice was made
         display_name = trait_name
-        if isinstance(trait_data, dict) and "choices" in trait_data:
+        if "choices" in trait_dict:
             # Look up the choice from choices_made
-            choice_config = trait_data["choices"]
+            choice_config = trait_dict["choices"]
             # When choices is a list (multiple independent choice pickers per feature,
             # e.g. Deft Explorer which has both an expertise picker and a language picker),
             # use the first item for the display-name lookup. Each choice in the list
@@ -1015,34 +1409,9 @@ class CharacterBuilder:
             # (first) selection in the feature's display name.
             if isinstance(choice_config, list):
                 choice_config = choice_config[0] if choice_config else {}
-            choice_key = choice_config.get("name", trait_name.lower().replace(" ", "_"))
-
-            # Check various possible choice keys (including species_trait_ prefix).
-            # Canonical: nested ``choices_made["species_trait_choices"]`` (P0-1).
-            choice_value = None
-            nested_traits = self.character_data["choices_made"].get(
-                "species_trait_choices"
-            )
-            if isinstance(nested_traits, dict):
-                for nested_key in [
-                    choice_key,
-                    trait_name,
-                    trait_name.lower().replace(" ", "_"),
-                ]:
-                    if nested_key in nested_traits:
-                        choice_value = nested_traits[nested_key]
-                        break
-            if choice_value is None:
-                for possible_key in [
-                    choice_key,
-                    trait_name,
-                    trait_name.lower().replace(" ", "_"),
-                    f"species_trait_{trait_name}",
-                    f"species_trait_{trait_name.replace(' ', '_')}",
-                ]:
-                    if possible_key in self.character_data["choices_made"]:
-                        choice_value = self.character_data["choices_made"][possible_key]
-                        break
+            trait_slug = trait_name.lower().replace(" ", "_")
+            choice_key = choice_config.get("name", trait_slug)
+            choice_value = self._lookup_trait_choice(trait_name, trait_slug, choice_key)
 
             # Append choice to display name
             if choice_value:
@@ -1055,105 +1424,55 @@ class CharacterBuilder:
                 choice_source = choice_config.get("source", {})
                 source_type_str = choice_source.get("type", "")
 
+                choice_list = None
                 if source_type_str == "external":
                     # Load description from external file
                     external_file = choice_source.get("file", "")
                     choice_list_name = choice_source.get("list", "")
 
                     if external_file and choice_list_name:
-                        try:
-                            external_path = self.data_dir / external_file
-                            if external_path.exists():
-                                with open(external_path, "r") as f:
-                                    external_data = json.load(f)
-                                    choice_list = external_data.get(
-                                        choice_list_name, {}
-                                    )
-
-                                    # Handle both single choice and list of choices
-                                    if isinstance(choice_value, list):
-                                        # For multiple choices, combine descriptions
-                                        descriptions = []
-                                        for cv in choice_value:
-                                            if isinstance(choice_list.get(cv), dict):
-                                                descriptions.append(
-                                                    choice_list[cv].get(
-                                                        "description", ""
-                                                    )
-                                                )
-                                            elif isinstance(choice_list.get(cv), str):
-                                                descriptions.append(choice_list[cv])
-                                        if descriptions:
-                                            description = "\n\n".join(descriptions)
-                                    else:
-                                        # Single choice
-                                        if isinstance(
-                                            choice_list.get(choice_value), dict
-                                        ):
-                                            choice_desc = choice_list[choice_value].get(
-                                                "description", ""
-                                            )
-                                            if choice_desc:
-                                                description = choice_desc
-                                        elif isinstance(
-                                            choice_list.get(choice_value), str
-                                        ):
-                                            description = choice_list[choice_value]
-                        except (json.JSONDecodeError, IOError) as e:
-                            print(
-                                f"Warning: Could not load choice description from {external_file}: {e}"
-                            )
+                        external_data = self._load_json_file(
+                            self.data_dir / external_file
+                        )
+                        if external_data is not None:
+                            choice_list = external_data.get(choice_list_name, {})
 
                 elif source_type_str == "internal":
                     # Load description from internal list
                     internal_list_name = choice_source.get("list", "")
 
-                    if internal_list_name and isinstance(trait_data, dict):
-                        internal_list = trait_data.get(internal_list_name, {})
+                    if internal_list_name:
+                        choice_list = trait_dict.get(internal_list_name, {})
 
-                        # Handle both single choice and list of choices
-                        if isinstance(choice_value, list):
-                            descriptions = []
-                            for cv in choice_value:
-                                if isinstance(internal_list.get(cv), dict):
-                                    descriptions.append(
-                                        internal_list[cv].get("description", "")
-                                    )
-                                elif isinstance(internal_list.get(cv), str):
-                                    descriptions.append(internal_list[cv])
-                            if descriptions:
-                                description = "\n\n".join(descriptions)
-                        else:
-                            # Single choice
-                            if isinstance(internal_list.get(choice_value), dict):
-                                choice_desc = internal_list[choice_value].get(
-                                    "description", ""
-                                )
-                                if choice_desc:
-                                    description = choice_desc
-                            elif isinstance(internal_list.get(choice_value), str):
-                                description = internal_list[choice_value]
+                if choice_list is not None:
+                    choice_description = self._describe_choice(
+                        choice_list, choice_value
+                    )
+                    if choice_description is not None:
+                        description = choice_description
+
+        # Extra sections are collected and joined onto the description once.
+        description_parts = [description]
 
         # Phase 8: legacy cantrip-selection rendering for spellcasting_setup features
         # (Spellcasting / Pact Magic). Old saved characters stored their chosen
         # cantrips under choices_made["Spellcasting"]; new characters manage spells
         # post-creation. Dispatch on feature_kind, not feature name.
-        if (
-            isinstance(trait_data, dict)
-            and trait_data.get("feature_kind") == "spellcasting_setup"
-        ):
+        if trait_dict.get("feature_kind") == "spellcasting_setup":
             spellcasting_choices = self.character_data["choices_made"].get(
                 "Spellcasting", []
             )
             if isinstance(spellcasting_choices, list) and spellcasting_choices:
-                description += f"\n\nCantrips Known: {', '.join(spellcasting_choices)}"
+                description_parts.append(
+                    f"\n\nCantrips Known: {', '.join(spellcasting_choices)}"
+                )
 
         # Check for grant_spell effects and append spell list to description
-        if isinstance(trait_data, dict) and "effects" in trait_data:
+        if "effects" in trait_dict:
             spells_by_level = {}  # Group spells by their min_level
             current_level = self.character_data.get("level", 1)
 
-            for effect in trait_data.get("effects", []):
+            for effect in trait_dict["effects"]:
                 if effect.get("type") == "grant_spell":
                     spell_name = effect.get("spell")
                     min_level = effect.get("min_level", 1)
@@ -1166,43 +1485,47 @@ class CharacterBuilder:
                 # Check if spells are granted at multiple levels
                 if len(spells_by_level) > 1:
                     # Create an HTML table format for multiple levels
-                    description += "\n\n"
-                    description += (
-                        '<table class="table table-sm table-bordered mt-2">\n'
-                    )
-                    description += "<thead><tr><th>Character Level</th><th>Spells</th></tr></thead>\n"
-                    description += "<tbody>\n"
+                    rows = []
                     for level in sorted(spells_by_level.keys()):
-                        spells = ", ".join(spells_by_level[level])
-                        if current_level >= level:
-                            row_class = "table-success"
-                            marker = "✓ "
-                        else:
-                            row_class = "table-secondary"
-                            marker = "🔒 "
-                        description += f'<tr class="{row_class}"><td>{level}</td><td>{marker}{spells}</td></tr>\n'
-                    description += "</tbody>\n</table>"
+                        row_class, marker = (
+                            _SPELL_ROW_UNLOCKED
+                            if current_level >= level
+                            else _SPELL_ROW_LOCKED
+                        )
+                        rows.append(
+                            _SPELL_TABLE_ROW.format(
+                                cls=row_class,
+                                lvl=level,
+                                mk=marker,
+                                sp=", ".join(spells_by_level[level]),
+                            )
+                        )
+                    description_parts.append(
+                        _SPELL_TABLE_TEMPLATE.format(rows="".join(rows))
+                    )
                 else:
                     # Single level, use simple format
                     all_spells = []
                     for spells in spells_by_level.values():
                         all_spells.extend(spells)
-                    description += (
+                    description_parts.append(
                         f"\n\nSpells Always Prepared: {', '.join(all_spells)}"
                     )
 
         # Render structured options (e.g. Celestial Revelation transformations)
-        if isinstance(trait_data, dict) and "options" in trait_data:
-            options = trait_data["options"]
+        if "options" in trait_dict:
+            options = trait_dict["options"]
             if isinstance(options, dict) and options:
-                options_html = '<div class="mt-2">'
-                for opt_name, opt_desc in options.items():
-                    options_html += (
-                        f'<div class="mt-1"><strong class="text-secondary">{opt_name}:</strong> '
-                        f'<span>{opt_desc}</span></div>'
-                    )
-                options_html += "</div>"
-                description += options_html
+                description_parts.append('<div class="mt-2">')
+                description_parts.extend(
+                    f'<div class="mt-1"><strong class="text-secondary">{opt_name}:</strong> '
+                    f'<span>{opt_desc}</span></div>'
+                    for opt_name, opt_desc in options.items()
+                )
+                description_parts.append("</div>")
+
+        if len(description_parts) > 1:
+            description = "".join(description_parts)
 
         # Add to features dict
         feature_entry = {
@@ -1213,35 +1536,39 @@ class CharacterBuilder:
 
         # Preserve choice_substitutions on the entry so to_character() can resolve
         # placeholders that weren't available yet when the trait was first applied
-        if isinstance(trait_data, dict) and "choice_substitutions" in trait_data:
-            feature_entry["choice_substitutions"] = trait_data["choice_substitutions"]
+        if "choice_substitutions" in trait_dict:
+            feature_entry["choice_substitutions"] = trait_dict["choice_substitutions"]
 
         # Add level information if provided (for class/subclass features)
         if level is not None:
             feature_entry["level"] = level
 
-        # Check if feature already exists (avoid duplicates)
-        if not any(
-            f["name"].startswith(trait_name)
-            for f in self.character_data["features"][category]
-        ):
-            self.character_data["features"][category].append(feature_entry)
+        return feature_entry
 
-        # If trait_data is just a string, no effects to apply
-        if isinstance(trait_data, str):
-            return
+    @staticmethod
+    def _describe_choice(choice_list: Dict[str, Any], choice_value: Any) -> Optional[str]:
+        """Return the description of the chosen option(s) in *choice_list*.
 
-        # If trait_data is a dict, check for effects
-        if isinstance(trait_data, dict):
-            effects = trait_data.get("effects", [])
-            # For class/subclass effects, capture which class the effect came from
-            # so per-level scaling (e.g., Draconic Resilience) can be scoped to that
-            # class's level in multiclass builds rather than total character level.
-            source_class_name = None
-            if source in ("class", "subclass"):
-                source_class_name = self.character_data.get("class")
-            for effect in effects:
-                self._apply_effect(effect, trait_name, source, source_class_name=source_class_name)
+        Options are description strings or dicts with a ``description``
+        field; a list of choices joins its descriptions with blank lines.
+        Returns None when the choice yields no description to use.
+        """
+        if isinstance(choice_value, list):
+            descriptions = []
+            for cv in choice_value:
+                option = choice_list.get(cv)
+                if isinstance(option, dict):
+                    descriptions.append(option.get("description", ""))
+                elif isinstance(option, str):
+                    descriptions.append(option)
+            return "\n\n".join(descriptions) if descriptions else None
+
+        option = choice_list.get(choice_value)
+        if isinstance(option, dict):
+            return option.get("description", "") or None
+        if isinstance(option, str):
+            return option
+        return None
 
     def _extract_parenthetical(self, value: str) -> str:
         """
@@ -1295,19 +1622,27 @@ class CharacterBuilder:
         """
         level = self.character_data.get("level", 1)
 
+        substitutions = {}
         for var_name, scale_list in scaling.items():
-            # Find the appropriate value for current level
+            # Find the appropriate value for current level: the last entry
+            # whose min_level has been reached, found by scanning backwards
             value = None
-            for scale_entry in scale_list:
-                min_level = scale_entry.get("min_level", 1)
-                if level >= min_level:
+            for scale_entry in reversed(scale_list):
+                if level >= scale_entry.get("min_level", 1):
                     value = scale_entry.get("value")
+                    break
 
-            # Replace template variable
             if value is not None:
-                description = description.replace(f"{{{var_name}}}", str(value))
+                substitutions[var_name] = str(value)
 
-        return description
+        if not substitutions:
+            return description
+
+        # Replace every template variable in a single pass
+        return _TEMPLATE_VAR_RE.sub(
+            lambda match: substitutions.get(match.group(1), match.group(0)),
+            description,
+        )
 
     def _apply_effect(self, effect: Dict[str, Any], source_name: str, source_type: str, source_class_name: Optional[str] = None):
         """
@@ -1322,671 +1657,938 @@ class CharacterBuilder:
         """
 
         effect_type = effect.get("type")
-        strict_mode.check_effect_type(effect_type, source_name)
-
-        def _resolve_choice_reference(ref: str):
-            # Only handles ${cantrips[0]}, ${cantrips[1]}, ${1st_level_spell}, etc.
-            import re
-            m = re.match(r"^\$\{(.+?)\}$", ref)
-            if not m:
-                return ref
-            key = m.group(1)
-            # Handle cantrips[0], cantrips[1], 1st_level_spell, etc.
-            if key.startswith("cantrips["):
-                idx = int(key[len("cantrips["):-1])
-                cantrips = []
-                # Try to find the feat name from the effect context
-                # This is only used for feat effects (e.g. Magic Initiate)
-                for feat_key, value in self.character_data.get("choices_made", {}).items():
-                    if feat_key.endswith("cantrips") and isinstance(value, list):
-                        cantrips = value
-                        break
-                if idx < len(cantrips):
-                    return cantrips[idx]
-                return None
-            elif key == "1st_level_spell":
-                # Find the spell choice for 1st_level_spell
-                for feat_key, value in self.character_data.get("choices_made", {}).items():
-                    if feat_key.endswith("1st_level_spell") and value:
-                        if isinstance(value, list):
-                            return value[0]
-                        return value
-                # Some feats use 'spell' as the key
-                for feat_key, value in self.character_data.get("choices_made", {}).items():
-                    if feat_key.endswith("spell") and value:
-                        if isinstance(value, list):
-                            return value[0]
-                        return value
-                return None
+        handler = (
+            self._EFFECT_HANDLERS.get(effect_type)
+            if isinstance(effect_type, str)
+            else None
+        )
+        if handler is None:
+            # Every type in the closed enum has a handler, so only missing or
+            # unknown types need validating.
+            strict_mode.check_effect_type(effect_type, source_name)
+        else:
+            handler(self, effect, source_name, source_type, source_class_name)
+
+        # Track applied effect — AUDIT LOG ONLY. See class-level docstring on
+        # ``applied_effects`` for the contract.
+        tracked: Dict[str, Any] = {
+            "type": effect_type,
+            "source": source_name,
+            "source_type": source_type,
+            "effect": effect,
+        }
+        if source_class_name:
+            tracked["source_class_name"] = source_class_name
+        self.applied_effects.append(tracked)
+
+    def _resolve_effect_choice_reference(self, ref: str):
+        """Resolve a ``${...}`` choice reference used in feat spell effects.
+
+        Only ``${cantrips[N]}`` and ``${1st_level_spell}`` are understood;
+        anything else resolves to ``None``. Plain names are returned as is.
+        """
+        m = re.match(r"^\$\{(.+?)\}$", ref)
+        if not m:
+            return ref
+        key = m.group(1)
+        # Handle cantrips[0], cantrips[1], 1st_level_spell, etc.
+        if key.startswith("cantrips["):
+            idx = int(key[len("cantrips["):-1])
+            cantrips = []
+            # Try to find the feat name from the effect context
+            # This is only used for feat effects (e.g. Magic Initiate)
+            for feat_key, value in self.character_data.get("choices_made", {}).items():
+                if feat_key.endswith("cantrips") and isinstance(value, list):
+                    cantrips = value
+                    break
+            if idx < len(cantrips):
+                return cantrips[idx]
+            return None
+        elif key == "1st_level_spell":
+            # Find the spell choice for 1st_level_spell
+            for feat_key, value in self.character_data.get("choices_made", {}).items():
+                if feat_key.endswith("1st_level_spell") and value:
+                    if isinstance(value, list):
+                        return value[0]
+                    return value
+            # Some feats use 'spell' as the key
+            for feat_key, value in self.character_data.get("choices_made", {}).items():
+                if feat_key.endswith("spell") and value:
+                    if isinstance(value, list):
+                        return value[0]
+                    return value
             return None
+        return None
 
-        if effect_type == "grant_cantrip":
-            spell_name = effect.get("spell")
-            counts_against_limit = effect.get("counts_against_limit", False)
+    def _effect_grant_cantrip(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_cantrip`` effect."""
+        spell_name = effect.get("spell")
+        counts_against_limit = effect.get("counts_against_limit", False)
+
+        # Resolve choice reference if present
+        resolved_spell = None
+        if isinstance(spell_name, str) and spell_name.startswith("${"):
+            resolved_spell = self._resolve_effect_choice_reference(spell_name)
+        else:
+            resolved_spell = spell_name
 
-            # Resolve choice reference if present
-            resolved_spell = None
-            if isinstance(spell_name, str) and spell_name.startswith("${"):
-                resolved_spell = _resolve_choice_reference(spell_name)
+        if resolved_spell:
+            # Map source_type to actual display name
+            if source_type in _CANTRIP_DISPLAY_SOURCE_TYPES:
+                display_source = self.character_data.get(source_type, source_name)
             else:
-                resolved_spell = spell_name
-
-            if resolved_spell:
-                # Map source_type to actual display name
-                if source_type == "species":
-                    display_source = self.character_data.get("species", source_name)
-                elif source_type == "lineage":
-                    display_source = self.character_data.get("lineage", source_name)
-                elif source_type == "class":
-                    display_source = self.character_data.get("class", source_name)
-                elif source_type == "subclass":
-                    display_source = self.character_data.get("subclass", source_name)
-                else:
-                    display_source = source_name
+                display_source = source_name
 
-                # Add to always_prepared dict with metadata
-                self.character_data["spells"]["always_prepared"][resolved_spell] = {
-                    "level": 0,
-                    "source": display_source,
-                    "always_prepared": True,
-                    "counts_against_limit": counts_against_limit,
-                }
+            # Add to always_prepared dict with metadata
+            self.character_data["spells"]["always_prepared"][resolved_spell] = {
+                "level": 0,
+                "source": display_source,
+                "always_prepared": True,
+                "counts_against_limit": counts_against_limit,
+            }
 
-                # Also track in spell_metadata for compatibility
-                self.character_data["spell_metadata"][resolved_spell] = {
-                    "source": display_source,
-                    "source_type": source_type,
-                    "always_prepared": True,
-                    "once_per_day": False,
-                    "counts_against_limit": counts_against_limit,
-                }
+            # Also track in spell_metadata for compatibility
+            self.character_data["spell_metadata"][resolved_spell] = {
+                "source": display_source,
+                "source_type": source_type,
+                "always_prepared": True,
+                "once_per_day": False,
+                "counts_against_limit": counts_against_limit,
+            }
+
+    def _effect_grant_cantrip_choice(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_cantrip_choice`` effect."""
+        # This handler intentionally does nothing.  The cantrip choice is
+        # deferred to the choice resolver: when the player selects a cantrip
+        # (via a feat or feature choice), apply_choice() resolves the name
+        # and calls _apply_effect(grant_cantrip).  The type stays registered
+        # so the dispatch table documents every effect type it accepts.
+        pass
+
+    def _effect_grant_spell(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_spell`` effect."""
+        spell_name = effect.get("spell")
+        min_level = effect.get("min_level", 1)
+        counts_against_limit = effect.get("counts_against_limit", False)
+
+        # Resolve choice reference if present
+        resolved_spell = None
+        if isinstance(spell_name, str) and spell_name.startswith("${"):
+            resolved_spell = self._resolve_effect_choice_reference(spell_name)
+        else:
+            resolved_spell = spell_name
+
+        if resolved_spell and self.character_data["level"] >= min_level:
+            # Load spell definition to get actual spell level
+            spell_def = self._load_spell_definition(resolved_spell)
+            spell_level = spell_def.get("level", 1)
 
-        elif effect_type == "grant_cantrip_choice":
-            # This branch intentionally does nothing here.  The cantrip choice
-            # is deferred to the choice resolver: when the player selects a
-            # cantrip (via a feat or feature choice), apply_choice() resolves
-            # the name and calls _apply_effect(grant_cantrip).  This branch
-            # must remain so strict_mode.check_effect_type() does not raise an
-            # "unknown effect type" warning for data files that carry this type.
-            pass
-
-        elif effect_type == "grant_spell":
-            spell_name = effect.get("spell")
-            min_level = effect.get("min_level", 1)
-            counts_against_limit = effect.get("counts_against_limit", False)
-
-            # Resolve choice reference if present
-            resolved_spell = None
-            if isinstance(spell_name, str) and spell_name.startswith("${"):
-                resolved_spell = _resolve_choice_reference(spell_name)
+            # Map source_type to actual name for display
+            if source_type in _SPELL_DISPLAY_SOURCE_TYPES:
+                display_source = self.character_data.get(source_type, source_name)
             else:
-                resolved_spell = spell_name
+                display_source = source_name
+
+            # Determine if spell is 1/day (for species/lineage spells)
+            once_per_day = source_type in ["species", "lineage"]
+
+            # Add to always_prepared dict with metadata
+            self.character_data["spells"]["always_prepared"][resolved_spell] = {
+                "level": spell_level,
+                "source": display_source,
+                "always_prepared": True,
+                "once_per_day": once_per_day,
+                "counts_against_limit": counts_against_limit,
+            }
 
-            if resolved_spell and self.character_data["level"] >= min_level:
-                # Load spell definition to get actual spell level
-                spell_def = self._load_spell_definition(resolved_spell)
-                spell_level = spell_def.get("level", 1)
+            # Also track in spell_metadata for compatibility
+            self.character_data["spell_metadata"][resolved_spell] = {
+                "source": display_source,
+                "source_type": source_type,
+                "once_per_day": once_per_day,
+                "always_prepared": True,
+                "counts_against_limit": counts_against_limit,
+            }
 
-                # Map source_type to actual name for display
-                if source_type == "species":
-                    display_source = self.character_data.get("species", source_name)
-                elif source_type == "lineage":
-                    display_source = self.character_data.get("lineage", source_name)
-                elif source_type == "class":
-                    display_source = self.character_data.get("class", source_name)
-                elif source_type == "subclass":
-                    display_source = self.character_data.get("subclass", source_name)
-                elif source_type == "background":
-                    display_source = self.character_data.get("background", source_name)
-                else:
-                    display_source = source_name
+    def _effect_grant_weapon_proficiency(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_weapon_proficiency`` effect."""
+        proficiencies = effect.get("proficiencies", [])
+        source_display = self._proficiency_source_display(source_name, source_type)
+        sources = self.character_data["proficiency_sources"]["weapons"]
+        # Track the source of each new weapon proficiency
+        for prof in self._add_proficiencies("weapons", proficiencies):
+            sources[prof] = source_display
+
+    def _effect_grant_armor_proficiency(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_armor_proficiency`` effect."""
+        proficiencies = effect.get("proficiencies", [])
+        source_display = self._proficiency_source_display(source_name, source_type)
+        sources = self.character_data["proficiency_sources"]["armor"]
+        # Track the source of each new armor proficiency
+        for prof in self._add_proficiencies("armor", proficiencies):
+            sources[prof] = source_display
+
+    def _effect_grant_tool_proficiency(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_tool_proficiency`` effect."""
+        tools = effect.get("tools", [])
+        source_display = self._proficiency_source_display(source_name, source_type)
+        sources = self.character_data["proficiency_sources"]["tools"]
+        # Track the source of each new tool proficiency
+        for tool in self._add_proficiencies("tools", tools):
+            sources[tool] = source_display
+
+    def _effect_grant_skill_proficiency(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_skill_proficiency`` effect."""
+        skills = effect.get("skills", [])
+        skill_profs = self.character_data["proficiencies"]["skills"]
+        known_skills = set(skill_profs)
+        source_display = self._proficiency_source_display(source_name, source_type)
+        sources = self.character_data["proficiency_sources"]["skills"]
+        for skill in skills:
+            if not isinstance(skill, str) or is_unresolved_placeholder(skill):
+                continue
+            if skill not in known_skills:
+                known_skills.add(skill)
+                skill_profs.append(skill)
+                # Track the source of this skill proficiency
+                sources[skill] = source_display
+            elif source_type in (
+                "species", "species_choice", "lineage", "lineage_choice"
+            ):
+                # Skill overlap — species/lineage tried to grant a skill
+                # the character already has. Track for replacement choice.
+                needed = self.character_data["choices_made"].get(
+                    "species_skill_replacements_needed", 0
+                )
+                self.character_data["choices_made"][
+                    "species_skill_replacements_needed"
+                ] = needed + 1
+            elif source_type == "background":
+                # Phase 9 (D1-1): background skill overlap. D&D 2024:
+                # overlapping background skill proficiencies are replaced
+                # by player's choice. Track count for the wizard prompt.
+                needed = self.character_data["choices_made"].get(
+                    "background_skill_replacements_needed", 0
+                )
+                self.character_data["choices_made"][
+                    "background_skill_replacements_needed"
+                ] = needed + 1
 
-                # Determine if spell is 1/day (for species/lineage spells)
-                once_per_day = source_type in ["species", "lineage"]
+    def _effect_grant_skill_expertise(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_skill_expertise`` effect."""
+        # Resolve skills from a choice key if specified, otherwise use direct list
+        if "from_choice" in effect:
+            choice_key = effect["from_choice"]
+            chosen = self.character_data.get("choices_made", {}).get(choice_key)
+            if isinstance(chosen, list):
+                skills = chosen
+            elif isinstance(chosen, str) and chosen:
+                skills = [chosen]
+            else:
+                skills = []
+        else:
+            skills = effect.get("skills", [])
+        if "skill_expertise" not in self.character_data:
+            self.character_data["skill_expertise"] = []
+        for skill in skills:
+            # Skip unresolved choice placeholders (e.g. Ranger still uses
+            # "__deft_explorer_expertise__" / "__expertise_skills__" until
+            # those classes are migrated to the from_choice pattern).
+            if skill.startswith("__"):
+                continue
+            if skill not in self.character_data["skill_expertise"]:
+                self.character_data["skill_expertise"].append(skill)
 
-                # Add to always_prepared dict with metadata
-                self.character_data["spells"]["always_prepared"][resolved_spell] = {
-                    "level": spell_level,
-                    "source": display_source,
-                    "always_prepared": True,
-                    "once_per_day": once_per_day,
-                    "counts_against_limit": counts_against_limit,
-                }
+    def _effect_grant_skill_proficiency_or_expertise(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_skill_proficiency_or_expertise`` effect."""
+        # D&D 2024 pattern: "If you lack proficiency, gain proficiency;
+        # if you already have proficiency, gain Expertise."
+        skills = effect.get("skills", [])
+        if "skill_expertise" not in self.character_data:
+            self.character_data["skill_expertise"] = []
+        for skill in skills:
+            if skill in self.character_data["proficiencies"]["skills"]:
+                # Already proficient → grant expertise
+                if skill not in self.character_data["skill_expertise"]:
+                    self.character_data["skill_expertise"].append(skill)
+            else:
+                # Not proficient → grant proficiency
+                self.character_data["proficiencies"]["skills"].append(skill)
+                self.character_data["proficiency_sources"]["skills"][skill] = (
+                    source_name
+                )
 
-                # Also track in spell_metadata for compatibility
-                self.character_data["spell_metadata"][resolved_spell] = {
-                    "source": display_source,
-                    "source_type": source_type,
-                    "once_per_day": once_per_day,
-                    "always_prepared": True,
-                    "counts_against_limit": counts_against_limit,
-                }
+    def _effect_grant_save_advantage(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_save_advantage`` effect."""
+        abilities = effect.get("abilities", [])
+        display = effect.get("display", "")
+        condition = effect.get("condition", "")
+        # Avoid duplicate entries
+        if abilities and not any(
+            e.get("abilities") == abilities and e.get("condition") == condition
+            for e in self.character_data["save_advantages"]
+        ):
+            self.character_data["save_advantages"].append({
+                "abilities": abilities,
+                "display": display,
+                "condition": condition,
+            })
 
-        elif effect_type == "grant_weapon_proficiency":
-            proficiencies = effect.get("proficiencies", [])
-            for prof in proficiencies:
-                if prof not in self.character_data["proficiencies"]["weapons"]:
-                    self.character_data["proficiencies"]["weapons"].append(prof)
-                    # Track the source of this weapon proficiency
-                    if source_type == "species_choice":
-                        source_display = self.character_data.get("species", source_name)
-                    elif source_type in ["species", "lineage"]:
-                        source_display = self.character_data.get("species", source_name)
-                    else:
-                        source_display = source_name
-                    self.character_data["proficiency_sources"]["weapons"][prof] = (
-                        source_display
-                    )
+    def _effect_grant_damage_resistance(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_damage_resistance`` effect."""
+        # Accept both singular and plural damage type forms:
+        #   {"type": "grant_damage_resistance", "damage_type": "Poison"}
+        #   {"type": "grant_damage_resistance", "damage_types": ["Poison", "Cold"]}
+        # The plural form is the preferred shape; singular is kept for
+        # back-compat with existing data files.
+        damage_types = effect.get("damage_types") or (
+            [effect["damage_type"]] if "damage_type" in effect else []
+        )
+        # Support dynamic damage type resolved from a species/trait choice
+        if not damage_types and "damage_type_from_choice" in effect:
+            choice_value = self._resolve_choice_value(effect["damage_type_from_choice"])
+            if choice_value:
+                damage_types = [self._extract_parenthetical(choice_value)]
+        for damage_type in damage_types:
+            if damage_type and damage_type not in self.character_data["resistances"]:
+                self.character_data["resistances"].append(damage_type)
+
+    def _effect_grant_condition_immunity(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_condition_immunity`` effect."""
+        condition = effect.get("condition")
+        if condition and condition not in self.character_data["condition_immunities"]:
+            self.character_data["condition_immunities"].append(condition)
+
+    def _effect_grant_darkvision(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_darkvision`` effect."""
+        darkvision_range = effect.get("range", 60)
+        if darkvision_range > self.character_data["darkvision"]:
+            self.character_data["darkvision"] = darkvision_range
+
+    def _effect_increase_speed(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply an ``increase_speed`` effect."""
+        speed_increase = effect.get("value", 0)
+        feature_group = effect.get("feature_group")
+        if feature_group:
+            previous = self.character_data["speed_bonuses"].get(feature_group, 0)
+            self.character_data["speed"] = self.character_data["speed"] - previous + speed_increase
+            self.character_data["speed_bonuses"][feature_group] = speed_increase
+        else:
+            self.character_data["speed"] += speed_increase
+
+    def _effect_ability_bonus(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply an ``ability_bonus`` effect."""
+        # Store ability bonuses for later calculation (like Thaumaturge)
+        if "ability_bonuses" not in self.character_data:
+            self.character_data["ability_bonuses"] = []
+
+        bonus_info = {
+            "ability": effect.get("ability"),
+            "skills": effect.get("skills", []),
+            "value": effect.get("value"),
+            "minimum": effect.get("minimum", 0),
+            "source": source_name,
+        }
+        self.character_data["ability_bonuses"].append(bonus_info)
+
+    def _effect_grant_save_proficiency(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_save_proficiency`` effect."""
+        abilities = effect.get("abilities", [])
+        for ability in self._add_proficiencies("saving_throws", abilities):
+            self.character_data["proficiency_sources"]["saving_throws"][ability] = source_name
+
+    def _effect_alternative_ac(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply an ``alternative_ac`` effect."""
+        # Monk/Barbarian Unarmored Defense and similar formulas.
+        # Stored on a structured field that ``calculate_ac_options``
+        # consumes directly. (Audit log still receives the entry via the
+        # tail of ``_apply_effect``.)
+        entry = {
+            "base": effect.get("base", 10),
+            "modifiers": list(effect.get("modifiers", [])),
+            "condition": effect.get("condition", ""),
+            "source": source_name,
+            "source_type": source_type,
+        }
+        # Idempotent: do not double-store an identical entry from the
+        # same source.
+        existing = self.character_data["alternative_ac_options"]
+        if not any(
+            e["source"] == entry["source"]
+            and e["base"] == entry["base"]
+            and e["modifiers"] == entry["modifiers"]
+            and e.get("condition", "") == entry["condition"]
+            for e in existing
+        ):
+            existing.append(entry)
+
+    def _effect_bonus_damage(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``bonus_damage`` effect."""
+        # Fighting styles (Dueling, Thrown Weapon Fighting), feats, etc.
+        entry = {
+            "value": effect.get("value", 0),
+            "condition": effect.get("condition", ""),
+            "weapon_property": effect.get("weapon_property"),
+            "damage_type": effect.get("damage_type"),
+            "source": source_name,
+            "source_type": source_type,
+            "source_class_name": source_class_name,
+        }
+        self.character_data["damage_bonuses"].append(entry)
+
+    def _effect_bonus_attack(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``bonus_attack`` effect."""
+        entry = {
+            "value": effect.get("value", 0),
+            "weapon_property": effect.get("weapon_property"),
+            "condition": effect.get("condition", ""),
+            "source": source_name,
+            "source_type": source_type,
+            "source_class_name": source_class_name,
+        }
+        self.character_data["attack_bonuses"].append(entry)
+
+    def _effect_bonus_ac(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``bonus_ac`` effect."""
+        entry = {
+            "value": effect.get("value", 0),
+            "condition": effect.get("condition", ""),
+            "source": source_name,
+            "source_type": source_type,
+            "source_class_name": source_class_name,
+        }
+        self.character_data["ac_bonuses"].append(entry)
+
+    def _effect_bonus_hp(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``bonus_hp`` effect."""
+        entry = {
+            "value": effect.get("value", 0),
+            "scaling": effect.get("scaling"),
+            "source": source_name,
+            "source_type": source_type,
+            "source_class_name": source_class_name,
+        }
+        self.character_data["hp_bonuses"].append(entry)
+
+    def _effect_bonus_initiative(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``bonus_initiative`` effect."""
+        self.character_data["initiative_bonuses"].append(
+            self._build_initiative_bonus_entry(
+                effect,
+                source_name,
+                source_type,
+                source_class_name,
+            )
+        )
+
+    def _effect_great_weapon_fighting(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``great_weapon_fighting`` effect."""
+        flags = self.character_data["fighting_style_flags"]["great_weapon_fighting"]
+        if source_name not in flags:
+            flags.append(source_name)
+
+    def _effect_two_weapon_fighting_modifier(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``two_weapon_fighting_modifier`` effect."""
+        flags = self.character_data["fighting_style_flags"]["two_weapon_fighting_modifier"]
+        if source_name not in flags:
+            flags.append(source_name)
+
+    def _effect_unarmed_fighting(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply an ``unarmed_fighting`` effect."""
+        flags = self.character_data["fighting_style_flags"]["unarmed_fighting"]
+        if source_name not in flags:
+            flags.append(source_name)
+
+    def _effect_set_martial_arts_die(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``set_martial_arts_die`` effect."""
+        # Monk: resolve the correct Martial Arts die for the current level
+        die_by_level = effect.get("die_by_level", {})
+        level = self.character_data.get("level", 1)
+        resolved_die = "1d6"  # fallback
+        for level_threshold, die in sorted(
+            die_by_level.items(), key=lambda x: int(x[0])
+        ):
+            if level >= int(level_threshold):
+                resolved_die = die
+        self.character_data["martial_arts_die"] = resolved_die
+
+    def _effect_monk_dexterous_attacks(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``monk_dexterous_attacks`` effect."""
+        # Monk: Dexterous Attacks allows using DEX instead of STR for
+        # attack and damage rolls of monk weapons (Simple Melee, or
+        # Martial Melee with Light property)
+        self.character_data["monk_dexterous_attacks"] = True
+
+    def _effect_grant_language(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_language`` effect."""
+        # Resolve languages from a choice key if specified, otherwise use direct list
+        if "from_choice" in effect:
+            choice_key = effect["from_choice"]
+            chosen = self.character_data.get("choices_made", {}).get(choice_key)
+            if isinstance(chosen, list):
+                languages = chosen
+            elif isinstance(chosen, str) and chosen:
+                languages = [chosen]
+            else:
+                languages = []
+        else:
+            languages = effect.get("languages", [])
+        for lang in self._add_proficiencies("languages", languages):
+            if source_type == "species":
+                source_display = "species"
+            elif source_type == "lineage":
+                source_display = "lineage"
+            else:
+                source_display = source_name
+            self.character_data["proficiency_sources"]["languages"][lang] = source_display
 
-        elif effect_type == "grant_armor_proficiency":
-            proficiencies = effect.get("proficiencies", [])
-            for prof in proficiencies:
-                if prof not in self.character_data["proficiencies"]["armor"]:
-                    self.character_data["proficiencies"]["armor"].append(prof)
-                    # Track the source of this armor proficiency
-                    if source_type == "species_choice":
-                        source_display = self.character_data.get("species", source_name)
-                    elif source_type in ["species", "lineage"]:
-                        source_display = self.character_data.get("species", source_name)
-                    else:
-                        source_display = source_name
-                    self.character_data["proficiency_sources"]["armor"][prof] = (
-                        source_display
-                    )
+    def _effect_grant_origin_feat(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_origin_feat`` effect."""
+        feat_name = effect.get("feat")
+        if feat_name:
+            feat_data = self._load_feat_data(feat_name)
+            if feat_data:
+                description = feat_data.get("description", "")
+                benefits = feat_data.get("benefits", [])
+                if benefits:
+                    description += self._format_benefits(benefits)
+            else:
+                description = f"Origin feat: {feat_name}"
 
-        elif effect_type == "grant_tool_proficiency":
-            tools = effect.get("tools", [])
-            for tool in tools:
-                if tool not in self.character_data["proficiencies"]["tools"]:
-                    self.character_data["proficiencies"]["tools"].append(tool)
-                    # Track the source of this tool proficiency
-                    if source_type == "species_choice":
-                        source_display = self.character_data.get("species", source_name)
-                    elif source_type in ["species", "lineage"]:
-                        source_display = self.character_data.get("species", source_name)
-                    else:
-                        source_display = source_name
-                    self.character_data["proficiency_sources"]["tools"][tool] = (
-                        source_display
-                    )
+            feat_entry = {
+                "name": feat_name,
+                "description": description,
+                "source": source_name,
+            }
+            if not any(
+                f["name"] == feat_name
+                for f in self.character_data["features"]["feats"]
+            ):
+                self.character_data["features"]["feats"].append(feat_entry)
 
-        elif effect_type == "grant_skill_proficiency":
-            skills = effect.get("skills", [])
-            for skill in skills:
-                if not isinstance(skill, str) or is_unresolved_placeholder(skill):
-                    continue
-                if skill not in self.character_data["proficiencies"]["skills"]:
-                    self.character_data["proficiencies"]["skills"].append(skill)
-                    # Track the source of this skill proficiency
-                    if source_type == "species_choice":
-                        # For species choices, use just the species name
-                        source_display = self.character_data.get("species", source_name)
-                    elif source_type in ["species", "lineage"]:
-                        source_display = self.character_data.get("species", source_name)
-                    else:
-                        source_display = source_name
-                    self.character_data["proficiency_sources"]["skills"][skill] = (
-                        source_display
-                    )
-                elif source_type in (
-                    "species", "species_choice", "lineage", "lineage_choice"
-                ):
-                    # Skill overlap — species/lineage tried to grant a skill
-                    # the character already has. Track for replacement choice.
-                    needed = self.character_data["choices_made"].get(
-                        "species_skill_replacements_needed", 0
-                    )
-                    self.character_data["choices_made"][
-                        "species_skill_replacements_needed"
-                    ] = needed + 1
-                elif source_type == "background":
-                    # Phase 9 (D1-1): background skill overlap. D&D 2024:
-                    # overlapping background skill proficiencies are replaced
-                    # by player's choice. Track count for the wizard prompt.
-                    needed = self.character_data["choices_made"].get(
-                        "background_skill_replacements_needed", 0
-                    )
-                    self.character_data["choices_made"][
-                        "background_skill_replacements_needed"
-                    ] = needed + 1
-
-        elif effect_type == "grant_skill_expertise":
-            # Resolve skills from a choice key if specified, otherwise use direct list
-            if "from_choice" in effect:
-                choice_key = effect["from_choice"]
-                chosen = self.character_data.get("choices_made", {}).get(choice_key)
-                if isinstance(chosen, list):
-                    skills = chosen
-                elif isinstance(chosen, str) and chosen:
-                    skills = [chosen]
-                else:
-                    skills = []
-            else:
-                skills = effect.get("skills", [])
-            if "skill_expertise" not in self.character_data:
-                self.character_data["skill_expertise"] = []
-            for skill in skills:
-                # Skip unresolved choice placeholders (e.g. Ranger still uses
-                # "__deft_explorer_expertise__" / "__expertise_skills__" until
-                # those classes are migrated to the from_choice pattern).
-                if skill.startswith("__"):
-                    continue
-                if skill not in self.character_data["skill_expertise"]:
-                    self.character_data["skill_expertise"].append(skill)
+            # Apply any direct effects from the feat (e.g., Tough's bonus_hp)
+            if feat_data:
+                # The parsed feat file is shared; applied_effects keeps its own copy.
+                for feat_effect in _clone_json_data(feat_data.get("effects", [])):
+                    self._apply_effect(feat_effect, feat_name, "feat")
 
-        elif effect_type == "grant_skill_proficiency_or_expertise":
-            # D&D 2024 pattern: "If you lack proficiency, gain proficiency;
-            # if you already have proficiency, gain Expertise."
-            skills = effect.get("skills", [])
-            if "skill_expertise" not in self.character_data:
-                self.character_data["skill_expertise"] = []
-            for skill in skills:
-                if skill in self.character_data["proficiencies"]["skills"]:
-                    # Already proficient → grant expertise
-                    if skill not in self.character_data["skill_expertise"]:
-                        self.character_data["skill_expertise"].append(skill)
+            # If granted via a species/lineage choice and the feat has
+            # follow-up choices (e.g., Skilled needs 3 skill/tool picks),
+            # record the feat name so the species route can present them.
+            # Feats with no choices (e.g., Alert, Tough) need no follow-up.
+            if source_type in ("species_choice", "lineage_choice") and feat_data:
+                if feat_data.get("choices") or feat_data.get("choice_options"):
+                    self.character_data["pending_species_feat"] = feat_name
                 else:
-                    # Not proficient → grant proficiency
-                    self.character_data["proficiencies"]["skills"].append(skill)
-                    self.character_data["proficiency_sources"]["skills"][skill] = (
-                        source_name
-                    )
+                    self.character_data.pop("pending_species_feat", None)
 
-        elif effect_type == "grant_save_advantage":
-            abilities = effect.get("abilities", [])
-            display = effect.get("display", "")
-            condition = effect.get("condition", "")
-            # Avoid duplicate entries
-            if abilities and not any(
-                e.get("abilities") == abilities and e.get("condition") == condition
-                for e in self.character_data["save_advantages"]
-            ):
-                self.character_data["save_advantages"].append({
-                    "abilities": abilities,
-                    "display": display,
-                    "condition": condition,
-                })
+    # ------------------------------------------------------------------
+    # Phase 7 (D0-1 / D0-2 / D4-3) handlers — invocations, maneuvers,
+    # weapon masteries, and the spell-modifier effects they need.
+    # ------------------------------------------------------------------
 
-        elif effect_type == "grant_damage_resistance":
-            # Accept both singular and plural damage type forms:
-            #   {"type": "grant_damage_resistance", "damage_type": "Poison"}
-            #   {"type": "grant_damage_resistance", "damage_types": ["Poison", "Cold"]}
-            # The plural form is the preferred shape; singular is kept for
-            # back-compat with existing data files.
-            damage_types = effect.get("damage_types") or (
-                [effect["damage_type"]] if "damage_type" in effect else []
-            )
-            # Support dynamic damage type resolved from a species/trait choice
-            if not damage_types and "damage_type_from_choice" in effect:
-                choice_value = self._resolve_choice_value(effect["damage_type_from_choice"])
-                if choice_value:
-                    damage_types = [self._extract_parenthetical(choice_value)]
-            for damage_type in damage_types:
-                if damage_type and damage_type not in self.character_data["resistances"]:
-                    self.character_data["resistances"].append(damage_type)
-
-        elif effect_type == "grant_condition_immunity":
-            condition = effect.get("condition")
-            if condition and condition not in self.character_data["condition_immunities"]:
-                self.character_data["condition_immunities"].append(condition)
-
-        elif effect_type == "grant_darkvision":
-            darkvision_range = effect.get("range", 60)
-            if darkvision_range > self.character_data["darkvision"]:
-                self.character_data["darkvision"] = darkvision_range
-
-        elif effect_type == "increase_speed":
-            speed_increase = effect.get("value", 0)
-            feature_group = effect.get("feature_group")
-            if feature_group:
-                previous = self.character_data["speed_bonuses"].get(feature_group, 0)
-                self.character_data["speed"] = self.character_data["speed"] - previous + speed_increase
-                self.character_data["speed_bonuses"][feature_group] = speed_increase
+    def _effect_grant_spell_at_will(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_spell_at_will`` effect."""
+        # Sheet-affecting: spell becomes part of the character's
+        # always-available list (typical Warlock invocation pattern,
+        # e.g. Armor of Shadows -> Mage Armor). Recorded in the same
+        # `always_prepared` dict that `grant_spell` writes to, with an
+        # `at_will: True` flag so renderers can annotate "(at will)".
+        spell_name = effect.get("spell")
+        if isinstance(spell_name, str) and spell_name:
+            spell_def = self._load_spell_definition(spell_name) or {}
+            spell_level = spell_def.get("level", 0)
+            if source_type in _CLASS_DISPLAY_SOURCE_TYPES:
+                display_source = self.character_data.get(source_type, source_name)
             else:
-                self.character_data["speed"] += speed_increase
-
-        elif effect_type == "ability_bonus":
-            # Store ability bonuses for later calculation (like Thaumaturge)
-            if "ability_bonuses" not in self.character_data:
-                self.character_data["ability_bonuses"] = []
-
-            bonus_info = {
-                "ability": effect.get("ability"),
-                "skills": effect.get("skills", []),
-                "value": effect.get("value"),
-                "minimum": effect.get("minimum", 0),
-                "source": source_name,
+                display_source = source_name
+
+            # Idempotent: write/refresh the same record on re-apply.
+            self.character_data["spells"]["always_prepared"][spell_name] = {
+                "level": spell_level,
+                "source": display_source,
+                "always_prepared": True,
+                "at_will": True,
+                "once_per_day": False,
+                "counts_against_limit": False,
             }
-            self.character_data["ability_bonuses"].append(bonus_info)
-
-        elif effect_type == "grant_save_proficiency":
-            abilities = effect.get("abilities", [])
-            for ability in abilities:
-                if ability not in self.character_data["proficiencies"]["saving_throws"]:
-                    self.character_data["proficiencies"]["saving_throws"].append(ability)
-                    self.character_data["proficiency_sources"]["saving_throws"][ability] = source_name
-
-        elif effect_type == "alternative_ac":
-            # Monk/Barbarian Unarmored Defense and similar formulas.
-            # Stored on a structured field that ``calculate_ac_options``
-            # consumes directly. (Audit log still receives the entry via the
-            # tail of ``_apply_effect``.)
-            entry = {
-                "base": effect.get("base", 10),
-                "modifiers": list(effect.get("modifiers", [])),
-                "condition": effect.get("condition", ""),
-                "source": source_name,
+            self.character_data["spell_metadata"][spell_name] = {
+                "source": display_source,
                 "source_type": source_type,
+                "always_prepared": True,
+                "at_will": True,
+                "once_per_day": False,
+                "counts_against_limit": False,
             }
-            # Idempotent: do not double-store an identical entry from the
-            # same source.
-            existing = self.character_data["alternative_ac_options"]
-            if not any(
-                e["source"] == entry["source"]
-                and e["base"] == entry["base"]
-                and e["modifiers"] == entry["modifiers"]
-                and e.get("condition", "") == entry["condition"]
-                for e in existing
-            ):
-                existing.append(entry)
-
-        elif effect_type == "bonus_damage":
-            # Fighting styles (Dueling, Thrown Weapon Fighting), feats, etc.
-            entry = {
-                "value": effect.get("value", 0),
-                "condition": effect.get("condition", ""),
-                "weapon_property": effect.get("weapon_property"),
-                "damage_type": effect.get("damage_type"),
+
+    def _effect_bonus_spell_damage_ability_mod(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``bonus_spell_damage_ability_mod`` effect."""
+        # Agonizing Blast: add a chosen ability's modifier to the damage
+        # rolls of a specific spell. Written into spell_metadata[spell]["damage_bonus"]
+        # (P2-4 consolidation) so the renderer / `calculate_spellcasting_stats`
+        # can annotate the spell via a single metadata dict.
+        spell_name = effect.get("spell")
+        ability = effect.get("ability")
+        if isinstance(spell_name, str) and isinstance(ability, str):
+            self.character_data["spell_metadata"].setdefault(spell_name, {})["damage_bonus"] = {
+                "ability": ability,
                 "source": source_name,
                 "source_type": source_type,
-                "source_class_name": source_class_name,
             }
-            self.character_data["damage_bonuses"].append(entry)
 
-        elif effect_type == "bonus_attack":
-            entry = {
-                "value": effect.get("value", 0),
-                "weapon_property": effect.get("weapon_property"),
-                "condition": effect.get("condition", ""),
+    def _effect_bonus_spell_range(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``bonus_spell_range`` effect."""
+        # Eldritch Spear: overrides the displayed range of a specific
+        # spell. Written into spell_metadata[spell]["range_override"]
+        # (P2-4 consolidation). `to_character()` reads from there when
+        # emitting `spells_by_level` so the override is visible on the sheet.
+        spell_name = effect.get("spell")
+        new_range = effect.get("range")
+        if isinstance(spell_name, str) and new_range:
+            self.character_data["spell_metadata"].setdefault(spell_name, {})["range_override"] = {
+                "range": new_range,
                 "source": source_name,
                 "source_type": source_type,
-                "source_class_name": source_class_name,
             }
-            self.character_data["attack_bonuses"].append(entry)
 
-        elif effect_type == "bonus_ac":
-            entry = {
-                "value": effect.get("value", 0),
-                "condition": effect.get("condition", ""),
+    def _effect_grant_magical_darkness_sight(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_magical_darkness_sight`` effect."""
+        # Devil's Sight: see normally in magical darkness up to N feet.
+        # Kept distinct from `grant_darkvision` because the underlying
+        # rule is genuinely different (magical darkness specifically).
+        range_ft = int(effect.get("range", 120) or 0)
+        current = self.character_data.get("magical_darkness_sight") or {}
+        if range_ft > int(current.get("range", 0) or 0):
+            self.character_data["magical_darkness_sight"] = {
+                "range": range_ft,
                 "source": source_name,
                 "source_type": source_type,
-                "source_class_name": source_class_name,
             }
-            self.character_data["ac_bonuses"].append(entry)
 
-        elif effect_type == "bonus_hp":
-            entry = {
-                "value": effect.get("value", 0),
-                "scaling": effect.get("scaling"),
+    def _effect_grant_maneuver(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_maneuver`` effect."""
+        # Battle Master maneuver pick. Idempotent: do not duplicate names.
+        maneuver_name = effect.get("maneuver")
+        if isinstance(maneuver_name, str) and maneuver_name:
+            if maneuver_name not in self.character_data["maneuvers_known"]:
+                self.character_data["maneuvers_known"].append(maneuver_name)
+
+    def _effect_grant_superiority_dice(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_superiority_dice`` effect."""
+        # Battle Master Combat Superiority. Resolves per-level scaling
+        # (count_by_level / die_by_level) against the current class
+        # level; idempotent rewrite of the structured field.
+        level = self.character_data.get("level", 1)
+        count_by_level = effect.get("count_by_level") or {}
+        die_by_level = effect.get("die_by_level") or {}
+        count = int(effect.get("count", 0) or 0)
+        die = effect.get("die", "d8") or "d8"
+        for threshold, value in sorted(
+            count_by_level.items(), key=lambda kv: int(kv[0])
+        ):
+            if level >= int(threshold):
+                count = int(value)
+        for threshold, value in sorted(
+            die_by_level.items(), key=lambda kv: int(kv[0])
+        ):
+            if level >= int(threshold):
+                die = str(value)
+        if count > 0:
+            self.character_data["superiority_dice"] = {
+                "count": count,
+                "die": die,
                 "source": source_name,
-                "source_type": source_type,
-                "source_class_name": source_class_name,
             }
-            self.character_data["hp_bonuses"].append(entry)
-
-        elif effect_type == "bonus_initiative":
-            self.character_data["initiative_bonuses"].append(
-                self._build_initiative_bonus_entry(
-                    effect,
-                    source_name,
-                    source_type,
-                    source_class_name,
-                )
-            )
-
-        elif effect_type == "great_weapon_fighting":
-            flags = self.character_data["fighting_style_flags"]["great_weapon_fighting"]
-            if source_name not in flags:
-                flags.append(source_name)
-
-        elif effect_type == "two_weapon_fighting_modifier":
-            flags = self.character_data["fighting_style_flags"]["two_weapon_fighting_modifier"]
-            if source_name not in flags:
-                flags.append(source_name)
-
-        elif effect_type == "unarmed_fighting":
-            flags = self.character_data["fighting_style_flags"]["unarmed_fighting"]
-            if source_name not in flags:
-                flags.append(source_name)
-
-        elif effect_type == "set_martial_arts_die":
-            # Monk: resolve the correct Martial Arts die for the current level
-            die_by_level = effect.get("die_by_level", {})
-            level = self.character_data.get("level", 1)
-            resolved_die = "1d6"  # fallback
-            for level_threshold, die in sorted(
-                die_by_level.items(), key=lambda x: int(x[0])
-            ):
-                if level >= int(level_threshold):
-                    resolved_die = die
-            self.character_data["martial_arts_die"] = resolved_die
-
-        elif effect_type == "monk_dexterous_attacks":
-            # Monk: Dexterous Attacks allows using DEX instead of STR for
-            # attack and damage rolls of monk weapons (Simple Melee, or
-            # Martial Melee with Light property)
-            self.character_data["monk_dexterous_attacks"] = True
-
-        elif effect_type == "grant_language":
-            # Resolve languages from a choice key if specified, otherwise use direct list
-            if "from_choice" in effect:
-                choice_key = effect["from_choice"]
-                chosen = self.character_data.get("choices_made", {}).get(choice_key)
-                if isinstance(chosen, list):
-                    languages = chosen
-                elif isinstance(chosen, str) and chosen:
-                    languages = [chosen]
-                else:
-                    languages = []
-            else:
-                languages = effect.get("languages", [])
-            for lang in languages:
-                if lang not in self.character_data["proficiencies"]["languages"]:
-                    self.character_data["proficiencies"]["languages"].append(lang)
-                    if source_type == "species":
-                        source_display = "species"
-                    elif source_type == "lineage":
-                        source_display = "lineage"
-                    else:
-                        source_display = source_name
-                    self.character_data["proficiency_sources"]["languages"][lang] = source_display
-
-        elif effect_type == "grant_origin_feat":
-            feat_name = effect.get("feat")
-            if feat_name:
-                feat_data = self._load_feat_data(feat_name)
-                if feat_data:
-                    description = feat_data.get("description", "")
-                    benefits = feat_data.get("benefits", [])
-                    if benefits:
-                        description += self._format_benefits(benefits)
-                else:
-                    description = f"Origin feat: {feat_name}"
-
-                feat_entry = {
-                    "name": feat_name,
-                    "description": description,
-                    "source": source_name,
-                }
-                if not any(
-                    f["name"] == feat_name
-                    for f in self.character_data["features"]["feats"]
-                ):
-                    self.character_data["features"]["feats"].append(feat_entry)
-
-                # Apply any direct effects from the feat (e.g., Tough's bonus_hp)
-                if feat_data:
-                    for feat_effect in feat_data.get("effects", []):
-                        self._apply_effect(feat_effect, feat_name, "feat")
-
-                # If granted via a species/lineage choice and the feat has
-                # follow-up choices (e.g., Skilled needs 3 skill/tool picks),
-                # record the feat name so the species route can present them.
-                # Feats with no choices (e.g., Alert, Tough) need no follow-up.
-                if source_type in ("species_choice", "lineage_choice") and feat_data:
-                    if feat_data.get("choices") or feat_data.get("choice_options"):
-                        self.character_data["pending_species_feat"] = feat_name
-                    else:
-                        self.character_data.pop("pending_species_feat", None)
-
-        # ------------------------------------------------------------------
-        # Phase 7 (D0-1 / D0-2 / D4-3) handlers — invocations, maneuvers,
-        # weapon masteries, and the spell-modifier effects they need.
-        # ------------------------------------------------------------------
-
-        elif effect_type == "grant_spell_at_will":
-            # Sheet-affecting: spell becomes part of the character's
-            # always-available list (typical Warlock invocation pattern,
-            # e.g. Armor of Shadows -> Mage Armor). Recorded in the same
-            # `always_prepared` dict that `grant_spell` writes to, with an
-            # `at_will: True` flag so renderers can annotate "(at will)".
-            spell_name = effect.get("spell")
-            if isinstance(spell_name, str) and spell_name:
-                spell_def = self._load_spell_definition(spell_name) or {}
-                spell_level = spell_def.get("level", 0)
-                if source_type == "subclass":
-                    display_source = self.character_data.get("subclass", source_name)
-                elif source_type == "class":
-                    display_source = self.character_data.get("class", source_name)
-                else:
-                    display_source = source_name
-
-                # Idempotent: write/refresh the same record on re-apply.
-                self.character_data["spells"]["always_prepared"][spell_name] = {
-                    "level": spell_level,
-                    "source": display_source,
-                    "always_prepared": True,
-                    "at_will": True,
-                    "once_per_day": False,
-                    "counts_against_limit": False,
-                }
-                self.character_data["spell_metadata"][spell_name] = {
-                    "source": display_source,
-                    "source_type": source_type,
-                    "always_prepared": True,
-                    "at_will": True,
-                    "once_per_day": False,
-                    "counts_against_limit": False,
-                }
 
-        elif effect_type == "bonus_spell_damage_ability_mod":
-            # Agonizing Blast: add a chosen ability's modifier to the damage
-            # rolls of a specific spell. Written into spell_metadata[spell]["damage_bonus"]
-            # (P2-4 consolidation) so the renderer / `calculate_spellcasting_stats`
-            # can annotate the spell via a single metadata dict.
-            spell_name = effect.get("spell")
-            ability = effect.get("ability")
-            if isinstance(spell_name, str) and isinstance(ability, str):
-                self.character_data["spell_metadata"].setdefault(spell_name, {})["damage_bonus"] = {
-                    "ability": ability,
-                    "source": source_name,
-                    "source_type": source_type,
-                }
-
-        elif effect_type == "bonus_spell_range":
-            # Eldritch Spear: overrides the displayed range of a specific
-            # spell. Written into spell_metadata[spell]["range_override"]
-            # (P2-4 consolidation). `to_character()` reads from there when
-            # emitting `spells_by_level` so the override is visible on the sheet.
-            spell_name = effect.get("spell")
-            new_range = effect.get("range")
-            if isinstance(spell_name, str) and new_range:
-                self.character_data["spell_metadata"].setdefault(spell_name, {})["range_override"] = {
-                    "range": new_range,
-                    "source": source_name,
-                    "source_type": source_type,
-                }
-
-        elif effect_type == "grant_magical_darkness_sight":
-            # Devil's Sight: see normally in magical darkness up to N feet.
-            # Kept distinct from `grant_darkvision` because the underlying
-            # rule is genuinely different (magical darkness specifically).
-            range_ft = int(effect.get("range", 120) or 0)
-            current = self.character_data.get("magical_darkness_sight") or {}
-            if range_ft > int(current.get("range", 0) or 0):
-                self.character_data["magical_darkness_sight"] = {
-                    "range": range_ft,
-                    "source": source_name,
-                    "source_type": source_type,
-                }
-
-        elif effect_type == "grant_maneuver":
-            # Battle Master maneuver pick. Idempotent: do not duplicate names.
-            maneuver_name = effect.get("maneuver")
-            if isinstance(maneuver_name, str) and maneuver_name:
-                if maneuver_name not in self.character_data["maneuvers_known"]:
-                    self.character_data["maneuvers_known"].append(maneuver_name)
-
-        elif effect_type == "grant_superiority_dice":
-            # Battle Master Combat Superiority. Resolves per-level scaling
-            # (count_by_level / die_by_level) against the current class
-            # level; idempotent rewrite of the structured field.
-            level = self.character_data.get("level", 1)
-            count_by_level = effect.get("count_by_level") or {}
-            die_by_level = effect.get("die_by_level") or {}
-            count = int(effect.get("count", 0) or 0)
-            die = effect.get("die", "d8") or "d8"
-            for threshold, value in sorted(
-                count_by_level.items(), key=lambda kv: int(kv[0])
-            ):
-                if level >= int(threshold):
-                    count = int(value)
-            for threshold, value in sorted(
-                die_by_level.items(), key=lambda kv: int(kv[0])
-            ):
-                if level >= int(threshold):
-                    die = str(value)
-            if count > 0:
-                self.character_data["superiority_dice"] = {
-                    "count": count,
-                    "die": die,
-                    "source": source_name,
-                }
-
-        elif effect_type == "grant_spell_slots":
-            # Grant additional spell slots.  Supports two shapes:
-            #   {"type": "grant_spell_slots", "slots": {"1": 2, "3": 1}}
-            #   {"type": "grant_spell_slots", "slot_level": 1, "count": 2}
-            # Slots are additive — multiple effects of this type stack.
-            slots_map = effect.get("slots") or {}
-            if not slots_map and "slot_level" in effect:
-                slots_map = {str(effect["slot_level"]): effect.get("count", 1)}
-            for lvl, cnt in slots_map.items():
-                key = str(lvl)
-                self.character_data["spells"]["slots"][key] = (
-                    self.character_data["spells"]["slots"].get(key, 0) + int(cnt)
-                )
-
-        elif effect_type == "grant_weapon_mastery":
-            # Grant a specific weapon mastery.
-            # effect shape: {"type": "grant_weapon_mastery", "weapon": "Longsword"}
-            weapon = effect.get("weapon", "")
-            if weapon:
-                selected = self.character_data["weapon_masteries"].setdefault("selected", [])
-                if weapon not in selected:
-                    selected.append(weapon)
+    def _effect_grant_spell_slots(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_spell_slots`` effect."""
+        # Grant additional spell slots.  Supports two shapes:
+        #   {"type": "grant_spell_slots", "slots": {"1": 2, "3": 1}}
+        #   {"type": "grant_spell_slots", "slot_level": 1, "count": 2}
+        # Slots are additive — multiple effects of this type stack.
+        slots_map = effect.get("slots") or {}
+        if not slots_map and "slot_level" in effect:
+            slots_map = {str(effect["slot_level"]): effect.get("count", 1)}
+        for lvl, cnt in slots_map.items():
+            key = str(lvl)
+            self.character_data["spells"]["slots"][key] = (
+                self.character_data["spells"]["slots"].get(key, 0) + int(cnt)
+            )
 
-        # Track applied effect — AUDIT LOG ONLY. See class-level docstring on
-        # ``applied_effects`` for the contract.
-        tracked: Dict[str, Any] = {
-            "type": effect_type,
-            "source": source_name,
-            "source_type": source_type,
-            "effect": effect,
-        }
-        if source_class_name:
-            tracked["source_class_name"] = source_class_name
-        self.applied_effects.append(tracked)
+    def _effect_grant_weapon_mastery(
+        self,
+        effect: Dict[str, Any],
+        source_name: str,
+        source_type: str,
+        source_class_name: Optional[str],
+    ) -> None:
+        """Apply a ``grant_weapon_mastery`` effect."""
+        # Grant a specific weapon mastery.
+        # effect shape: {"type": "grant_weapon_mastery", "weapon": "Longsword"}
+        weapon = effect.get("weapon", "")
+        if weapon:
+            selected = self.character_data["weapon_masteries"].setdefault("selected", [])
+            if weapon not in selected:
+                selected.append(weapon)
+
+    # effect ``type`` -> handler, looked up once per ``_apply_effect`` call.
+    # Keys match ``strict_mode.KNOWN_EFFECT_TYPES`` exactly; other types are
+    # validated and then only reach the audit log.
+    _EFFECT_HANDLERS: Mapping[str, Callable[..., None]] = MappingProxyType({
+        "grant_cantrip": _effect_grant_cantrip,
+        "grant_cantrip_choice": _effect_grant_cantrip_choice,
+        "grant_spell": _effect_grant_spell,
+        "grant_weapon_proficiency": _effect_grant_weapon_proficiency,
+        "grant_armor_proficiency": _effect_grant_armor_proficiency,
+        "grant_tool_proficiency": _effect_grant_tool_proficiency,
+        "grant_skill_proficiency": _effect_grant_skill_proficiency,
+        "grant_skill_expertise": _effect_grant_skill_expertise,
+        "grant_skill_proficiency_or_expertise": _effect_grant_skill_proficiency_or_expertise,
+        "grant_save_advantage": _effect_grant_save_advantage,
+        "grant_damage_resistance": _effect_grant_damage_resistance,
+        "grant_condition_immunity": _effect_grant_condition_immunity,
+        "grant_darkvision": _effect_grant_darkvision,
+        "increase_speed": _effect_increase_speed,
+        "ability_bonus": _effect_ability_bonus,
+        "grant_save_proficiency": _effect_grant_save_proficiency,
+        "alternative_ac": _effect_alternative_ac,
+        "bonus_damage": _effect_bonus_damage,
+        "bonus_attack": _effect_bonus_attack,
+        "bonus_ac": _effect_bonus_ac,
+        "bonus_hp": _effect_bonus_hp,
+        "bonus_initiative": _effect_bonus_initiative,
+        "great_weapon_fighting": _effect_great_weapon_fighting,
+        "two_weapon_fighting_modifier": _effect_two_weapon_fighting_modifier,
+        "unarmed_fighting": _effect_unarmed_fighting,
+        "set_martial_arts_die": _effect_set_martial_arts_die,
+        "monk_dexterous_attacks": _effect_monk_dexterous_attacks,
+        "grant_language": _effect_grant_language,
+        "grant_origin_feat": _effect_grant_origin_feat,
+        "grant_spell_at_will": _effect_grant_spell_at_will,
+        "bonus_spell_damage_ability_mod": _effect_bonus_spell_damage_ability_mod,
+        "bonus_spell_range": _effect_bonus_spell_range,
+        "grant_magical_darkness_sight": _effect_grant_magical_darkness_sight,
+        "grant_maneuver": _effect_grant_maneuver,
+        "grant_superiority_dice": _effect_grant_superiority_dice,
+        "grant_spell_slots": _effect_grant_spell_slots,
+        "grant_weapon_mastery": _effect_grant_weapon_mastery,
+    })
 
     # ------------------------------------------------------------------
     # Phase 6: applied_effects pruning + structured-bonus invariance
@@ -2152,11 +2754,13 @@ class CharacterBuilder:
         which it returns ``True`` are removed. After pruning, structured bonus
         fields are rebuilt from the surviving audit-log entries. This is the
         single chokepoint through which ``applied_effects`` is mutated outside
-        of ``_apply_effect``.
+        of ``_apply_effect``. When nothing matches, the structured fields
+        already reflect the audit log and are left alone.
         """
-        self.applied_effects = [
-            e for e in self.applied_effects if not predicate(e)
-        ]
+        kept = [e for e in self.applied_effects if not predicate(e)]
+        if len(kept) == len(self.applied_effects):
+            return
+        self.applied_effects = kept
         self._rebuild_structured_bonuses()
 
     # ==================== Class/Subclass Methods ====================
@@ -2172,7 +2776,7 @@ class CharacterBuilder:
         Returns:
             True if successful, False otherwise
         """
-        class_data = self._load_class_data(class_name)
+        class_data = _clone_json_data(self._load_class_data(class_name))
         if not class_data:
             return False
 
@@ -2273,7 +2877,7 @@ class CharacterBuilder:
         # Clear applied effects from class source
         if hasattr(self, "applied_effects"):
             self._filter_applied_effects(
-                lambda e: e.get("source_type") in ["class", "class_choice"]
+                lambda e: e.get("source_type") in _CLASS_EFFECT_SOURCE_TYPES
             )
 
     def _clear_subclass_features(self):
@@ -2292,20 +2896,22 @@ class CharacterBuilder:
         prepared = self.character_data["spells"]["prepared"]
 
         for collection in (prepared.get("cantrips", {}), prepared.get("spells", {})):
-            for spell_name in list(collection):
-                if (
-                    spell_name in spell_metadata
-                    and spell_metadata[spell_name].get("source_type") == "subclass"
-                ):
-                    del collection[spell_name]
-                    del spell_metadata[spell_name]
+            # Collect the subclass spells first; only those need deleting.
+            subclass_spells = [
+                spell_name
+                for spell_name in collection
+                if spell_name in spell_metadata
+                and spell_metadata[spell_name].get("source_type") == "subclass"
+            ]
+            for spell_name in subclass_spells:
+                del collection[spell_name]
+                del spell_metadata[spell_name]
 
         # Clear subclass spells from always_prepared
         subclass_name = self.character_data.get("subclass", "")
         always_prepared = self.character_data["spells"]["always_prepared"]
-        for spell_name in list(always_prepared):
+        for spell_name, ap_info in list(always_prepared.items()):
             meta = spell_metadata.get(spell_name, {})
-            ap_info = always_prepared[spell_name]
             source_type = meta.get("source_type", "")
             # Also check the always_prepared entry itself for source info
             if isinstance(ap_info, dict):
@@ -2339,8 +2945,8 @@ class CharacterBuilder:
         if not self.character_data["class"]:
             return False
 
-        subclass_data = self._load_subclass_data(
-            self.character_data["class"], subclass_name
+        subclass_data = _clone_json_data(
+            self._load_subclass_data(self.character_data["class"], subclass_name)
         )
         if not subclass_data:
             return False
@@ -2361,30 +2967,55 @@ class CharacterBuilder:
         self.character_data["step"] = "background"
         return True
 
+    def _proficiency_source_display(self, source_name: str, source_type: str) -> str:
+        """Return the source label recorded for a granted proficiency.
+
+        Species and lineage grants credit just the species name; every other
+        source is credited by its own name.
+        """
+        if source_type in _SPECIES_PROFICIENCY_SOURCE_TYPES:
+            return self.character_data.get("species", source_name)
+        return source_name
+
+    def _add_proficiencies(self, category: str, items: List[str]) -> List[str]:
+        """Append *items* missing from ``proficiencies[category]``.
+
+        The list keeps its order for export; membership is tested against a
+        set built once per call.  Returns the items that were added, in
+        order, so callers can record their sources.
+        """
+        current = self.character_data["proficiencies"][category]
+        known = set(current)
+        added = []
+        for item in items:
+            if item not in known:
+                known.add(item)
+                current.append(item)
+                added.append(item)
+        return added
+
     def _apply_class_features(self, class_data: Dict[str, Any], level: int):
         """Apply class features up to the specified level."""
         # Saving throw proficiencies
-        saving_throws = class_data.get("saving_throw_proficiencies", [])
-        self.character_data["proficiencies"]["saving_throws"].extend(saving_throws)
+        self._add_proficiencies(
+            "saving_throws", class_data.get("saving_throw_proficiencies", [])
+        )
 
         # Armor proficiencies
-        armor_profs = class_data.get("armor_proficiencies", [])
-        for prof in armor_profs:
-            if prof not in self.character_data["proficiencies"]["armor"]:
-                self.character_data["proficiencies"]["armor"].append(prof)
+        self._add_proficiencies("armor", class_data.get("armor_proficiencies", []))
 
         # Weapon proficiencies
-        weapon_profs = class_data.get("weapon_proficiencies", [])
-        for prof in weapon_profs:
-            if prof not in self.character_data["proficiencies"]["weapons"]:
-                self.character_data["proficiencies"]["weapons"].append(prof)
+        self._add_proficiencies("weapons", class_data.get("weapon_proficiencies", []))
 
         # Features by level
         features_by_level = class_data.get("features_by_level", {})
 
         # Shape validated at load time by modules.data_loader.
-        for feat_level in range(1, level + 1):
-            level_features = features_by_level.get(str(feat_level), {})
+        # Clamp so a non-positive level applies nothing rather than slicing
+        # from the end of the tuple.
+        last_level = max(0, min(level, 20))
+        for feat_level, level_key in enumerate(_LEVEL_KEYS[1 : last_level + 1], 1):
+            level_features = features_by_level.get(level_key, {})
             for feature_name, feature_data in level_features.items():
                 self._apply_trait_effects(
                     feature_name, feature_data, "class", feat_level
@@ -2538,7 +3169,9 @@ class CharacterBuilder:
         Returns:
             True if successful, False otherwise
         """
-        background_data = self._load_background_data(background_name)
+        background_data = _clone_json_data(
+            self._load_background_data(background_name)
+        )
         if not background_data:
             return False
 
@@ -2569,50 +3202,44 @@ class CharacterBuilder:
         # that pre-date the Phase 9 migration. New content MUST use
         # ``effects: [{type: grant_tool_proficiency, tools: [...]}]``.
         legacy_tool_profs = background_data.get("tool_proficiencies", [])
-        for tool in legacy_tool_profs:
-            if tool not in self.character_data["proficiencies"]["tools"]:
-                self.character_data["proficiencies"]["tools"].append(tool)
-                # Track source so it can be cleared on background change
-                self.character_data["proficiency_sources"]["tools"][tool] = background_name
+        for tool in self._add_proficiencies("tools", legacy_tool_profs):
+            # Track source so it can be cleared on background change
+            self.character_data["proficiency_sources"]["tools"][tool] = background_name
 
         # Languages - can be either a list or a number
         languages = background_data.get("languages", [])
         if isinstance(languages, list):
-            for lang in languages:
-                if lang not in self.character_data["proficiencies"]["languages"]:
-                    self.character_data["proficiencies"]["languages"].append(lang)
-                    # Track source so it can be cleared on background change
-                    self.character_data["proficiency_sources"]["languages"][lang] = background_name
+            for lang in self._add_proficiencies("languages", languages):
+                # Track source so it can be cleared on background change
+                self.character_data["proficiency_sources"]["languages"][lang] = background_name
         elif isinstance(languages, int):
             # Language selection is now a universal rule, not background-specific
             self.character_data["choices_made"].pop("language_choices_needed", None)
 
         # Background features
-        features = background_data.get("features", {})
-
-        # Ensure features is a dict
-        if not isinstance(features, dict):
-            print(
-                f"Warning: background features is not a dict for {background_name}: {type(features)}"
-            )
-            features = {}
+        features = self._expect_dict(
+            background_data.get("features", {}),
+            f"background features for {background_name}",
+        )
 
+        background_features = self.character_data["features"]["background"]
+        known_features = {f["name"] for f in background_features}
         for feature_name, feature_data in features.items():
+            if feature_name in known_features:
+                continue
             description = (
                 feature_data
                 if isinstance(feature_data, str)
                 else feature_data.get("description", "")
             )
-            feature_entry = {
-                "name": feature_name,
-                "description": description,
-                "source": background_name,
-            }
-            if not any(
-                f["name"] == feature_name
-                for f in self.character_data["features"]["background"]
-            ):
-                self.character_data["features"]["background"].append(feature_entry)
+            known_features.add(feature_name)
+            background_features.append(
+                {
+                    "name": feature_name,
+                    "description": description,
+                    "source": background_name,
+                }
+            )
 
         # Phase 9 (D1-1): apply background-level effects (canonical surface for
         # skill proficiencies, origin feat, tool proficiencies, etc.). Each
@@ -2650,14 +3277,13 @@ class CharacterBuilder:
 
         # Check if equipment has already been processed to avoid duplicates
         equipment = self.character_data["equipment"]
-        has_class_equipment = any(
-            item.get("source") == "Class"
-            for item in equipment["weapons"] + equipment["armor"] + equipment["items"]
-        )
-        has_background_equipment = any(
-            item.get("source") == "Background"
-            for item in equipment["weapons"] + equipment["armor"] + equipment["items"]
-        )
+        equipment_sources = {
+            item.get("source")
+            for category in ("weapons", "armor", "items")
+            for item in equipment[category]
+        }
+        has_class_equipment = "Class" in equipment_sources
+        has_background_equipment = "Background" in equipment_sources
 
         # Process class equipment selection
         class_choice = equipment_selections.get("class_equipment")
@@ -2726,18 +3352,7 @@ class CharacterBuilder:
                         "properties": weapon_props
                     }
                 )
-            elif any(
-                armor_type in item_name_lower
-                for armor_type in [
-                    "armor",
-                    "mail",
-                    "leather",
-                    "chain",
-                    "scale",
-                    "plate",
-                    "shield",
-                ]
-            ):
+            elif _ARMOR_KEYWORDS_RE.search(item_name_lower):
                 self.character_data["equipment"]["armor"].append(
                     {"name": item, "source": source}
                 )
@@ -2749,34 +3364,52 @@ class CharacterBuilder:
     def _load_weapon_data(self) -> Dict[str, Any]:
         """Load weapon data from weapons.json."""
         weapons_file = self.data_dir / "equipment" / "weapons.json"
-        try:
-            with open(weapons_file, "r") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+        weapons = self._load_json_file(weapons_file)
+        if weapons is None:
             print(f"Warning: Could not load weapons data from {weapons_file}")
             return {}
+        return weapons
 
     def _load_armor_data(self) -> Dict[str, Any]:
         """Load armor data from armor.json."""
         armor_file = self.data_dir / "equipment" / "armor.json"
-        try:
-            with open(armor_file, "r") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+        armor = self._load_json_file(armor_file)
+        if armor is None:
             print(f"Warning: Could not load armor data from {armor_file}")
             return {}
+        return armor
+
+    @cached_property
+    def _armor_stats(self) -> Dict[str, Tuple[int, Optional[int]]]:
+        """Map each armor name to ``(ac_base, dex_cap)`` for AC calculation.
+
+        ``dex_cap`` is ``None`` for Light armor (full Dex modifier), 2 for
+        Medium armor and 0 for everything else, which adds no Dex modifier.
+        """
+        stats = {}
+        for armor_name, armor_data in self._armor_data.items():
+            category = armor_data.get("category", "")
+            if "Light" in category:
+                dex_cap = None
+            elif "Medium" in category:
+                dex_cap = 2
+            else:
+                dex_cap = 0
+            stats[armor_name] = (armor_data.get("ac_base", 10), dex_cap)
+        return stats
 
     def _spell_list_contains(self, spell_list: list, spell_name: str) -> bool:
         """
         Check if a spell list contains a spell by name.
         Handles both string and dict spell formats.
         """
-        for spell in spell_list:
-            if isinstance(spell, dict) and spell.get("name") == spell_name:
-                return True
-            elif isinstance(spell, str) and spell == spell_name:
-                return True
-        return False
+        # String entries are matched by the list's own membership scan
+        if spell_name in spell_list:
+            return True
+        return any(
+            isinstance(spell, dict) and spell.get("name") == spell_name
+            for spell in spell_list
+        )
 
     def _load_spell_definition(self, spell_name: str) -> Dict[str, Any]:
         """Load spell definition from spell definitions directory."""
@@ -2786,38 +3419,47 @@ class CharacterBuilder:
 
         # Convert spell name to filename format (lowercase with underscores)
         filename = spell_name.lower().replace(" ", "_").replace("'", "").replace("/", "_")
-        spell_file = self.data_dir / "spells" / "definitions" / f"{filename}.json"
+        spell_file = _json_file_index(str(self._spell_definitions_dir)).get(filename)
+        if spell_file is None:
+            # Not in the directory index; the lookup below reports it missing
+            spell_file = self._spell_definitions_dir / f"{filename}.json"
 
         try:
-            with open(spell_file, "r") as f:
-                spell_data = json.load(f)
-                # Convert components list to string for template display
-                if "components" in spell_data and isinstance(
-                    spell_data["components"], list
-                ):
-                    spell_data["components"] = ", ".join(spell_data["components"])
-                # Derive concentration flag from duration string
-                spell_data["concentration"] = str(
-                    spell_data.get("duration", "")
-                ).startswith("Concentration")
-                # Cache it
-                self._spell_definitions_cache[spell_name] = spell_data
-                return spell_data
+            # The parsed file is shared by every builder; this builder's cache
+            # holds its own copy because to_character() annotates entries.
+            spell_data = dict(
+                _load_json_cached(str(spell_file), spell_file.stat().st_mtime_ns)
+            )
         except (FileNotFoundError, json.JSONDecodeError) as e:
             # Return minimal spell object if file not found
+            # and cache it too, so a missing spell is only looked up (and
+            # warned about) once per builder
             print(
                 f"Warning: Could not load spell definition for '{spell_name}' from {spell_file}: {e}"
             )
-            return {
+            spell_data = {
                 "name": spell_name,
                 "level": 0,
                 "description": "Spell definition not available.",
                 "source": "Unknown",
                 "concentration": False,
             }
+            self._spell_definitions_cache[spell_name] = spell_data
+            return spell_data
+
+        # Convert components list to string for template display
+        if "components" in spell_data and isinstance(spell_data["components"], list):
+            spell_data["components"] = ", ".join(spell_data["components"])
+        # Derive concentration flag from duration string
+        spell_data["concentration"] = str(
+            spell_data.get("duration", "")
+        ).startswith("Concentration")
+        # Cache it
+        self._spell_definitions_cache[spell_name] = spell_data
+        return spell_data
 
     def _get_weapon_properties(self, weapon_name: str) -> Dict[str, Any]:
-        """Get weapon properties from loaded weapon data."""
+        """Get a copy of a weapon's properties from loaded weapon data."""
         weapon_key = self._resolve_weapon_key(weapon_name)
         if weapon_key:
             return self._weapon_data[weapon_key].copy()
@@ -2972,19 +3614,25 @@ class CharacterBuilder:
             return ac_options
 
         # Available armor pieces
-        armor_items = equipment.get("armor", [])
-        has_shield = any(item.get("name") == "Shield" for item in armor_items)
+        # Split shields from the wearable (non-shield) armor pieces
+        has_shield = False
+        armor_pieces = []
+        for item in equipment.get("armor", []):
+            if item.get("name") == "Shield":
+                has_shield = True
+            else:
+                armor_pieces.append(item)
 
-        # Get all armor (non-shield) pieces
-        armor_pieces = [item for item in armor_items if item.get("name") != "Shield"]
+        armor_proficiencies = frozenset(proficiencies)
+        shield_proficient = "Shields" in armor_proficiencies
 
         # Calculate AC for each armor combination
+        armor_stats = self._armor_stats
         for armor in armor_pieces:
             armor_name = armor.get("name")
-            if armor_name and armor_name in self._armor_data:
-                armor_data = self._armor_data[armor_name]
+            if armor_name and armor_name in armor_stats:
                 ac_option = self._calculate_armor_ac(
-                    armor_data, dex_mod, has_shield, proficiencies, armor_name
+                    armor_stats[armor_name], dex_mod, has_shield, shield_proficient, armor_name
                 )
                 ac_option["equipped_armor"] = armor_name
 
@@ -3000,7 +3648,7 @@ class CharacterBuilder:
 
         # Add unarmored AC option
         unarmored_ac = 10 + dex_mod
-        shield_bonus = 2 if has_shield and "Shields" in proficiencies else 0
+        shield_bonus = 2 if has_shield and shield_proficient else 0
         total_unarmored = unarmored_ac + shield_bonus
 
         formula_parts = [f"10 + Dex modifier ({dex_mod})"]
@@ -3035,7 +3683,7 @@ class CharacterBuilder:
 
             # Determine if shield is allowed
             allow_shield = "no_shield" not in condition
-            alt_shield_bonus = 2 if has_shield and allow_shield and "Shields" in proficiencies else 0
+            alt_shield_bonus = 2 if has_shield and allow_shield and shield_proficient else 0
             alt_total = alt_ac + alt_shield_bonus
 
             alt_formula_parts = [" + ".join(formula_desc)]
@@ -3060,10 +3708,10 @@ class CharacterBuilder:
             if option["equipped_armor"]:
                 armor_data = self._armor_data.get(option["equipped_armor"], {})
                 required_prof = armor_data.get("proficiency_required")
-                if required_prof and required_prof not in proficiencies:
+                if required_prof and required_prof not in armor_proficiencies:
                     option["notes"].append(f"Not proficient with {required_prof}")
 
-            if has_shield and "Shields" not in proficiencies:
+            if has_shield and not shield_proficient:
                 option["notes"].append("Not proficient with Shields")
 
         # Sort by AC (highest first)
@@ -3073,23 +3721,22 @@ class CharacterBuilder:
 
     def _calculate_armor_ac(
         self,
-        armor_data: Dict[str, Any],
+        armor_stats: Tuple[int, Optional[int]],
         dex_mod: int,
         has_shield: bool,
-        proficiencies: List[str],
+        shield_proficient: bool,
         armor_name: str = None,
     ) -> Dict[str, Any]:
-        """Calculate AC for a specific armor."""
-        ac_base = armor_data.get("ac_base", 10)
-        category = armor_data.get("category", "")
+        """Calculate AC for a specific armor from its ``_armor_stats`` entry."""
+        ac_base, dex_cap = armor_stats
 
         # Calculate DEX modifier contribution based on armor type
-        if "Light" in category:
+        if dex_cap is None:
             # Light armor: full DEX modifier
             dex_bonus = dex_mod
-        elif "Medium" in category:
+        elif dex_cap:
             # Medium armor: DEX modifier max 2
-            dex_bonus = min(dex_mod, 2)
+            dex_bonus = min(dex_mod, dex_cap)
         else:
             # Heavy armor: no DEX modifier
             dex_bonus = 0
@@ -3099,7 +3746,7 @@ class CharacterBuilder:
 
         # Shield bonus
         shield_bonus = 0
-        if has_shield and "Shields" in proficiencies:
+        if has_shield and shield_proficient:
             shield_bonus = 2
             total_ac += shield_bonus
 
@@ -3107,7 +3754,7 @@ class CharacterBuilder:
         formula_parts = []
         if ac_base != 10:
             formula_parts.append(f"Armor base ({ac_base})")
-        if dex_bonus != 0 or "Light" in category or "Medium" in category:
+        if dex_bonus != 0 or dex_cap != 0:
             formula_parts.append(f"Dex modifier ({dex_bonus})")
         if shield_bonus > 0:
             formula_parts.append(f"Shield ({shield_bonus})")
@@ -3141,13 +3788,11 @@ class CharacterBuilder:
         Returns:
             True if successful, False otherwise
         """
-        self.ability_scores.set_base_scores(scores)
-
-        if species_bonuses:
-            self.ability_scores.apply_species_bonuses(species_bonuses)
-
-        if background_bonuses:
-            self.ability_scores.apply_background_bonuses(background_bonuses)
+        self.ability_scores.load_scores(
+            base=scores,
+            species_bonuses=species_bonuses or None,
+            background_bonuses=background_bonuses or None,
+        )
 
         # Store in character data
         self.character_data["abilities"] = {
@@ -3157,421 +3802,487 @@ class CharacterBuilder:
             "final": self.ability_scores.final_scores,
         }
 
-        self.character_data["step"] = "complete"
+        self.character_data["step"] = "complete"
+        return True
+
+    # ==================== Choice Application Methods ====================
+
+    def apply_choice(self, choice_key: str, choice_value: Any) -> bool:
+        """
+        Apply a single choice and its effects to the character.
+
+        Args:
+            choice_key: The choice identifier (e.g., 'species', 'class', 'Divine Order')
+            choice_value: The choice value (can be string, int, list, dict)
+
+        Returns:
+            True if choice was applied successfully
+        """
+        # Store the choice
+        self.character_data["choices_made"][choice_key] = choice_value
+
+        # Apply based on choice type
+        choice_key_lower = choice_key.lower()
+
+        handler = self._CHOICE_HANDLERS.get(choice_key_lower)
+        if handler is not None:
+            return handler(self, choice_key, choice_value)
+
+        # Nested bonus choices (e.g., Thaumaturge_bonus_cantrip)
+        if "_bonus_cantrip" in choice_key_lower:
+            return self._choice_bonus_cantrip(choice_key, choice_value)
+
+        # Feat sub-choices can come from either class feat slots
+        # (for example, class_feat_4_cantrips) or namespaced feat-choice pages
+        # (for example, feat_Magic Initiate (Wizard)_cantrips).
+        feat_choice_context = self._resolve_feat_choice_context(choice_key)
+        if feat_choice_context:
+            feat_name, sub_choice_name, feat_data, sub_choice_def, choice_namespace = feat_choice_context
+            if not self._feat_choice_dependencies_met(choice_namespace, sub_choice_def, choice_key):
+                return True
+            self._apply_feat_choice_selection(
+                feat_name,
+                sub_choice_name,
+                choice_value,
+                feat_data=feat_data,
+            )
+            return True
+
+        # Generic choice - might be class feature choice
+        # Try to find and apply effects from class/subclass data
+        # Update feature display name if this is a choice for an existing feature
+        self._update_feature_choice_display(choice_key, choice_value)
+
+        # Check if this is a feature choice with effects
+        if self.character_data.get("class_data"):
+            self._apply_choice_effects(
+                choice_key, choice_value, self.character_data["class_data"]
+            )
+        if self.character_data.get("subclass_data"):
+            self._apply_choice_effects(
+                choice_key, choice_value, self.character_data["subclass_data"]
+            )
+        if self.character_data.get("species_data"):
+            self._apply_species_choice_effects(
+                choice_key, choice_value, self.character_data["species_data"]
+            )
+        if self.character_data.get("lineage_data"):
+            self._apply_species_choice_effects(
+                choice_key, choice_value, self.character_data["lineage_data"]
+            )
+        # Just store it
+        return True
+
+    def _choice_species(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``species`` choice."""
+        return self.set_species(choice_value)
+
+    def _choice_lineage(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``lineage`` choice."""
+        return self.set_lineage(choice_value)
+
+    def _choice_lineage_spellcasting_ability(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``lineage_spellcasting_ability`` choice."""
+        self.character_data["spellcasting_ability"] = choice_value
+        return True
+
+    def _choice_species_trait_choices(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``species_trait_choices`` choice."""
+        # Canonical nested storage for species (and lineage) trait picks.
+        # The dict has already been recorded at choices_made["species_trait_choices"]
+        # at the top of apply_choice(). Dispatch each trait → value to apply_choice
+        # so trait-level side effects (e.g. Elven Lineage → spellcasting_ability,
+        # Draconic Ancestry → damage_type substitutions, choice-effect grants)
+        # still fire. Per-trait flat keys written during dispatch are normalized
+        # back into the nested object at the end of apply_choices().
+        if isinstance(choice_value, dict):
+            for trait_name, trait_value in choice_value.items():
+                self.apply_choice(trait_name, trait_value)
         return True
 
-    # ==================== Choice Application Methods ====================
+    def _choice_class(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``class`` choice."""
+        return self.set_class(choice_value, self.character_data.get("level", 1))
 
-    def apply_choice(self, choice_key: str, choice_value: Any) -> bool:
-        """
-        Apply a single choice and its effects to the character.
+    def _choice_subclass(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``subclass`` choice."""
+        return self.set_subclass(choice_value)
 
-        Args:
-            choice_key: The choice identifier (e.g., 'species', 'class', 'Divine Order')
-            choice_value: The choice value (can be string, int, list, dict)
+    def _choice_background(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``background`` choice."""
+        return self.set_background(choice_value)
 
-        Returns:
-            True if choice was applied successfully
-        """
-        # Store the choice
-        self.character_data["choices_made"][choice_key] = choice_value
+    def _choice_level(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``level`` choice."""
+        current_class = self.character_data.get("class")
+        if current_class:
+            return self.set_class(current_class, int(choice_value))
+        self.character_data["level"] = int(choice_value)
+        return True
 
-        # Apply based on choice type
-        choice_key_lower = choice_key.lower()
+    def _choice_ability_scores(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply an ``ability_scores`` choice."""
+        if isinstance(choice_value, dict):
+            return self.set_abilities(choice_value)
+        elif choice_value == "standard_array_recommended":
+            # Get the recommended ability scores from class data
+            class_data = self.character_data.get("class_data", {})
+            standard_array = class_data.get("standard_array_assignment")
+            if standard_array:
+                return self.set_abilities(standard_array)
+        return True
 
-        # Core character selections
-        if choice_key_lower == "species":
-            return self.set_species(choice_value)
-        elif choice_key_lower == "lineage":
-            return self.set_lineage(choice_value)
-        elif choice_key_lower == "lineage_spellcasting_ability":
-            self.character_data["spellcasting_ability"] = choice_value
-            return True
-        elif choice_key_lower in ["elven lineage", "gnomish lineage"]:
-            # Species trait choice for spellcasting ability (INT/WIS/CHA)
-            self.character_data["spellcasting_ability"] = choice_value
-            return True
-        elif choice_key_lower == "species_trait_choices":
-            # Canonical nested storage for species (and lineage) trait picks.
-            # The dict has already been recorded at choices_made["species_trait_choices"]
-            # at the top of this function. Dispatch each trait → value to apply_choice
-            # so trait-level side effects (e.g. Elven Lineage → spellcasting_ability,
-            # Draconic Ancestry → damage_type substitutions, choice-effect grants)
-            # still fire. Per-trait flat keys written during dispatch are normalized
-            # back into the nested object at the end of apply_choices().
-            if isinstance(choice_value, dict):
-                for trait_name, trait_value in choice_value.items():
-                    self.apply_choice(trait_name, trait_value)
-            return True
-        elif choice_key_lower == "class":
-            return self.set_class(choice_value, self.character_data.get("level", 1))
-        elif choice_key_lower == "subclass":
-            return self.set_subclass(choice_value)
-        elif choice_key_lower == "background":
-            return self.set_background(choice_value)
-        elif choice_key_lower == "level":
-            current_class = self.character_data.get("class")
-            if current_class:
-                return self.set_class(current_class, int(choice_value))
-            self.character_data["level"] = int(choice_value)
-            return True
+    def _choice_ability_scores_method(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply an ``ability_scores_method`` choice."""
+        # Handle "recommended", "manual", "roll", "standard_array", or "point_buy" methods
+        if choice_value == "recommended":
+            # Use the predefined standard_array_assignment from class data
+            class_data = self.character_data.get("class_data", {})
 
-        # Ability scores
-        elif choice_key_lower in ["ability_scores", "abilities"]:
-            if isinstance(choice_value, dict):
-                return self.set_abilities(choice_value)
-            elif choice_value == "standard_array_recommended":
-                # Get the recommended ability scores from class data
-                class_data = self.character_data.get("class_data", {})
-                standard_array = class_data.get("standard_array_assignment")
-                if standard_array:
-                    return self.set_abilities(standard_array)
-            return True
-        elif choice_key_lower == "ability_scores_method":
-            # Handle "recommended", "manual", "roll", "standard_array", or "point_buy" methods
-            if choice_value == "recommended":
-                # Use the predefined standard_array_assignment from class data
-                class_data = self.character_data.get("class_data", {})
-
-                if "standard_array_assignment" in class_data:
-                    return self.set_abilities(class_data["standard_array_assignment"])
-                else:
-                    print(
-                        f"Warning: Class {class_data.get('name', 'Unknown')} missing standard_array_assignment"
-                    )
-                    return False
-            # "manual", "roll", "standard_array", and "point_buy" all store scores via
-            # the "ability_scores" key;
-            # nothing extra needed here beyond recording the method choice.
-            return True
-        elif choice_key_lower == "background_ability_score_assignment":
-            # Apply background ability bonuses
-            if isinstance(choice_value, dict):
-                self.ability_scores.apply_background_bonuses(choice_value)
-                # Update character_data so it persists across session save/restore
-                if "abilities" not in self.character_data:
-                    self.character_data["abilities"] = {}
-                self.character_data["abilities"]["background_bonuses"] = choice_value
-            return True
-        elif choice_key_lower == "background_bonuses":
-            # Apply background ability bonuses (alternate key name)
-            if isinstance(choice_value, dict):
-                self.ability_scores.apply_background_bonuses(choice_value)
-                # Update character_data so it persists across session save/restore
-                if "abilities" not in self.character_data:
-                    self.character_data["abilities"] = {}
-                self.character_data["abilities"]["background_bonuses"] = choice_value
-            return True
-        elif choice_key_lower in ["additional_ability_modifiers", "ability_modifiers"]:
-            # Apply user-entered additional ability modifiers
-            if isinstance(choice_value, dict):
-                self.ability_scores.apply_additional_modifiers(choice_value)
-                if "abilities" not in self.character_data:
-                    self.character_data["abilities"] = {}
-                self.character_data["abilities"]["additional_modifiers"] = choice_value
-            return True
-        elif choice_key_lower == "background_bonuses_method":
-            # Handle "suggested" background bonuses
-            if choice_value == "suggested":
-                background_data = self.character_data.get("background_data", {})
-                if background_data:
-                    asi_data = background_data.get("ability_score_increase", {})
-                    suggested = asi_data.get("suggested", {})
-                    if suggested:
-                        self.ability_scores.apply_background_bonuses(suggested)
-            return True
+            if "standard_array_assignment" in class_data:
+                return self.set_abilities(class_data["standard_array_assignment"])
+            else:
+                print(
+                    f"Warning: Class {class_data.get('name', 'Unknown')} missing standard_array_assignment"
+                )
+                return False
+        # "manual", "roll", "standard_array", and "point_buy" all store scores via
+        # the "ability_scores" key;
+        # nothing extra needed here beyond recording the method choice.
+        return True
+
+    def _choice_background_bonuses(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``background_ability_score_assignment`` choice."""
+        # Apply background ability bonuses
+        if isinstance(choice_value, dict):
+            self.ability_scores.apply_background_bonuses(choice_value)
+            # Update character_data so it persists across session save/restore
+            if "abilities" not in self.character_data:
+                self.character_data["abilities"] = {}
+            self.character_data["abilities"]["background_bonuses"] = choice_value
+        return True
+
+    def _choice_additional_ability_modifiers(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply an ``additional_ability_modifiers`` choice."""
+        # Apply user-entered additional ability modifiers
+        if isinstance(choice_value, dict):
+            self.ability_scores.apply_additional_modifiers(choice_value)
+            if "abilities" not in self.character_data:
+                self.character_data["abilities"] = {}
+            self.character_data["abilities"]["additional_modifiers"] = choice_value
+        return True
+
+    def _choice_background_bonuses_method(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``background_bonuses_method`` choice."""
+        # Handle "suggested" background bonuses
+        if choice_value == "suggested":
+            background_data = self.character_data.get("background_data", {})
+            if background_data:
+                asi_data = background_data.get("ability_score_increase", {})
+                suggested = asi_data.get("suggested", {})
+                if suggested:
+                    self.ability_scores.apply_background_bonuses(suggested)
+        return True
 
-        # Languages
-        elif choice_key_lower == "languages":
-            if isinstance(choice_value, list):
-                # Clear previously user-selected languages before applying new ones
-                lang_sources = self.character_data["proficiency_sources"]["languages"]
-                old_user_langs = [
-                    l for l, src in lang_sources.items() if src == "user_choice"
+    def _choice_languages(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``languages`` choice."""
+        if isinstance(choice_value, list):
+            # Clear previously user-selected languages before applying new ones
+            lang_sources = self.character_data["proficiency_sources"]["languages"]
+            old_user_langs = [
+                l for l, src in lang_sources.items() if src == "user_choice"
+            ]
+            if old_user_langs:
+                removed = set(old_user_langs)
+                self.character_data["proficiencies"]["languages"] = [
+                    l for l in self.character_data["proficiencies"]["languages"]
+                    if l not in removed
                 ]
                 for lang in old_user_langs:
-                    self.character_data["proficiencies"]["languages"] = [
-                        l for l in self.character_data["proficiencies"]["languages"] if l != lang
-                    ]
                     lang_sources.pop(lang, None)
 
-                language_options = self.get_language_options()
-                available_languages = set(language_options["available_languages"])
-                selection_count = language_options["selection_count"]
-                normalized_choices = []
-                for lang in choice_value:
-                    if (
-                        isinstance(lang, str)
-                        and lang in available_languages
-                        and lang not in normalized_choices
-                    ):
-                        normalized_choices.append(lang)
-                    # Enforce exactly N selected languages by truncating extras.
-                    if len(normalized_choices) >= selection_count:
-                        break
+            language_options = self.get_language_options()
+            available_languages = set(language_options["available_languages"])
+            selection_count = language_options["selection_count"]
+            normalized_choices = []
+            for lang in choice_value:
+                if (
+                    isinstance(lang, str)
+                    and lang in available_languages
+                    and lang not in normalized_choices
+                ):
+                    normalized_choices.append(lang)
+                # Enforce exactly N selected languages by truncating extras.
+                if len(normalized_choices) >= selection_count:
+                    break
 
-                # Add new language selections
-                for lang in normalized_choices:
-                    if lang not in self.character_data["proficiencies"]["languages"]:
-                        self.character_data["proficiencies"]["languages"].append(lang)
-                        self.character_data["proficiency_sources"]["languages"][lang] = "user_choice"
-                self.character_data["choices_made"][choice_key] = normalized_choices
-            return True
+            # Add new language selections
+            for lang in self._add_proficiencies("languages", normalized_choices):
+                lang_sources[lang] = "user_choice"
+            self.character_data["choices_made"][choice_key] = normalized_choices
+        return True
 
+    def _choice_rare_languages(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``rare_languages`` choice."""
         # Optional rare language picks (do not count against standard selection_count)
-        elif choice_key_lower == "rare_languages":
-            if isinstance(choice_value, list):
-                # Clear previously user-selected rare languages before applying new ones
-                lang_sources = self.character_data["proficiency_sources"]["languages"]
-                old_rare_user_langs = [
-                    l for l, src in lang_sources.items() if src == "rare_user_choice"
+        if isinstance(choice_value, list):
+            # Clear previously user-selected rare languages before applying new ones
+            lang_sources = self.character_data["proficiency_sources"]["languages"]
+            old_rare_user_langs = [
+                l for l, src in lang_sources.items() if src == "rare_user_choice"
+            ]
+            if old_rare_user_langs:
+                removed = set(old_rare_user_langs)
+                self.character_data["proficiencies"]["languages"] = [
+                    l for l in self.character_data["proficiencies"]["languages"]
+                    if l not in removed
                 ]
                 for lang in old_rare_user_langs:
-                    self.character_data["proficiencies"]["languages"] = [
-                        l for l in self.character_data["proficiencies"]["languages"] if l != lang
-                    ]
                     lang_sources.pop(lang, None)
 
-                language_options = self.get_language_options()
-                available_rare = set(language_options["all_rare_languages"])
-                normalized_rare = []
-                for lang in choice_value:
-                    if (
-                        isinstance(lang, str)
-                        and lang in available_rare
-                        and lang not in normalized_rare
-                    ):
-                        normalized_rare.append(lang)
-
-                # Add new rare language selections
-                for lang in normalized_rare:
-                    if lang not in self.character_data["proficiencies"]["languages"]:
-                        self.character_data["proficiencies"]["languages"].append(lang)
-                        self.character_data["proficiency_sources"]["languages"][lang] = "rare_user_choice"
-                self.character_data["choices_made"]["rare_languages"] = normalized_rare
-            return True
+            language_options = self.get_language_options()
+            available_rare = set(language_options["all_rare_languages"])
+            normalized_rare = []
+            for lang in choice_value:
+                if (
+                    isinstance(lang, str)
+                    and lang in available_rare
+                    and lang not in normalized_rare
+                ):
+                    normalized_rare.append(lang)
 
-        # Skills
-        elif choice_key_lower in ["skill_choices", "skills"]:
-            if isinstance(choice_value, list):
-                for skill in choice_value:
-                    if skill not in self.character_data["proficiencies"]["skills"]:
-                        self.character_data["proficiencies"]["skills"].append(skill)
-                        # Track that this came from class selection
-                        class_name = self.character_data.get("class", "Class")
-                        self.character_data["proficiency_sources"]["skills"][skill] = (
-                            class_name
-                        )
-            return True
+            # Add new rare language selections
+            for lang in self._add_proficiencies("languages", normalized_rare):
+                lang_sources[lang] = "rare_user_choice"
+            self.character_data["choices_made"]["rare_languages"] = normalized_rare
+        return True
 
-        # Tool proficiencies
-        elif choice_key_lower in ["tool_choices", "tools"]:
-            if isinstance(choice_value, list):
-                for tool in choice_value:
-                    if tool not in self.character_data["proficiencies"]["tools"]:
-                        self.character_data["proficiencies"]["tools"].append(tool)
-                        # Track that this came from class selection
-                        class_name = self.character_data.get("class", "Class")
-                        self.character_data["proficiency_sources"]["tools"][tool] = (
-                            class_name
-                        )
-            elif isinstance(choice_value, str) and choice_value:
-                if choice_value not in self.character_data["proficiencies"]["tools"]:
-                    self.character_data["proficiencies"]["tools"].append(choice_value)
-                    class_name = self.character_data.get("class", "Class")
-                    self.character_data["proficiency_sources"]["tools"][choice_value] = (
-                        class_name
-                    )
-            return True
+    def _choice_skill_choices(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``skill_choices`` choice."""
+        if isinstance(choice_value, list):
+            skill_sources = self.character_data["proficiency_sources"]["skills"]
+            # Track that these came from class selection
+            class_name = self.character_data.get("class", "Class")
+            for skill in self._add_proficiencies("skills", choice_value):
+                skill_sources[skill] = class_name
+        return True
 
+    def _choice_tool_choices(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``tool_choices`` choice."""
+        if isinstance(choice_value, list):
+            tool_sources = self.character_data["proficiency_sources"]["tools"]
+            # Track that these came from class selection
+            class_name = self.character_data.get("class", "Class")
+            for tool in self._add_proficiencies("tools", choice_value):
+                tool_sources[tool] = class_name
+        elif isinstance(choice_value, str) and choice_value:
+            if choice_value not in self.character_data["proficiencies"]["tools"]:
+                self.character_data["proficiencies"]["tools"].append(choice_value)
+                class_name = self.character_data.get("class", "Class")
+                self.character_data["proficiency_sources"]["tools"][choice_value] = (
+                    class_name
+                )
+        return True
+
+    def _choice_background_skill_replacements(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``background_skill_replacements`` choice."""
         # Background skill replacements — restore from saved choices
-        elif choice_key_lower == "background_skill_replacements":
-            normalized_replacements: List[str] = []
-            if isinstance(choice_value, str):
-                normalized_replacements = [choice_value] if choice_value else []
-            elif isinstance(choice_value, list):
-                normalized_replacements = choice_value
-            self.apply_background_skill_replacement(normalized_replacements)
-            return True
+        normalized_replacements: List[str] = []
+        if isinstance(choice_value, str):
+            normalized_replacements = [choice_value] if choice_value else []
+        elif isinstance(choice_value, list):
+            normalized_replacements = choice_value
+        self.apply_background_skill_replacement(normalized_replacements)
+        return True
 
+    def _choice_species_skill_replacements(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``species_skill_replacements`` choice."""
         # Species skill replacements — restore from saved choices
-        elif choice_key_lower == "species_skill_replacements":
-            normalized_replacements: List[str] = []
-            if isinstance(choice_value, str):
-                normalized_replacements = [choice_value] if choice_value else []
-            elif isinstance(choice_value, list):
-                normalized_replacements = choice_value
-            self.apply_species_skill_replacement(normalized_replacements)
-            return True
+        normalized_replacements: List[str] = []
+        if isinstance(choice_value, str):
+            normalized_replacements = [choice_value] if choice_value else []
+        elif isinstance(choice_value, list):
+            normalized_replacements = choice_value
+        self.apply_species_skill_replacement(normalized_replacements)
+        return True
 
+    def _choice_spellcasting(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``spellcasting`` choice."""
         # Spells - Legacy handler (cantrip selection removed from creation wizard)
-        elif choice_key_lower == "spellcasting":
-            # Silently skipped: "spellcasting" is listed in the Pass 1 ordered
-            # key list in apply_choices() so it is consumed before the second
-            # pass.  Old saved characters may carry this key; new characters
-            # never write it.  No action is required here — cantrip selection is
-            # handled post-creation via the spell_selections choice.
-            return True
+        # Silently skipped: "spellcasting" is listed in the Pass 1 ordered
+        # key list in apply_choices() so it is consumed before the second
+        # pass.  Old saved characters may carry this key; new characters
+        # never write it.  No action is required here — cantrip selection is
+        # handled post-creation via the spell_selections choice.
+        return True
 
+    def _choice_spell_selections(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``spell_selections`` choice."""
         # Spell selections - restore user-selected prepared spells
-        elif choice_key_lower == "spell_selections":
-            if isinstance(choice_value, dict):
-                # Restore prepared cantrips
-                cantrips = choice_value.get("cantrips", [])
-                if isinstance(cantrips, list):
-                    for cantrip in cantrips:
-                        self.character_data["spells"]["prepared"]["cantrips"][
-                            cantrip
-                        ] = {}
-
-                # Restore prepared spells
-                spells = choice_value.get("spells", [])
-                if isinstance(spells, list):
-                    for spell in spells:
-                        self.character_data["spells"]["prepared"]["spells"][spell] = {}
-
-                # Restore background spells if any
-                bg_cantrips = choice_value.get("background_cantrips", [])
-                if isinstance(bg_cantrips, list):
-                    for cantrip in bg_cantrips:
-                        self.character_data["spells"]["background_spells"][cantrip] = {
-                            "level": 0
-                        }
-
-                bg_spells = choice_value.get("background_spells", [])
-                if isinstance(bg_spells, list):
-                    for spell in bg_spells:
-                        self.character_data["spells"]["background_spells"][spell] = {
-                            "level": 1
-                        }
-            return True
+        if isinstance(choice_value, dict):
+            spells_data = self.character_data["spells"]
+            prepared = spells_data["prepared"]
+            background_spells = spells_data["background_spells"]
+
+            # Restore prepared cantrips
+            cantrips = choice_value.get("cantrips", [])
+            if isinstance(cantrips, list):
+                prepared_cantrips = prepared["cantrips"]
+                for cantrip in cantrips:
+                    prepared_cantrips[cantrip] = {}
+
+            # Restore prepared spells
+            spells = choice_value.get("spells", [])
+            if isinstance(spells, list):
+                prepared_spells = prepared["spells"]
+                for spell in spells:
+                    prepared_spells[spell] = {}
+
+            # Restore background spells if any
+            bg_cantrips = choice_value.get("background_cantrips", [])
+            if isinstance(bg_cantrips, list):
+                for cantrip in bg_cantrips:
+                    background_spells[cantrip] = {"level": 0}
+
+            bg_spells = choice_value.get("background_spells", [])
+            if isinstance(bg_spells, list):
+                for spell in bg_spells:
+                    background_spells[spell] = {"level": 1}
+        return True
 
+    def _choice_weapon_mastery(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``weapon mastery`` choice."""
         # Weapon Mastery - removed from creation wizard, managed post-creation
-        elif choice_key_lower == "weapon mastery":
-            # Silently skipped: "weapon mastery" is listed in the Pass 1 ordered
-            # key list in apply_choices() so it is consumed before the second
-            # pass.  Old saved characters may carry this key; new characters
-            # never write it.  No action is required here — mastery selection is
-            # handled post-creation via the weapon_mastery_selections choice.
-            return True
+        # Silently skipped: "weapon mastery" is listed in the Pass 1 ordered
+        # key list in apply_choices() so it is consumed before the second
+        # pass.  Old saved characters may carry this key; new characters
+        # never write it.  No action is required here — mastery selection is
+        # handled post-creation via the weapon_mastery_selections choice.
+        return True
 
+    def _choice_weapon_mastery_selections(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``weapon_mastery_selections`` choice."""
         # Weapon mastery selections - restore user-selected masteries
-        elif choice_key_lower == "weapon_mastery_selections":
-            if isinstance(choice_value, list):
-                self.character_data["weapon_masteries"]["selected"] = choice_value
-            return True
+        if isinstance(choice_value, list):
+            self.character_data["weapon_masteries"]["selected"] = choice_value
+        return True
 
+    def _choice_eldritch_invocation_selections(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply an ``eldritch_invocation_selections`` choice."""
         # Eldritch Invocation selections - restore user-selected invocations
-        elif choice_key_lower == "eldritch_invocation_selections":
-            if isinstance(choice_value, list):
-                if "eldritch_invocations" not in self.character_data:
-                    self.character_data["eldritch_invocations"] = {"selected": []}
-                self.character_data["eldritch_invocations"]["selected"] = choice_value
-                # Phase 7 (D0-1): route each chosen invocation through the
-                # single dispatcher. Sheet-affecting invocations carry an
-                # `effects` array in data/eldritch_invocations.json; we load
-                # the file once and apply effects per chosen invocation.
-                self._apply_eldritch_invocation_effects(choice_value)
-            return True
-
-        # Nested bonus choices (e.g., Thaumaturge_bonus_cantrip)
-        elif "_bonus_cantrip" in choice_key_lower:
-            # Extract parent feature name (e.g., "Thaumaturge" from "Thaumaturge_bonus_cantrip")
-            parent_name = (
-                choice_key.replace("_bonus_cantrip", "").replace("_", " ").title()
-            )
-            class_name = self.character_data.get("class", "Class")
+        if isinstance(choice_value, list):
+            if "eldritch_invocations" not in self.character_data:
+                self.character_data["eldritch_invocations"] = {"selected": []}
+            self.character_data["eldritch_invocations"]["selected"] = choice_value
+            # Phase 7 (D0-1): route each chosen invocation through the
+            # single dispatcher. Sheet-affecting invocations carry an
+            # `effects` array in data/eldritch_invocations.json; we load
+            # the file once and apply effects per chosen invocation.
+            self._apply_eldritch_invocation_effects(choice_value)
+        return True
 
-            # Add cantrip(s) to always_prepared dict (doesn't count against limit)
-            cantrips_to_add = (
-                choice_value if isinstance(choice_value, list) else [choice_value]
-            )
-            for cantrip in cantrips_to_add:
-                # Add to always_prepared dict
-                self.character_data["spells"]["always_prepared"][cantrip] = {
-                    "level": 0,
-                    "source": f"{parent_name} ({class_name})",
-                    "always_prepared": True,
-                    "counts_against_limit": False,
-                }
+    def _choice_character_name(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a ``character_name`` choice."""
+        self.character_data["name"] = choice_value
+        return True
 
-                # Also track in spell_metadata for compatibility
-                self.character_data["spell_metadata"][cantrip] = {
-                    "source": f"{parent_name} ({class_name})",
-                    "always_prepared": True,
-                    "once_per_day": False,
-                    "counts_against_limit": False,
-                }
+    def _choice_alignment(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply an ``alignment`` choice."""
+        self.character_data["alignment"] = choice_value
+        return True
 
-            # Find the parent feature and append the choice
-            cantrip_display = (
-                ", ".join(cantrips_to_add)
-                if isinstance(choice_value, list)
-                else choice_value
-            )
-            for category in ["class", "subclass", "species", "lineage"]:
-                for feature in self.character_data["features"][category]:
-                    # Look for features that start with "Divine Order: Thaumaturge" or just "Thaumaturge"
-                    if parent_name in feature["name"]:
-                        # Append the bonus cantrip info
-                        bonus_text = f"\n\nBonus Cantrip: {cantrip_display}"
-                        if bonus_text not in feature["description"]:
-                            feature["description"] += bonus_text
-                        return True
-            return True
+    def _choice_equipment_selections(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply an ``equipment_selections`` choice."""
+        return self._process_equipment_selections(choice_value)
 
-        # Character metadata
-        elif choice_key_lower in ["character_name", "name"]:
-            self.character_data["name"] = choice_value
-            return True
-        elif choice_key_lower == "alignment":
-            self.character_data["alignment"] = choice_value
-            return True
+    def _choice_bonus_cantrip(self, choice_key: str, choice_value: Any) -> bool:
+        """Apply a nested bonus cantrip choice (e.g. ``Thaumaturge_bonus_cantrip``)."""
+        # Extract parent feature name (e.g., "Thaumaturge" from "Thaumaturge_bonus_cantrip")
+        parent_name = _bonus_cantrip_parent_name(choice_key)
+        class_name = self.character_data.get("class", "Class")
 
-        # Equipment selections
-        elif choice_key_lower == "equipment_selections":
-            return self._process_equipment_selections(choice_value)
+        # Add cantrip(s) to always_prepared dict (doesn't count against limit)
+        cantrips_to_add = (
+            choice_value if isinstance(choice_value, list) else [choice_value]
+        )
+        always_prepared = self.character_data["spells"]["always_prepared"]
+        spell_metadata = self.character_data["spell_metadata"]
+        source = f"{parent_name} ({class_name})"
+        for cantrip in cantrips_to_add:
+            # Add to always_prepared dict
+            always_prepared[cantrip] = {
+                "level": 0,
+                "source": source,
+                "always_prepared": True,
+                "counts_against_limit": False,
+            }
 
-        # Feat sub-choices can come from either class feat slots
-        # (for example, class_feat_4_cantrips) or namespaced feat-choice pages
-        # (for example, feat_Magic Initiate (Wizard)_cantrips).
-        elif (feat_choice_context := self._resolve_feat_choice_context(choice_key)):
-            feat_name, sub_choice_name, feat_data, sub_choice_def, choice_namespace = feat_choice_context
-            if not self._feat_choice_dependencies_met(choice_namespace, sub_choice_def, choice_key):
-                return True
-            self._apply_feat_choice_selection(
-                feat_name,
-                sub_choice_name,
-                choice_value,
-                feat_data=feat_data,
-            )
-            return True
+            # Also track in spell_metadata for compatibility
+            spell_metadata[cantrip] = {
+                "source": source,
+                "always_prepared": True,
+                "once_per_day": False,
+                "counts_against_limit": False,
+            }
 
-        # Generic choice - might be class feature choice
-        # Try to find and apply effects from class/subclass data
-        else:
-            # Update feature display name if this is a choice for an existing feature
-            self._update_feature_choice_display(choice_key, choice_value)
+        # Find the parent feature and append the choice
+        cantrip_display = (
+            ", ".join(cantrips_to_add)
+            if isinstance(choice_value, list)
+            else choice_value
+        )
+        features = self.character_data["features"]
+        for category in _CHOICE_PARENT_FEATURE_CATEGORIES:
+            for feature in features.get(category, ()):
+                # Look for features that start with "Divine Order: Thaumaturge" or just "Thaumaturge"
+                if parent_name in feature["name"]:
+                    # Append the bonus cantrip info
+                    bonus_text = f"\n\nBonus Cantrip: {cantrip_display}"
+                    if bonus_text not in feature["description"]:
+                        feature["description"] += bonus_text
+                    return True
+        return True
 
-            # Check if this is a feature choice with effects
-            if self.character_data.get("class_data"):
-                self._apply_choice_effects(
-                    choice_key, choice_value, self.character_data["class_data"]
-                )
-            if self.character_data.get("subclass_data"):
-                self._apply_choice_effects(
-                    choice_key, choice_value, self.character_data["subclass_data"]
-                )
-            if self.character_data.get("species_data"):
-                self._apply_species_choice_effects(
-                    choice_key, choice_value, self.character_data["species_data"]
-                )
-            if self.character_data.get("lineage_data"):
-                self._apply_species_choice_effects(
-                    choice_key, choice_value, self.character_data["lineage_data"]
-                )
-            # Just store it
-            return True
+    # Lower-cased ``choice_key`` -> handler, looked up once per ``apply_choice``
+    # call. Keys with no entry fall through to the bonus-cantrip, feat sub-choice
+    # and generic feature-choice paths.
+    _CHOICE_HANDLERS: Mapping[str, Callable[..., bool]] = MappingProxyType({
+        "species": _choice_species,
+        "lineage": _choice_lineage,
+        "lineage_spellcasting_ability": _choice_lineage_spellcasting_ability,
+        "elven lineage": _choice_lineage_spellcasting_ability,
+        "gnomish lineage": _choice_lineage_spellcasting_ability,
+        "species_trait_choices": _choice_species_trait_choices,
+        "class": _choice_class,
+        "subclass": _choice_subclass,
+        "background": _choice_background,
+        "level": _choice_level,
+        "ability_scores": _choice_ability_scores,
+        "abilities": _choice_ability_scores,
+        "ability_scores_method": _choice_ability_scores_method,
+        "background_ability_score_assignment": _choice_background_bonuses,
+        "background_bonuses": _choice_background_bonuses,
+        "additional_ability_modifiers": _choice_additional_ability_modifiers,
+        "ability_modifiers": _choice_additional_ability_modifiers,
+        "background_bonuses_method": _choice_background_bonuses_method,
+        "languages": _choice_languages,
+        "rare_languages": _choice_rare_languages,
+        "skill_choices": _choice_skill_choices,
+        "skills": _choice_skill_choices,
+        "tool_choices": _choice_tool_choices,
+        "tools": _choice_tool_choices,
+        "background_skill_replacements": _choice_background_skill_replacements,
+        "species_skill_replacements": _choice_species_skill_replacements,
+        "spellcasting": _choice_spellcasting,
+        "spell_selections": _choice_spell_selections,
+        "weapon mastery": _choice_weapon_mastery,
+        "weapon_mastery_selections": _choice_weapon_mastery_selections,
+        "eldritch_invocation_selections": _choice_eldritch_invocation_selections,
+        "character_name": _choice_character_name,
+        "name": _choice_character_name,
+        "alignment": _choice_alignment,
+        "equipment_selections": _choice_equipment_selections,
+    })
 
     def _update_feature_choice_display(self, choice_key: str, choice_value: Any):
         """
@@ -3584,20 +4295,24 @@ class CharacterBuilder:
         if not isinstance(choice_value, str):
             return
 
-        # Handle species_trait_ prefix
-        feature_base = choice_key
-        if choice_key.startswith("species_trait_"):
-            feature_base = choice_key.replace("species_trait_", "")
-
-        # Normalize choice key to match feature names
-        feature_name_variants = [
-            feature_base,
-            feature_base.replace("_", " ").title(),
-            feature_base.replace("_", " "),
-            choice_key,  # Also try original
-            choice_key.replace("_", " ").title(),
-            choice_key.replace("_", " "),
-        ]
+        feature_name_variants, variant_prefixes = _feature_name_variants(choice_key)
+
+        # Find the feature this choice belongs to first, so choices that match
+        # no feature skip the description lookups below entirely.
+        features = self.character_data["features"]
+        feature = next(
+            (
+                feature
+                for category in _FEATURE_CATEGORIES
+                for feature in features.get(category, ())
+                if feature["name"] in feature_name_variants
+                or feature["name"].startswith(variant_prefixes)
+            ),
+            None,
+        )
+        if feature is None:
+            return
+        name = feature["name"]
 
         # Try to find the choice-specific description from class/subclass data
         choice_description = None
@@ -3633,10 +4348,10 @@ class CharacterBuilder:
                                                 self.data_dir / external_file
                                             )
                                             if external_path.exists():
-                                                import json
-
-                                                with open(external_path, "r") as f:
-                                                    external_data = json.load(f)
+                                                external_data = _load_json_cached(
+                                                    str(external_path),
+                                                    external_path.stat().st_mtime_ns,
+                                                )
                                                 choice_list = external_data.get(
                                                     external_list, {}
                                                 )
@@ -3689,41 +4404,21 @@ class CharacterBuilder:
                     if choice_description:
                         break
 
-        # Search all feature categories for a matching feature
-        for category in [
-            "class",
-            "subclass",
-            "species",
-            "lineage",
-            "background",
-            "feats",
-        ]:
-            for feature in self.character_data["features"][category]:
-                # Check if this feature matches the choice
-                for variant in feature_name_variants:
-                    if feature["name"] == variant or feature["name"].startswith(
-                        variant + ":"
-                    ):
-                        # Update the name to include the choice
-                        base_name = (
-                            variant
-                            if feature["name"] == variant
-                            else feature["name"].split(":")[0]
-                        )
-                        if isinstance(choice_value, list):
-                            feature["name"] = f"{base_name}: {', '.join(choice_value)}"
-                        else:
-                            feature["name"] = f"{base_name}: {choice_value}"
-
-                        # Update description if we found a choice-specific one
-                        if choice_description:
-                            # Apply scaling if present
-                            if choice_scaling:
-                                choice_description = self._apply_feature_scaling(
-                                    choice_description, choice_scaling
-                                )
-                            feature["description"] = choice_description
-                        return
+        # Update the name to include the choice
+        base_name = name if name in feature_name_variants else name.split(":")[0]
+        if isinstance(choice_value, list):
+            feature["name"] = f"{base_name}: {', '.join(choice_value)}"
+        else:
+            feature["name"] = f"{base_name}: {choice_value}"
+
+        # Update description if we found a choice-specific one
+        if choice_description:
+            # Apply scaling if present
+            if choice_scaling:
+                choice_description = self._apply_feature_scaling(
+                    choice_description, choice_scaling
+                )
+            feature["description"] = choice_description
 
     # ------------------------------------------------------------------
     # Phase 6: unified choice → effects resolver
@@ -3774,15 +4469,18 @@ class CharacterBuilder:
             if not external_path.exists():
                 return None
             try:
-                with open(external_path, "r") as f:
-                    external_data = json.load(f)
+                external_data = _load_json_cached(
+                    str(external_path), external_path.stat().st_mtime_ns
+                )
             except (json.JSONDecodeError, IOError) as e:
                 print(f"WARNING: Failed to load external file {file_name}: {e}")
                 return None
             options_list = external_data.get(list_name, {})
             if not isinstance(options_list, dict):
                 return None
-            return options_list.get(key)
+            # The parsed file is shared process-wide and the returned effects
+            # end up in applied_effects, so hand back a private copy.
+            return _clone_json_data(options_list.get(key))
 
         def _harvest(option_data: Any, src_label: str) -> bool:
             if not isinstance(option_data, dict):
@@ -3795,6 +4493,14 @@ class CharacterBuilder:
                     results.append((effect, src_label, "class_choice"))
             return True
 
+        # select_multiple choices (e.g. Battle Master maneuvers) supply a
+        # list value; iterate so each chosen option's effects flow through
+        # the dispatcher independently.
+        if isinstance(choice_value, list):
+            values_iter = [v for v in choice_value if v is not None]
+        else:
+            values_iter = [choice_value]
+
         # ---------------- Location 5 / 4 : feature.choices.source ----------------
         features_by_level = source_data.get("features_by_level", {})
         for level_features in features_by_level.values():
@@ -3805,6 +4511,9 @@ class CharacterBuilder:
                     continue
 
                 choices_config = feature_data.get("choices")
+                if not choices_config:
+                    # Nothing to resolve against, whatever the name.
+                    continue
                 # ``choices`` may be a dict OR a list of dicts (some features
                 # pose several independent choices). Normalise to a list.
                 if isinstance(choices_config, dict):
@@ -3814,24 +4523,13 @@ class CharacterBuilder:
                 else:
                     choices_list = []
 
-                matches_by_feature_name = feature_name == choice_key
-                matches_by_choice_name = any(
+                if feature_name != choice_key and not any(
                     c.get("name") == choice_key for c in choices_list
-                )
-
-                if not (matches_by_feature_name or matches_by_choice_name):
+                ):
                     continue
 
                 for choice_cfg in choices_list:
                     source_config = choice_cfg.get("source", {})
-                    # select_multiple choices (e.g. Battle Master maneuvers)
-                    # supply a list value; iterate so each chosen option's
-                    # effects flow through the dispatcher independently.
-                    if isinstance(choice_value, list):
-                        values_iter = [v for v in choice_value if v is not None]
-                    else:
-                        values_iter = [choice_value]
-
                     if source_config.get("type") == "external":
                         any_match = False
                         for val in values_iter:
@@ -3960,23 +4658,23 @@ class CharacterBuilder:
                 if benefits:
                     description += self._format_benefits(benefits)
 
-                already_in_slot = any(
-                    f.get("slot") == choice_key
-                    for f in self.character_data["features"]["feats"]
+                # Any earlier pick for this slot was removed above, so the
+                # slot is always free here.
+                self.character_data["features"]["feats"].append(
+                    {
+                        "name": feat_name,
+                        "description": description,
+                        "source": "class",
+                        "level": slot_level,
+                        "slot": choice_key,
+                    }
                 )
-                if not already_in_slot:
-                    self.character_data["features"]["feats"].append(
-                        {
-                            "name": feat_name,
-                            "description": description,
-                            "source": "class",
-                            "level": slot_level,
-                            "slot": choice_key,
-                        }
-                    )
 
                 # Apply the feat's top-level effects (Location 1) via the dispatcher.
-                for feat_effect in feat_data_loaded.get("effects", []):
+                # The parsed feat file is shared; applied_effects keeps its own copy.
+                for feat_effect in _clone_json_data(
+                    feat_data_loaded.get("effects", [])
+                ):
                     self._apply_effect(feat_effect, feat_name, "feat")
 
                 return
@@ -4017,8 +4715,11 @@ class CharacterBuilder:
         if not isinstance(features_by_level, dict):
             return
 
-        for feat_level in range(1, level + 1):
-            level_features = features_by_level.get(str(feat_level), {})
+        # Clamp so a non-positive level applies nothing rather than slicing
+        # from the end of the tuple.
+        last_level = max(0, min(level, 20))
+        for feat_level, level_key in enumerate(_LEVEL_KEYS[1 : last_level + 1], 1):
+            level_features = features_by_level.get(level_key, {})
             if not isinstance(level_features, dict):
                 continue
             for feature_name, feature_data in level_features.items():
@@ -4694,11 +5395,7 @@ class CharacterBuilder:
         self._clear_species_choice_effects_for_trait(choice_key)
 
         # Look for traits with choice_effects
-        traits = source_data.get("traits", {})
-        if not isinstance(traits, dict):
-            print(f"WARNING: traits is not a dict: {type(traits)}")
-            return
-
+        traits = self._expect_dict(source_data.get("traits", {}), "traits")
         for trait_name, trait_data in traits.items():
             # Check if this trait matches the choice key and has choice_effects
             if (
@@ -4835,40 +5532,6 @@ class CharacterBuilder:
             if primary.get("subclass"):
                 working_choices["subclass"] = primary["subclass"]
 
-        # Apply choices in a specific order for dependencies
-        order = [
-            "character_name",
-            "name",
-            "level",
-            "species",
-            "lineage",
-            "lineage_spellcasting_ability",  # Must come after lineage is applied
-            "class",
-            "subclass",
-            # Class skill choices must come before background so overlap can be detected
-            "skill_choices",
-            "skills",
-            "background",
-            "background_skill_replacements",  # Must come after background is applied
-            # Ability scores: only apply method if no explicit scores provided
-            "ability_scores_method",  # This might apply standard array
-            "ability_scores",
-            "abilities",  # This overrides if present
-            # Background bonuses must come after base ability scores
-            "background_ability_score_assignment",
-            "background_bonuses_method",
-            "background_bonuses",
-            "additional_ability_modifiers",
-            "tool_choices",
-            "tools",
-            "spellcasting",
-            "spell_selections",  # Restore spell selections after class/subclass applied
-            "weapon mastery",
-            "weapon_mastery_selections",  # Restore mastery selections after class applied
-            "eldritch_invocation_selections",  # Restore invocation selections after class applied
-            "alignment",
-        ]
-
         # Special handling: if both ability_scores and ability_scores_method exist,
         # skip ability_scores_method since ability_scores is the final value
         apply_method = (
@@ -4880,18 +5543,21 @@ class CharacterBuilder:
         # ── Pass 1 ──────────────────────────────────────────────────────────
         # Apply ordered dependency keys (species → class → background →
         # abilities → spells) to ensure prerequisite state is set before
-        # dependent choices.  The ``order`` list above defines the exact
+        # dependent choices.  ``_APPLY_CHOICES_ORDER`` defines the exact
         # sequence; keys absent from ``working_choices`` are skipped silently.
-        for key in order:
-            if key in working_choices:
-                # Skip ability_scores_method if we have explicit ability_scores
-                if key == "ability_scores_method" and not apply_method:
-                    # Preserve the user's selected method in choices_made for
-                    # UI round-tripping/validation while avoiding method-driven
-                    # score reassignment over explicit ability_scores.
-                    self.character_data["choices_made"][key] = choices[key]
-                    continue
-                self.apply_choice(key, working_choices[key])
+        ordered_keys = sorted(
+            (key for key in working_choices if key in _APPLY_CHOICES_PRIORITY),
+            key=_APPLY_CHOICES_PRIORITY.__getitem__,
+        )
+        for key in ordered_keys:
+            # Skip ability_scores_method if we have explicit ability_scores
+            if key == "ability_scores_method" and not apply_method:
+                # Preserve the user's selected method in choices_made for
+                # UI round-tripping/validation while avoiding method-driven
+                # score reassignment over explicit ability_scores.
+                self.character_data["choices_made"][key] = choices[key]
+                continue
+            self.apply_choice(key, working_choices[key])
 
         # Invariant: species and class must be loaded before remaining choices.
         assert self.character_data.get("species") or not working_choices.get("species"), \
@@ -4911,7 +5577,8 @@ class CharacterBuilder:
         # Skip species_skill_replacements — it needs a late pass after trait effects.
         remaining_keys = [
             k for k in working_choices
-            if k not in order and k not in ("species_skill_replacements", "classes")
+            if k not in _APPLY_CHOICES_PRIORITY
+            and k not in ("species_skill_replacements", "classes")
         ]
         # Sort so parent feat-slot keys (class_feat_N, key=0) come before their
         # sub-choice keys (class_feat_N_*, key=1).  Python's sort is stable and
@@ -5020,10 +5687,14 @@ class CharacterBuilder:
 
     def calculate_ability_modifier(self, score: int) -> int:
         """Calculate ability modifier from score."""
+        if isinstance(score, int) and 0 <= score <= 30:
+            return _ABILITY_MODIFIERS[score]
         return math.floor((score - 10) / 2)
 
     def calculate_proficiency_bonus(self, level: int) -> int:
         """Calculate proficiency bonus based on character level."""
+        if isinstance(level, int) and 0 <= level <= 20:
+            return _PROFICIENCY_BONUS[level]
         if level >= 17:
             return 6
         elif level >= 13:
@@ -5134,15 +5805,26 @@ class CharacterBuilder:
         always_prepared = self.character_data.get("spells", {}).get(
             "always_prepared", {}
         )
+        # Tally always-prepared cantrips and leveled spells in one pass, along
+        # with how many of each count against the preparation limits.
+        cantrips_always_prepared = 0
+        always_prepared_that_count = 0
+        spells_always_prepared = 0
+        always_prepared_spells_that_count = 0
         if isinstance(always_prepared, dict):
-            always_prepared_cantrips = [
-                spell_name
-                for spell_name, spell_data in always_prepared.items()
-                if isinstance(spell_data, dict) and spell_data.get("level", 0) == 0
-            ]
-        else:
-            always_prepared_cantrips = []
-        stats["cantrips_always_prepared"] = len(always_prepared_cantrips)
+            for spell_data in always_prepared.values():
+                if not isinstance(spell_data, dict):
+                    continue
+                spell_level = spell_data.get("level", 0)
+                if spell_level == 0:
+                    cantrips_always_prepared += 1
+                    if spell_data.get("counts_against_limit", True):
+                        always_prepared_that_count += 1
+                elif spell_level > 0:
+                    spells_always_prepared += 1
+                    if spell_data.get("counts_against_limit", True):
+                        always_prepared_spells_that_count += 1
+        stats["cantrips_always_prepared"] = cantrips_always_prepared
 
         # Get max cantrips from class table (fall back to subclass for EK/AT)
         cantrip_progression = class_data.get("cantrip_progression", {})
@@ -5159,13 +5841,6 @@ class CharacterBuilder:
             max_cantrips_total = cantrips_by_level.get(str(level), 0)
 
         # Calculate how many cantrips can be prepared (not counting always_prepared that don't count)
-        always_prepared_that_count = sum(
-            1
-            for spell_data in always_prepared.values()
-            if isinstance(spell_data, dict)
-            and spell_data.get("level", 0) == 0
-            and spell_data.get("counts_against_limit", True)
-        )
         stats["max_cantrips_to_prepare"] = max(
             0, max_cantrips_total - always_prepared_that_count
         )
@@ -5173,22 +5848,12 @@ class CharacterBuilder:
 
         # Count currently prepared cantrips
         prepared = self.character_data.get("spells", {}).get("prepared", {})
-        if isinstance(prepared, dict):
-            current_prepared_cantrips = list(prepared.get("cantrips", {}).keys())
-        else:
-            current_prepared_cantrips = []
-        stats["cantrips_to_prepare"] = len(current_prepared_cantrips)
+        stats["cantrips_to_prepare"] = (
+            len(prepared.get("cantrips", {})) if isinstance(prepared, dict) else 0
+        )
 
         # Count always prepared spells (from subclass, features)
-        if isinstance(always_prepared, dict):
-            always_prepared_spells = [
-                spell_name
-                for spell_name, spell_data in always_prepared.items()
-                if isinstance(spell_data, dict) and spell_data.get("level", 0) > 0
-            ]
-        else:
-            always_prepared_spells = []
-        stats["spells_always_prepared"] = len(always_prepared_spells)
+        stats["spells_always_prepared"] = spells_always_prepared
 
         # Calculate max prepared spells based on formula (fall back to subclass for EK/AT)
         prepared_by_level = class_data.get("prepared_spells_by_level", {})
@@ -5206,24 +5871,15 @@ class CharacterBuilder:
             max_spells_total = 0
 
         # Calculate how many spells can be prepared (not counting always_prepared that don't count)
-        always_prepared_spells_that_count = sum(
-            1
-            for spell_data in always_prepared.values()
-            if isinstance(spell_data, dict)
-            and spell_data.get("level", 0) > 0
-            and spell_data.get("counts_against_limit", True)
-        )
         stats["max_spells_to_prepare"] = max(
             0, max_spells_total - always_prepared_spells_that_count
         )
         stats["max_spells_prepared"] = max_spells_total
 
         # Count currently prepared spells
-        if isinstance(prepared, dict):
-            current_prepared_spells = list(prepared.get("spells", {}).keys())
-        else:
-            current_prepared_spells = []
-        stats["spells_prepared"] = len(current_prepared_spells)
+        stats["spells_prepared"] = (
+            len(prepared.get("spells", {})) if isinstance(prepared, dict) else 0
+        )
 
         # Add template-friendly field names for display
         # Total cantrips known = always prepared + user selected
@@ -5249,9 +5905,7 @@ class CharacterBuilder:
         feat = self._background_feat_name(background_data)
         if feat and "Magic Initiate" in feat:
             # Extract spell list from feat name
-            import re
-
-            match = re.search(r"Magic Initiate \((\w+)\)", feat)
+            match = _MAGIC_INITIATE_RE.search(feat)
             if match:
                 spell_list_class = match.group(1)
                 stats["background_cantrips_needed"] = 2
@@ -5266,15 +5920,12 @@ class CharacterBuilder:
             spell_list_override = spellcasting_source.get("spell_list")
             if spell_list_override:
                 spell_list_name = spell_list_override.lower()
-        spell_list_path = (
-            self.data_dir / "spells" / "class_lists" / f"{spell_list_name}.json"
-        )
+        spell_list_path = self._class_spell_lists_dir / f"{spell_list_name}.json"
         if spell_list_path.exists():
             try:
-                import json
-
-                with open(spell_list_path, "r") as f:
-                    spell_list_data = json.load(f)
+                spell_list_data = _load_json_cached(
+                    str(spell_list_path), spell_list_path.stat().st_mtime_ns
+                )
 
                 # Get available cantrips
                 available_cantrips = spell_list_data.get("cantrips", [])
@@ -5380,22 +6031,20 @@ class CharacterBuilder:
         """
         if not invocation_names:
             return
-        import json as _json
-        from pathlib import Path as _Path
-        path = _Path(__file__).resolve().parent.parent / "data" / "eldritch_invocations.json"
+        path = Path(__file__).resolve().parent.parent / "data" / "eldritch_invocations.json"
         if not path.exists():
             return
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                all_invocations = _json.load(f)
-        except (OSError, _json.JSONDecodeError):
+            all_invocations = _load_json_cached(str(path), path.stat().st_mtime_ns)
+        except (OSError, json.JSONDecodeError):
             return
         for name in invocation_names:
             inv = all_invocations.get(name) or {}
             effects = inv.get("effects") or []
             if not isinstance(effects, list):
                 continue
-            for effect in effects:
+            # The parsed file is shared; applied_effects keeps its own copy.
+            for effect in _clone_json_data(effects):
                 if isinstance(effect, dict):
                     self._apply_effect(effect, name, "invocation")
 
@@ -5431,15 +6080,13 @@ class CharacterBuilder:
         stats["max_invocations"] = max_invocations
 
         # Load all invocations from data file
-        import json
-        from pathlib import Path
-
         invocations_file = Path(__file__).parent.parent / "data" / "eldritch_invocations.json"
         all_invocations: Dict[str, Any] = {}
         if invocations_file.exists():
             try:
-                with open(invocations_file, "r") as f:
-                    all_invocations = json.load(f)
+                all_invocations = _load_json_cached(
+                    str(invocations_file), invocations_file.stat().st_mtime_ns
+                )
             except (json.JSONDecodeError, IOError):
                 pass
 
@@ -5466,7 +6113,7 @@ class CharacterBuilder:
                     "description": inv_data.get("description", ""),
                     "notes": inv_data.get("notes", ""),
                     "prerequisite_level": min_level,
-                    "prerequisite_invocations": required_invocations,
+                    "prerequisite_invocations": list(required_invocations),
                 }
             )
 
@@ -5484,6 +6131,9 @@ class CharacterBuilder:
 
     def calculate_processed_ability_scores(self) -> Dict[str, Dict[str, Any]]:
         """Calculate ability scores with modifiers and saving throws."""
+        if self._processed_abilities is not None:
+            return self._processed_abilities
+
         raw_scores = dict(self.ability_scores.final_scores)
         level = self.character_data.get("level", 1)
         proficiency_bonus = self.calculate_proficiency_bonus(level)
@@ -5491,16 +6141,23 @@ class CharacterBuilder:
         # Apply feat/feature ability bonuses (e.g., Actor CHA+1, Resilient, ASI)
         for bonus in self.character_data.get("ability_bonuses", []):
             ability = bonus.get("ability")
-            try:
-                value = int(bonus.get("value", 0))
-                minimum = int(bonus.get("minimum", 0))
-            except (TypeError, ValueError):
+            if ability not in raw_scores:
                 continue
-            if ability in raw_scores:
-                if value != 0 or minimum > 0:
-                    raw_scores[ability] = max(raw_scores[ability] + value, minimum)
-                    # Cap at 20
-                    raw_scores[ability] = min(raw_scores[ability], 20)
+            value = bonus.get("value", 0)
+            minimum = bonus.get("minimum", 0)
+            # Effect data almost always carries ints already; only fall back
+            # to parsing (and its exception handling) for anything else.
+            if type(value) is not int or type(minimum) is not int:
+                try:
+                    value = int(value)
+                    minimum = int(minimum)
+                except (TypeError, ValueError):
+                    continue
+            if value != 0 or minimum > 0:
+                # Cap at 20
+                raw_scores[ability] = min(
+                    max(raw_scores[ability] + value, minimum), 20
+                )
 
         # Get saving throw proficiencies from class + effects
         class_data = self.character_data.get("class_data")
@@ -5618,15 +6275,33 @@ class CharacterBuilder:
         all_weapons = equipment.get("weapons", [])
 
         ability_scores = self.calculate_processed_ability_scores()
+        str_mod = ability_scores.get("strength", {}).get("modifier", 0)
+        dex_mod = ability_scores.get("dexterity", {}).get("modifier", 0)
         proficiencies = self.character_data.get("proficiencies") or {
             "weapons": [],
             "armor": [],
             "skills": [],
         }
-        weapon_profs = proficiencies.get("weapons", [])
+        # Checked once per weapon; a set makes the direct name and category
+        # lookups in _has_weapon_proficiency constant time.
+        weapon_profs = frozenset(proficiencies.get("weapons", []))
         level = self.character_data.get("level", 1)
         proficiency_bonus = self.calculate_proficiency_bonus(level)
 
+        # Phase 6 structured bonus fields; they don't change per weapon.
+        attack_bonuses = self.character_data.get("attack_bonuses", [])
+        damage_bonuses = self.character_data.get("damage_bonuses", [])
+        thrown_damage_bonuses = [
+            entry
+            for entry in damage_bonuses
+            if entry.get("condition", "") == "thrown weapon ranged attack"
+        ]
+        has_gwf_style = bool(
+            self.character_data.get("fighting_style_flags", {}).get(
+                "great_weapon_fighting"
+            )
+        )
+
         for weapon in all_weapons:
             weapon_name = weapon.get("name")
             weapon_props = weapon.get("properties", {})
@@ -5635,17 +6310,22 @@ class CharacterBuilder:
             category = weapon_props.get("category", "")
             properties = weapon_props.get("properties", [])
 
+            # Category and property tests shared by the branches below.
+            # ``not is_ranged`` and ``is_melee`` are deliberately distinct:
+            # each rule below keeps the category test it was written with.
+            is_ranged = "Ranged" in category
+            is_melee = "Melee" in category
+            is_two_handed = "Two-Handed" in properties
+            has_thrown = any("Thrown" in prop for prop in properties)
+            is_versatile = any("Versatile" in prop for prop in properties)
+
             if "Finesse" in properties:
-                str_mod = ability_scores.get("strength", {}).get("modifier", 0)
-                dex_mod = ability_scores.get("dexterity", {}).get("modifier", 0)
                 ability_mod = max(str_mod, dex_mod)
                 ability_name = f"STR/DEX ({'STR' if str_mod >= dex_mod else 'DEX'})"
-            elif "Ranged" in category:
-                ability_mod = ability_scores.get("dexterity", {}).get("modifier", 0)
+            elif is_ranged:
+                ability_mod = dex_mod
                 ability_name = "DEX"
             else:
-                str_mod = ability_scores.get("strength", {}).get("modifier", 0)
-                dex_mod = ability_scores.get("dexterity", {}).get("modifier", 0)
                 # Check if this is a monk weapon eligible for Dexterous Attacks:
                 # Simple Melee, or Martial Melee with Light property
                 is_monk_weapon = category == "Simple Melee" or (
@@ -5667,11 +6347,11 @@ class CharacterBuilder:
 
             # Apply bonus_attack effects from features (e.g., Archery fighting style)
             # Phase 6: read from structured field, not applied_effects.
-            for entry in self.character_data.get("attack_bonuses", []):
+            for entry in attack_bonuses:
                 weapon_property = entry.get("weapon_property")
                 if weapon_property:
                     # Check if weapon matches the property requirement
-                    if weapon_property == "Ranged" and "Ranged" in category:
+                    if weapon_property == "Ranged" and is_ranged:
                         attack_bonus += entry.get("value", 0)
                     elif weapon_property in properties:
                         attack_bonus += entry.get("value", 0)
@@ -5692,7 +6372,7 @@ class CharacterBuilder:
             damage_notes = []
             one_handed_melee_bonus = 0  # Excluded from dual-wield offhand (RAW: Dueling)
 
-            for entry in self.character_data.get("damage_bonuses", []):
+            for entry in damage_bonuses:
                 condition = entry.get("condition", "")
 
                 # Check if condition is met for this weapon
@@ -5701,10 +6381,7 @@ class CharacterBuilder:
                     # Effect-driven: any bonus_damage with this condition
                     # qualifies (Dueling is the canonical example). Display
                     # as if used alone (dual-wielding shown separately).
-                    is_melee = "Ranged" not in category
-                    is_one_handed = "Two-Handed" not in properties
-
-                    if is_melee and is_one_handed:
+                    if not is_ranged and not is_two_handed:
                         applies = True
                         # Track this condition's bonus to exclude from dual-wield
                         one_handed_melee_bonus = entry.get("value", 0)
@@ -5717,9 +6394,6 @@ class CharacterBuilder:
                     # IMPORTANT: Only apply to pure thrown weapons OR the separate
                     # throw damage calculation. For melee weapons with Thrown property,
                     # we'll show separate "throw_damage" field with this bonus.
-                    is_melee = "Melee" in category
-                    has_thrown = any("Thrown" in prop for prop in properties)
-
                     # Only apply to main damage if it's NOT a melee weapon
                     # (pure thrown weapons without melee option get the bonus on main damage)
                     if has_thrown and not is_melee:
@@ -5745,13 +6419,9 @@ class CharacterBuilder:
             # Check for Great Weapon Fighting (affects average damage for Two-Handed/Versatile weapons)
             # Phase 6: read from structured fighting-style flags.
             has_gwf = False
-            if self.character_data.get("fighting_style_flags", {}).get("great_weapon_fighting"):
+            if has_gwf_style:
                 # Check if weapon qualifies (melee with Two-Handed or Versatile)
-                is_melee = "Ranged" not in category
-                is_two_handed = "Two-Handed" in properties
-                is_versatile = any("Versatile" in prop for prop in properties)
-
-                if is_melee and (is_two_handed or is_versatile):
+                if not is_ranged and (is_two_handed or is_versatile):
                     has_gwf = True
                     damage_notes.append("Can reroll 1s and 2s (GWF)")
 
@@ -5767,8 +6437,6 @@ class CharacterBuilder:
             # Show separate "Throw Damage" calculation
             throw_damage_str = None
             avg_throw_damage = None
-            has_thrown = any("Thrown" in prop for prop in properties)
-            is_melee = "Melee" in category
 
             if has_thrown and is_melee:
                 # Calculate throw damage (without Dueling, with Thrown Weapon Fighting if active)
@@ -5777,12 +6445,11 @@ class CharacterBuilder:
 
                 # Check for Thrown Weapon Fighting bonus
                 # Phase 6: read from structured damage_bonuses.
-                for entry in self.character_data.get("damage_bonuses", []):
-                    if entry.get("condition", "") == "thrown weapon ranged attack":
-                        bonus_value = entry.get("value", 0)
-                        throw_bonus += bonus_value
-                        source_name = entry.get("source", "Unknown")
-                        throw_notes.append(f"+{bonus_value} from {source_name}")
+                for entry in thrown_damage_bonuses:
+                    bonus_value = entry.get("value", 0)
+                    throw_bonus += bonus_value
+                    source_name = entry.get("source", "Unknown")
+                    throw_notes.append(f"+{bonus_value} from {source_name}")
 
                 # Format throw damage string
                 if throw_bonus > 0:
@@ -5806,9 +6473,7 @@ class CharacterBuilder:
             for prop in properties:
                 if "Versatile" in prop:
                     # Parse versatile die (e.g., "Versatile (1d8)")
-                    import re
-
-                    match = re.search(r"\((\d+d\d+)\)", prop)
+                    match = _VERSATILE_DIE_RE.search(prop)
                     if match:
                         versatile_die = match.group(1)
 
@@ -5885,8 +6550,6 @@ class CharacterBuilder:
         # Base unarmed strike: 1 + STR modifier
         # With Unarmed Fighting: 1d6 + STR (or 1d8 + STR if no weapons/shield)
         # With Martial Arts (Monk): martial_arts_die + max(STR, DEX)
-        str_mod = ability_scores.get("strength", {}).get("modifier", 0)
-        dex_mod = ability_scores.get("dexterity", {}).get("modifier", 0)
         # Phase 6: read from structured fighting-style flags.
         has_unarmed_fighting = bool(
             self.character_data.get("fighting_style_flags", {}).get("unarmed_fighting")
@@ -6099,7 +6762,7 @@ class CharacterBuilder:
         }
 
     def _has_weapon_proficiency(
-        self, weapon_props: Dict[str, Any], weapon_proficiencies: List[str]
+        self, weapon_props: Dict[str, Any], weapon_proficiencies: Collection[str]
     ) -> bool:
         """Check if character has proficiency for weapon."""
         prof_required = weapon_props.get("proficiency_required", "")
@@ -6115,6 +6778,11 @@ class CharacterBuilder:
         if prof_required in weapon_proficiencies:
             return True
 
+        # Lowercase the weapon's property list once; the conditional checks
+        # below probe it once per proficiency and per required property.
+        weapon_properties_lower = [prop.lower() for prop in weapon_properties]
+        weapon_cat_lower = weapon_category.lower()
+
         # Check conditional proficiencies (e.g., "Martial weapons with Finesse or Light property")
         for prof in weapon_proficiencies:
             prof_lower = prof.lower()
@@ -6128,9 +6796,6 @@ class CharacterBuilder:
                     property_requirement = parts[1].strip()
                     
                     # Check if weapon matches the base type (Simple/Martial)
-                    # Extract the key word (Simple or Martial)
-                    weapon_cat_lower = weapon_category.lower()
-                    
                     # Check for "simple" or "martial" in both the proficiency and category
                     type_matches = False
                     if "simple" in weapon_type and "simple" in weapon_cat_lower:
@@ -6151,15 +6816,15 @@ class CharacterBuilder:
                                     return True
                                 # Also check if the property is part of a longer property string
                                 # (e.g., "Finesse" in "Finesse, Light")
-                                if any(req_prop_capitalized.lower() in prop.lower() 
-                                      for prop in weapon_properties):
+                                if any(req_prop in prop for prop in weapon_properties_lower):
                                     return True
                         else:
                             # Single property requirement
                             req_prop = property_requirement.replace(" property", "").strip().capitalize()
                             if req_prop in weapon_properties:
                                 return True
-                            if any(req_prop.lower() in prop.lower() for prop in weapon_properties):
+                            req_prop_lower = req_prop.lower()
+                            if any(req_prop_lower in prop for prop in weapon_properties_lower):
                                 return True
 
         return False
@@ -6175,34 +6840,7 @@ class CharacterBuilder:
             is_crit: Whether this is a critical hit (doubles dice)
             has_gwf: Whether Great Weapon Fighting applies (reroll 1s and 2s)
         """
-        try:
-            if "d" not in dice_expr:
-                return float(bonus)
-
-            parts = dice_expr.lower().split("d")
-            num_dice = int(parts[0]) if parts[0] else 1
-            die_size = int(parts[1])
-
-            # For crits, double the number of dice
-            if is_crit:
-                num_dice *= 2
-
-            # Average of a die
-            if has_gwf:
-                # Great Weapon Fighting: reroll 1s and 2s
-                # Expected value = (2/N)*avg_reroll + sum(3 to N)/N
-                # Where avg_reroll is the normal die average
-                avg_all = (1 + die_size) / 2.0
-                sum_3_to_n = sum(range(3, die_size + 1))
-                avg_per_die = (2 * avg_all + sum_3_to_n) / die_size
-            else:
-                avg_per_die = (1 + die_size) / 2.0
-
-            total_avg = (num_dice * avg_per_die) + bonus
-
-            return round(total_avg, 1)
-        except (ValueError, IndexError):
-            return float(bonus)
+        return _average_damage(dice_expr, bonus, is_crit, has_gwf)
 
     def _get_weapon_icon(self, weapon_name: str) -> str:
         """Get the appropriate weapon icon path for a weapon name."""
@@ -6405,24 +7043,25 @@ class CharacterBuilder:
         Returns:
             Complete character data with all calculated values
         """
-        # Start with base character data
-        character_data = deepcopy(self.character_data)
-
-        # Phase 6: the structured bonus fields are *internal* calculation
-        # inputs. They are derived purely from the effects already captured
-        # in ``applied_effects`` (which is exported). Hiding them keeps the
-        # exported sheet stable and avoids leaking calculation scaffolding
-        # into API consumers.
-        for _internal_key in (
-            "damage_bonuses",
-            "attack_bonuses",
-            "ac_bonuses",
-            "hp_bonuses",
-            "initiative_bonuses",
-            "alternative_ac_options",
-            "fighting_style_flags",
-        ):
-            character_data.pop(_internal_key, None)
+        # Character state does not change while the export is built, so every
+        # calculation can share one set of processed ability scores.
+        self._processed_abilities = self.calculate_processed_ability_scores()
+        try:
+            return self._export_character()
+        finally:
+            self._processed_abilities = None
+
+    def _export_character(self) -> Dict[str, Any]:
+        """Build the ``to_character()`` payload."""
+        # Start with base character data. The internal structured bonus
+        # fields are skipped while copying rather than deep-copied and then
+        # popped; a shared memo keeps any cross-key references intact.
+        memo: Dict[int, Any] = {}
+        character_data = {
+            key: deepcopy(value, memo)
+            for key, value in self.character_data.items()
+            if key not in _INTERNAL_EXPORT_KEYS
+        }
 
         # Late-resolve choice_substitutions placeholders in features.
         # Species traits may have been applied before ancestry choices were stored.
@@ -6720,25 +7359,24 @@ class CharacterBuilder:
             self.character_data["choices_made"] = {}
 
         # Reconstruct ability scores
-        # First check for ability_scores (raw scores exported by to_character)
+        # First check for ability_scores (raw scores exported by to_character),
+        # then let the detailed abilities structure override them. All sources
+        # are loaded together so final scores are computed only once.
+        base_scores: Dict[str, int] = {}
         if "ability_scores" in data:
-            self.ability_scores.set_base_scores(data["ability_scores"])
-
-        # Also check for detailed abilities structure
-        abilities = data.get("abilities", {})
-        if abilities:
-            if "base" in abilities:
-                self.ability_scores.set_base_scores(abilities["base"])
-            if "species_bonuses" in abilities:
-                self.ability_scores.apply_species_bonuses(abilities["species_bonuses"])
-            if "background_bonuses" in abilities:
-                self.ability_scores.apply_background_bonuses(
-                    abilities["background_bonuses"]
-                )
-            if "additional_modifiers" in abilities:
-                self.ability_scores.apply_additional_modifiers(
-                    abilities["additional_modifiers"]
-                )
+            base_scores.update(data["ability_scores"])
+
+        abilities = data.get("abilities", {}) or {}
+        if "base" in abilities:
+            base_scores.update(abilities["base"])
+
+        if base_scores or abilities:
+            self.ability_scores.load_scores(
+                base=base_scores,
+                species_bonuses=abilities.get("species_bonuses"),
+                background_bonuses=abilities.get("background_bonuses"),
+                additional_modifiers=abilities.get("additional_modifiers"),
+            )
 
         # Restore applied_effects from exported effects array
         # This is critical for preserving effects across session save/restore cycles
@@ -6877,9 +7515,7 @@ class CharacterBuilder:
         def load_spell_definition(spell_name: str) -> Dict[str, Any]:
             """Load spell details from definitions folder."""
             spell_file = (
-                self.data_dir
-                / "spells"
-                / "definitions"
+                self._spell_definitions_dir
                 / f"{spell_name.lower().replace(' ', '_')}.json"
             )
             if spell_file.exists():
@@ -7060,9 +7696,7 @@ class CharacterBuilder:
 
             # Load class cantrip list
             class_lower = class_name.lower()
-            spell_file = (
-                self.data_dir / "spells" / "class_lists" / f"{class_lower}.json"
-            )
+            spell_file = self._class_spell_lists_dir / f"{class_lower}.json"
 
             if spell_file.exists():
                 spell_data = self._load_json_file(spell_file)
@@ -7128,9 +7762,7 @@ class CharacterBuilder:
                                                     )
                                                     class_lower = spell_list.lower()
                                                     spell_file = (
-                                                        self.data_dir
-                                                        / "spells"
-                                                        / "class_lists"
+                                                        self._class_spell_lists_dir
                                                         / f"{class_lower}.json"
                                                     )
 
@@ -7220,9 +7852,7 @@ class CharacterBuilder:
 
                 # Load class cantrip list once for efficiency
                 class_lower = class_name.lower()
-                spell_file = (
-                    self.data_dir / "spells" / "class_lists" / f"{class_lower}.json"
-                )
+                spell_file = self._class_spell_lists_dir / f"{class_lower}.json"
                 available_cantrips = []
 
                 if spell_file.exists():
@@ -7362,57 +7992,25 @@ class CharacterBuilder:
                 - suggested: Suggested allocation from background data
                 - ability_options: List of abilities available for allocation
         """
-        background_name = self.character_data.get("background")
-        if not background_name:
-            return {
-                "total_points": 3,
-                "suggested": {},
-                "ability_options": [
-                    "Strength",
-                    "Dexterity",
-                    "Constitution",
-                    "Intelligence",
-                    "Wisdom",
-                    "Charisma",
-                ],
-            }
-
-        background_data = self._load_background_data(background_name)
-        if not background_data:
-            return {
-                "total_points": 3,
-                "suggested": {},
-                "ability_options": [
-                    "Strength",
-                    "Dexterity",
-                    "Constitution",
-                    "Intelligence",
-                    "Wisdom",
-                    "Charisma",
-                ],
-            }
-
         # D&D 2024 standard
         total_points = 3
         suggested = {}
-        ability_options = [
-            "Strength",
-            "Dexterity",
-            "Constitution",
-            "Intelligence",
-            "Wisdom",
-            "Charisma",
-        ]
+        ability_options = list(ABILITIES)
+
+        background_name = self.character_data.get("background")
+        background_data = (
+            self._load_background_data(background_name) if background_name else None
+        )
 
-        if "ability_score_increase" in background_data:
+        if background_data and "ability_score_increase" in background_data:
             asi_data = background_data["ability_score_increase"]
             if "suggested" in asi_data:
                 suggested = asi_data["suggested"]
             if "options" in asi_data:
                 # Keep background-specific abilities in standard D&D order
-                bg_options = asi_data["options"]
+                bg_options = set(asi_data["options"])
                 ability_options = [
-                    ability for ability in ability_options if ability in bg_options
+                    ability for ability in ABILITIES if ability in bg_options
                 ]
 
         return {
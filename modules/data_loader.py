@@ -6,8 +6,9 @@ This module provides a clean interface for accessing D&D 2024 game data.
 """
 
 import json
+import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 
 def _validate_features_by_level(
@@ -53,6 +54,16 @@ def _validate_features_by_level(
             )
 
 
+def _scan_json_files(directory: str) -> List[os.DirEntry]:
+    """Return the ``*.json`` file entries directly inside ``directory``.
+
+    ``os.scandir`` reports the file type from the directory listing itself,
+    so no per-entry ``stat`` call or ``Path`` object is needed.
+    """
+    with os.scandir(directory) as it:
+        return [e for e in it if e.name.endswith(".json") and e.is_file()]
+
+
 class DataLoader:
     """
     Loads and provides access to D&D 2024 game data from JSON files.
@@ -65,6 +76,9 @@ class DataLoader:
         species_variants: Dictionary of species variant data
         feats: Dictionary of feat data keyed by feat name (loaded from origin_feats.json and general_feats.json)
         subclasses: Dictionary of subclass data organized by class name
+        class_names: Sorted tuple of class names
+        background_names: Sorted tuple of background names
+        species_names: Sorted tuple of species names
     """
 
     def __init__(self, data_dir: str = "data"):
@@ -82,6 +96,12 @@ class DataLoader:
         self.feats = self._load_feats()
         self.subclasses = self._load_subclasses()
 
+        # Name listings are fixed once loaded; materialize them here so the
+        # catalog endpoints don't re-sort the dict keys on every request.
+        self.class_names = tuple(sorted(self.classes))
+        self.background_names = tuple(sorted(self.backgrounds))
+        self.species_names = tuple(sorted(self.species))
+
     def _load_data(self, data_type: str) -> Dict[str, Dict[str, Any]]:
         """
         Load JSON data files from a directory.
@@ -96,19 +116,19 @@ class DataLoader:
         data = {}
 
         if data_dir.exists():
-            for json_file in data_dir.glob("*.json"):
+            for entry in _scan_json_files(data_dir):
                 try:
-                    with open(json_file, "r") as f:
-                        file_data = json.load(f)
-                        name = file_data.get("name")
-                        if name:
-                            _validate_features_by_level(
-                                file_data.get("features_by_level"),
-                                f"{json_file}",
-                            )
-                            data[name] = file_data
+                    with open(entry.path, "rb") as f:
+                        file_data = json.loads(f.read())
+                    name = file_data.get("name")
+                    if name:
+                        _validate_features_by_level(
+                            file_data.get("features_by_level"),
+                            entry.path,
+                        )
+                        data[name] = file_data
                 except (json.JSONDecodeError, IOError) as e:
-                    print(f"Warning: Could not load {json_file}: {e}")
+                    print(f"Warning: Could not load {entry.path}: {e}")
 
         return data
 
@@ -157,27 +177,26 @@ class DataLoader:
 
         if subclass_dir.exists():
             # Each subdirectory represents a class
-            for class_dir in subclass_dir.iterdir():
-                if class_dir.is_dir():
-                    class_name = class_dir.name.title()
-                    subclasses[class_name] = {}
-
-                    # Load all subclass files in this class directory
-                    for json_file in class_dir.glob("*.json"):
-                        try:
-                            with open(json_file, "r") as f:
-                                subclass_data = json.load(f)
-                                subclass_name = subclass_data.get("name")
-                                if subclass_name:
-                                    _validate_features_by_level(
-                                        subclass_data.get("features_by_level"),
-                                        f"{json_file}",
-                                    )
-                                    subclasses[class_name][subclass_name] = (
-                                        subclass_data
-                                    )
-                        except (json.JSONDecodeError, IOError) as e:
-                            print(f"Warning: Could not load {json_file}: {e}")
+            with os.scandir(subclass_dir) as it:
+                class_dirs = [e for e in it if e.is_dir()]
+            for class_dir in class_dirs:
+                class_name = class_dir.name.title()
+                subclasses[class_name] = {}
+
+                # Load all subclass files in this class directory
+                for entry in _scan_json_files(class_dir.path):
+                    try:
+                        with open(entry.path, "rb") as f:
+                            subclass_data = json.loads(f.read())
+                        subclass_name = subclass_data.get("name")
+                        if subclass_name:
+                            _validate_features_by_level(
+                                subclass_data.get("features_by_level"),
+                                entry.path,
+                            )
+                            subclasses[class_name][subclass_name] = subclass_data
+                    except (json.JSONDecodeError, IOError) as e:
+                        print(f"Warning: Could not load {entry.path}: {e}")
 
         return subclasses
 
@@ -16,6 +16,8 @@ import re
 from pathlib import Path
 from typing import Any, Dict, List
 
+from .character_builder import _load_json_cached
+
 # ---------------------------------------------------------------------------
 # Constants (mirror routes/character_summary.py for backward compatibility)
 # ---------------------------------------------------------------------------
@@ -36,6 +38,15 @@ _WEAPONS_FILE = _DATA_DIR / "equipment" / "weapons.json"
 _WEAPON_MASTERIES_FILE = _DATA_DIR / "equipment" / "weapon_masteries.json"
 
 
+def _load_json(path: Path) -> Any:
+    """Parse *path*, reusing the result until the file changes.
+
+    Uses the builder's file cache, so the parsed data is shared with every
+    ``CharacterBuilder`` and must not be mutated.
+    """
+    return _load_json_cached(str(path), path.stat().st_mtime_ns)
+
+
 # ---------------------------------------------------------------------------
 # Cantrip damage scaling
 # ---------------------------------------------------------------------------
@@ -119,8 +130,7 @@ def _load_class_spell_list(class_name: str) -> Dict[str, Any]:
     if not f.exists():
         return {}
     try:
-        with open(f, "r") as fh:
-            return json.load(fh)
+        return _load_json(f)
     except (json.JSONDecodeError, IOError):
         return {}
 
@@ -289,8 +299,7 @@ def build_mastery_management_view(builder) -> Dict[str, Any]:
     weapon_masteries: Dict[str, str] = {}
     if _WEAPONS_FILE.exists():
         try:
-            with open(_WEAPONS_FILE, "r") as f:
-                weapons_data = json.load(f)
+            weapons_data = _load_json(_WEAPONS_FILE)
             for weapon_name in stats.get("available_weapons", []) or []:
                 if weapon_name in weapons_data:
                     weapon_masteries[weapon_name] = weapons_data[weapon_name].get(
@@ -303,8 +312,7 @@ def build_mastery_management_view(builder) -> Dict[str, Any]:
     mastery_properties: Dict[str, Any] = {}
     if _WEAPON_MASTERIES_FILE.exists():
         try:
-            with open(_WEAPON_MASTERIES_FILE, "r") as f:
-                masteries_data = json.load(f)
+            masteries_data = _load_json(_WEAPON_MASTERIES_FILE)
             for weapon_name, prop_name in weapon_masteries.items():
                 if prop_name in masteries_data:
                     if prop_name not in mastery_properties:
@@ -6,7 +6,7 @@ Handles feature tracking, parsing, and application for D&D characters.
 
 import json
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 
 class FeatureManager:
@@ -20,6 +20,8 @@ class FeatureManager:
 
         # Feature registry for tracking active features
         self.feature_registry: Dict[str, Dict[str, Any]] = {}
+        # Summary of the registry; cleared whenever the registry changes
+        self._registry_summary: Optional[Dict[str, List[str]]] = None
 
         # Feature bonus categories
         self.bonus_categories = {
@@ -158,9 +160,24 @@ class FeatureManager:
             )
 
     def get_feature_summary(
-        self, active_features: List[Dict[str, Any]]
+        self, active_features: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, List[str]]:
-        """Get a summary of all active features organized by source"""
+        """Get a summary of all active features organized by source.
+
+        With no ``active_features`` the feature registry is summarized; that
+        result is cached until ``add_feature``/``remove_feature`` changes
+        the registry.
+        """
+        if active_features is None:
+            if self._registry_summary is None:
+                self._registry_summary = self._build_feature_summary(
+                    self.feature_registry.values()
+                )
+            return {k: list(v) for k, v in self._registry_summary.items()}
+        return self._build_feature_summary(active_features)
+
+    def _build_feature_summary(self, active_features) -> Dict[str, List[str]]:
+        """Categorize features by source and render their summary lines"""
         summary = {
             "Species Features": [],
             "Class Features": [],
@@ -215,6 +232,7 @@ class FeatureManager:
             "description": description,
             "source": source,
         }
+        self._registry_summary = None
 
     def get_features_by_source(self, source: str) -> Dict[str, Dict[str, Any]]:
         """Get all features from a specific source"""
@@ -228,5 +246,6 @@ class FeatureManager:
         """Remove a feature from the registry"""
         if feature_name in self.feature_registry:
             del self.feature_registry[feature_name]
+            self._registry_summary = None
             return True
         return False
@@ -6,6 +6,8 @@ Handles HP calculations including class hit dice, Constitution bonuses, and feat
 
 from typing import Dict, List, Any
 
+from .ability_scores import format_score
+
 
 class HPCalculator:
     """Manages hit point calculations for D&D characters"""
@@ -27,6 +29,8 @@ class HPCalculator:
         "Wizard": 6,
     }
 
+    __slots__ = ("per_level_bonuses",)
+
     def __init__(self):
         # Track per-level bonuses (like Dwarven Toughness)
         self.per_level_bonuses: List[Dict[str, Any]] = []
@@ -150,22 +154,18 @@ class HPCalculator:
 
     def print_hp_breakdown(self, breakdown: Dict[str, Any]):
         """Print a detailed HP breakdown"""
-        print(
-            f"\nHP Breakdown for Level {breakdown['level']} {breakdown['class_name']}:"
-        )
-        print(
-            f"  Base HP (d{self.CLASS_HIT_DICE.get(breakdown['class_name'], 6)}): {breakdown['base_hp']}"
-        )
-        print(
-            f"  Constitution {breakdown['constitution_score']} ({breakdown['constitution_modifier']:+d}): +{breakdown['constitution_bonus']}"
-        )
+        lines = [
+            f"\nHP Breakdown for Level {breakdown['level']} {breakdown['class_name']}:\n"
+            f"  Base HP (d{self.CLASS_HIT_DICE.get(breakdown['class_name'], 6)}): {breakdown['base_hp']}\n"
+            f"  Constitution {format_score(breakdown['constitution_score'])}: +{breakdown['constitution_bonus']}"
+        ]
 
         if breakdown["feature_breakdown"]:
-            print("  Features:")
-            for feature in breakdown["feature_breakdown"]:
-                print(f"    {feature}")
+            lines.append("  Features:")
+            lines.extend(f"    {feature}" for feature in breakdown["feature_breakdown"])
 
-        print(f"  Total HP: {breakdown['total_hp']}")
+        lines.append(f"  Total HP: {breakdown['total_hp']}")
+        print("\n".join(lines))
 
     def simulate_level_progression(
         self,
@@ -189,14 +189,16 @@ class HPCalculator:
 
     def print_level_progression(self, progression: Dict[int, Dict[str, Any]]):
         """Print HP progression across levels"""
-        print("\nHP Progression by Level:")
-        print("Level | Base | Con Bonus | Feature Bonus | Total HP")
-        print("------|------|-----------|---------------|----------")
-
-        for level, breakdown in sorted(progression.items()):
-            print(
-                f"  {level:2d}  |  {breakdown['base_hp']:2d}  |    +{breakdown['constitution_bonus']:2d}    |      +{breakdown['feature_bonus']:2d}      |   {breakdown['total_hp']:3d}"
-            )
+        lines = [
+            "\nHP Progression by Level:\n"
+            "Level | Base | Con Bonus | Feature Bonus | Total HP\n"
+            "------|------|-----------|---------------|----------"
+        ]
+        lines.extend(
+            f"  {level:2d}  |  {breakdown['base_hp']:2d}  |    +{breakdown['constitution_bonus']:2d}    |      +{breakdown['feature_bonus']:2d}      |   {breakdown['total_hp']:3d}"
+            for level, breakdown in sorted(progression.items())
+        )
+        print("\n".join(lines))
 
     def add_bonus_per_level(self, source: str, value: int) -> None:
         """Add a per-level HP bonus (like Dwarven Toughness)"""
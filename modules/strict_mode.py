@@ -99,11 +99,10 @@ KNOWN_EFFECT_TYPES: frozenset = frozenset({
 def check_effect_type(effect_type: Any, source_label: str) -> None:
     """Validate an ``effect['type']`` against the closed enum.
 
-    Called at the top of ``CharacterBuilder._apply_effect``. Some of the 28
-    types (e.g. ``bonus_ac``, ``bonus_damage``) intentionally have no branch
-    in ``_apply_effect`` — they are consumed downstream by calculation methods
-    that read ``applied_effects``. That asymmetry is what Phase 6 collapses;
-    Phase 5 just makes sure no typo'd type slips through.
+    Called from ``CharacterBuilder._apply_effect`` only when
+    ``_EFFECT_HANDLERS`` has no entry for the effect type. Every known type
+    has a handler, so in practice the check only runs for a missing,
+    non-string or unknown type, and makes sure no typo'd type slips through.
     """
     if not isinstance(effect_type, str) or not effect_type:
         _violate(
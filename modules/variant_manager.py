@@ -6,6 +6,7 @@ have multiple sub-variants that provide different features and abilities at vari
 """
 
 import json
+import sys
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
@@ -17,6 +18,7 @@ class VariantManager:
         self.data_dir = Path(__file__).parent.parent / "data"
         self.variant_data = self._load_variant_data()
         self.species_variants = self._organize_variants_by_species()
+        self.trait_descriptions = self._normalize_trait_descriptions()
 
     def _load_variant_data(self) -> Dict[str, Dict[str, Any]]:
         """Load all variant data from JSON files"""
@@ -49,6 +51,25 @@ class VariantManager:
 
         return by_species
 
+    def _normalize_trait_descriptions(self) -> Dict[str, Dict[str, str]]:
+        """Map each variant's traits to plain description strings.
+
+        Traits are stored either as a description string or as an object
+        with a ``description`` field; normalizing once here lets display
+        code treat every trait the same way.
+        """
+        normalized = {}
+        for variant_name, variant_data in self.variant_data.items():
+            normalized[variant_name] = {
+                trait_name: (
+                    trait_data
+                    if isinstance(trait_data, str)
+                    else trait_data.get("description", "")
+                )
+                for trait_name, trait_data in variant_data.get("traits", {}).items()
+            }
+        return normalized
+
     def get_available_variants(self, species_name: str) -> List[str]:
         """Get list of available variants for a species"""
         return self.species_variants.get(species_name, [])
@@ -179,43 +200,45 @@ class VariantManager:
             print(f"No variants available for {species_name}")
             return
 
-        print(f"\\nAvailable {species_name} Variants:")
-        print("=" * 50)
+        out = [f"\\nAvailable {species_name} Variants:", "=" * 50]
 
         for i, variant_name in enumerate(variants, 1):
             variant_data = self.get_variant_data(variant_name)
             if variant_data:
-                print(f"{i}. {variant_name}")
-
-                # Show immediate traits
-                traits = variant_data.get("traits", {})
-                for trait_name, trait_desc in traits.items():
-                    # Truncate long descriptions
-                    desc = (
-                        trait_desc[:80] + "..." if len(trait_desc) > 80 else trait_desc
-                    )
-                    print(f"   • {trait_name}: {desc}")
+                out.append(f"{i}. {variant_name}")
+
+                # Show immediate traits (long descriptions truncated)
+                traits = self.trait_descriptions.get(variant_name, {})
+                out.extend(
+                    f"   • {trait_name}: "
+                    f"{trait_desc[:80] + '...' if len(trait_desc) > 80 else trait_desc}"
+                    for trait_name, trait_desc in traits.items()
+                )
 
                 # Show level-based features
                 level_features = variant_data.get("level_features", {})
                 if level_features:
-                    print("   Level Features:")
-                    for level, features in sorted(
-                        level_features.items(), key=lambda x: int(x[0])
-                    ):
-                        print(f"     Level {level}: {', '.join(features)}")
+                    out.append("   Level Features:")
+                    out.extend(
+                        f"     Level {level}: {', '.join(features)}"
+                        for level, features in sorted(
+                            level_features.items(), key=lambda x: int(x[0])
+                        )
+                    )
 
                 # Show spell progression
                 spells_by_level = variant_data.get("spells_by_level", {})
                 if spells_by_level:
-                    print("   Spell Progression:")
-                    for level, spells in sorted(spells_by_level.items()):
-                        level_name = (
-                            "Cantrips" if level == "cantrip" else f"Level {level}"
-                        )
-                        print(f"     {level_name}: {', '.join(spells)}")
+                    out.append("   Spell Progression:")
+                    out.extend(
+                        f"     {'Cantrips' if level == 'cantrip' else f'Level {level}'}: "
+                        f"{', '.join(spells)}"
+                        for level, spells in sorted(spells_by_level.items())
+                    )
+
+                out.append("")
 
-                print()
+        sys.stdout.write("\n".join(out) + "\n")
 
     def get_variant_summary(self, variant_name: str) -> str:
         """Get a brief summary of a variant's key features"""
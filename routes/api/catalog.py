@@ -43,11 +43,12 @@ def _summarize(name: str, data: Dict[str, Any], extra_fields: List[str]) -> Dict
 
 @catalog_bp.get("/classes")
 def list_classes():
-    classes = _dl().classes
+    dl = _dl()
+    classes = dl.classes
     return jsonify({
         "classes": [
-            _summarize(name, data, ["hit_die", "primary_ability", "subclass_selection_level"])
-            for name, data in sorted(classes.items())
+            _summarize(name, classes[name], ["hit_die", "primary_ability", "subclass_selection_level"])
+            for name in dl.class_names
         ]
     })
 
@@ -88,9 +89,11 @@ def get_subclass(class_name: str, subclass_name: str):
 
 @catalog_bp.get("/species")
 def list_species():
-    species = _dl().species
+    dl = _dl()
+    species = dl.species
     out = []
-    for name, data in sorted(species.items()):
+    for name in dl.species_names:
+        data = species[name]
         summary = _summarize(name, data, ["creature_type", "size", "speed", "darkvision"])
         summary["has_lineages"] = bool(data.get("lineages"))
         summary["has_trait_choices"] = any(
@@ -122,9 +125,11 @@ def _extract_background_feat(data: Dict[str, Any]) -> str | None:
 
 @catalog_bp.get("/backgrounds")
 def list_backgrounds():
-    backgrounds = _dl().backgrounds
+    dl = _dl()
+    backgrounds = dl.backgrounds
     items = []
-    for name, data in sorted(backgrounds.items()):
+    for name in dl.background_names:
+        data = backgrounds[name]
         enriched = dict(data)
         if "feat" not in enriched:
             feat = _extract_background_feat(data)
@@ -0,0 +1,106 @@
+"""Tests for the AbilityScores score/modifier bookkeeping."""
+
+from modules.ability_scores import AbilityScores, format_score
+
+
+def test_modifiers_follow_final_scores():
+    """Modifiers reflect base scores plus every bonus source."""
+    scores = AbilityScores()
+    scores.set_base_scores({"Strength": 15, "Dexterity": 8})
+    scores.apply_background_bonuses({"Strength": 2})
+
+    assert scores.get_modifier("Strength") == 3
+    assert scores.get_modifier("Dexterity") == -1
+    assert scores.get_all_modifiers()["Constitution"] == 0
+
+
+def test_modifier_cache_invalidated_on_update():
+    """A cached modifier map is rebuilt after scores change."""
+    scores = AbilityScores()
+    assert scores.get_modifier("Wisdom") == 0
+
+    scores.set_base_scores({"Wisdom": 16})
+    assert scores.get_modifier("Wisdom") == 3
+
+    scores.from_dict({"final_ability_scores": {"Wisdom": 20}})
+    assert scores.get_modifier("Wisdom") == 5
+
+
+def test_get_all_modifiers_returns_copy():
+    """Mutating the returned dict does not corrupt the cache."""
+    scores = AbilityScores()
+    modifiers = scores.get_all_modifiers()
+    modifiers["Strength"] = 99
+
+    assert scores.get_modifier("Strength") == 0
+
+
+def test_unknown_ability_modifier_is_zero():
+    """Unknown abilities fall back to a score of 10 (modifier 0)."""
+    assert AbilityScores().get_modifier("Luck") == 0
+
+
+def test_load_scores_matches_individual_setters():
+    """Bulk loading gives the same result as calling each setter in turn."""
+    base = {"Strength": 15, "Dexterity": 14, "Charisma": 8}
+    species = {"Dexterity": 1}
+    background = {"Strength": 2, "Constitution": 1}
+    additional = {"Charisma": 1}
+
+    stepwise = AbilityScores()
+    stepwise.set_base_scores(base)
+    stepwise.apply_species_bonuses(species)
+    stepwise.apply_background_bonuses(background)
+    stepwise.apply_additional_modifiers(additional)
+
+    bulk = AbilityScores()
+    bulk.load_scores(
+        base=base,
+        species_bonuses=species,
+        background_bonuses=background,
+        additional_modifiers=additional,
+    )
+
+    assert bulk.to_dict() == stepwise.to_dict()
+    assert bulk.final_scores["Strength"] == 17
+
+
+def test_assign_standard_array_follows_recommendations():
+    """Recommended abilities take the highest standard-array scores in order."""
+    scores = AbilityScores()
+    assignment = scores.assign_standard_array(
+        scores.get_class_recommendations("Wizard")
+    )
+
+    assert assignment == {
+        "Intelligence": 15,
+        "Constitution": 14,
+        "Dexterity": 13,
+        "Wisdom": 12,
+        "Charisma": 10,
+        "Strength": 8,
+    }
+    assert scores.final_scores == assignment
+
+
+def test_format_score_includes_signed_modifier():
+    """Scores render with their modifier, inside and outside the 1-30 table."""
+    assert format_score(14) == "14 (+2)"
+    assert format_score(8) == "8 (-1)"
+    assert format_score(10) == "10 (+0)"
+    assert format_score(32) == "32 (+11)"
+
+
+def test_from_dict_round_trip():
+    """to_dict output loads back into an equivalent instance."""
+    original = AbilityScores()
+    original.load_scores(
+        base={"Strength": 15, "Wisdom": 13},
+        background_bonuses={"Strength": 2, "Wisdom": 1},
+    )
+
+    restored = AbilityScores()
+    restored.from_dict({**original.to_dict(), "unrelated": {"x": 1}})
+
+    assert restored.to_dict() == original.to_dict()
+    assert restored.get_modifier("Strength") == 3
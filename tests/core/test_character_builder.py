@@ -3,6 +3,9 @@
 Pytest tests for CharacterBuilder functionality
 """
 
+import json
+import os
+
 import pytest
 from modules.character_builder import CharacterBuilder
 
@@ -76,6 +79,40 @@ def test_proficiencies_system(character_builder):
     assert "Constitution" in saving_throws
 
 
+def test_reapplying_class_does_not_duplicate_saving_throws(character_builder):
+    """Setting the same class and level again keeps saving throws unique"""
+    character_builder.set_class("Fighter", 1)
+    character_builder.set_class("Fighter", 1)
+
+    saving_throws = character_builder.character_data["proficiencies"]["saving_throws"]
+    assert saving_throws.count("Strength") == 1
+    assert saving_throws.count("Constitution") == 1
+
+
+@pytest.mark.parametrize("level", [0, -2])
+def test_non_positive_level_applies_no_class_features(character_builder, level):
+    """A level below 1 applies no class features"""
+    character_builder.set_class("Fighter", level)
+
+    assert character_builder.character_data["features"]["class"] == []
+
+
+def test_data_file_added_after_first_lookup_is_found(tmp_path):
+    """A data file added while the process runs is found on the next lookup"""
+    backgrounds = tmp_path / "backgrounds"
+    backgrounds.mkdir()
+    builder = CharacterBuilder(data_dir=str(tmp_path))
+    assert builder._load_background_data("Late Arrival") is None
+
+    (backgrounds / "late_arrival.json").write_text(json.dumps({"name": "Late Arrival"}))
+    # Move the directory mtime forward explicitly so coarse filesystem
+    # timestamps cannot hide the change.
+    stat = os.stat(backgrounds)
+    os.utime(backgrounds, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert builder._load_background_data("Late Arrival") == {"name": "Late Arrival"}
+
+
 def test_unknown_ability_bonus_with_minimum_does_not_crash():
     """Unknown ability bonus entries should be ignored safely."""
     builder = CharacterBuilder()
@@ -0,0 +1,28 @@
+"""Tests for FeatureManager's feature registry summary."""
+
+from modules.feature_manager import FeatureManager
+
+
+def test_registry_summary_tracks_added_and_removed_features():
+    """The cached registry summary is refreshed after every registry change."""
+    manager = FeatureManager()
+    manager.add_feature("Darkvision", "See in dim light", "Species")
+    assert manager.get_feature_summary()["Species Features"] == [
+        "Darkvision: See in dim light"
+    ]
+
+    manager.add_feature("Rage", "Enter a rage", "Class")
+    assert manager.get_feature_summary()["Class Features"] == ["Rage: Enter a rage"]
+
+    manager.remove_feature("Rage")
+    assert manager.get_feature_summary()["Class Features"] == []
+
+
+def test_registry_summary_is_not_shared_with_callers():
+    """Mutating a returned summary does not leak into later calls."""
+    manager = FeatureManager()
+    manager.add_feature("Lucky", "Reroll a d20", "Feat")
+
+    manager.get_feature_summary()["Feat Features"].append("junk")
+
+    assert manager.get_feature_summary()["Feat Features"] == ["Lucky: Reroll a d20"]
@@ -673,6 +673,16 @@ class TestConcentrationFlag:
         assert second["concentration"] is True
         assert first["concentration"] == second["concentration"]
 
+    def test_spell_definition_not_shared_between_builders(self):
+        """Annotating one builder's spell object does not leak into another's."""
+        first = self._builder()._load_spell_definition("Bless")
+        first["source"] = "Annotated"
+
+        second = self._builder()._load_spell_definition("Bless")
+        assert second is not first
+        assert second.get("source") != "Annotated"
+        assert second["concentration"] is True
+
     # ------------------------------------------------------------------
     # Integration: flag flows into to_character() → spells_by_level
     # ------------------------------------------------------------------
@@ -117,6 +117,11 @@ def test_known_effect_type_does_not_raise():
         strict_mode.check_effect_type(effect_type, source_label="enum-parity")
 
 
+def test_every_known_effect_type_has_a_handler():
+    """``_apply_effect`` skips validation for handled types, so the sets must match."""
+    assert set(CharacterBuilder._EFFECT_HANDLERS) == set(strict_mode.KNOWN_EFFECT_TYPES)
+
+
 # ---------------------------------------------------------------------------
 # Unknown choices_made top-level keys
 # ---------------------------------------------------------------------------
@@ -321,6 +321,22 @@ class TestToughFeatHP:
             f"Tough HP {tough_hp} should be {normal_hp} + 10 = {normal_hp + 10}"
         )
 
+    def test_applied_feat_effect_not_shared_between_builders(self):
+        """Mutating one builder's applied feat effect leaves other builders alone."""
+        first = CharacterBuilder()
+        first.set_background("Farmer")
+        applied = next(
+            e for e in first.applied_effects if e.get("source") == "Tough"
+        )
+        applied["effect"]["value"] = 99
+
+        second = CharacterBuilder()
+        second.set_background("Farmer")
+        other = next(
+            e for e in second.applied_effects if e.get("source") == "Tough"
+        )
+        assert other["effect"]["value"] == 2
+
 
 # ==================== 3. Effects Tests ====================
 
@@ -92,6 +92,11 @@ CLASS_EXTRA_PAGES = {
 # Wiki data directory
 WIKI_DATA_DIR = Path("wiki_data")
 
+# Cache files are written compact by default; --pretty switches to indented
+# output for hand inspection.
+JSON_DUMP_OPTIONS = {"separators": (",", ":")}
+PRETTY_JSON_DUMP_OPTIONS = {"indent": 2}
+
 
 def fetch_wiki_page(url):
     """Fetch a page from the wiki."""
@@ -123,14 +128,15 @@ def extract_page_content(soup):
     return content
 
 
-def save_wiki_data(filepath, data):
+def save_wiki_data(filepath, data, pretty=False):
     """Save wiki data to a JSON file."""
+    dump_options = PRETTY_JSON_DUMP_OPTIONS if pretty else JSON_DUMP_OPTIONS
     filepath.parent.mkdir(parents=True, exist_ok=True)
     with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        json.dump(data, f, ensure_ascii=False, **dump_options)
 
 
-def fetch_class_data(class_name, overwrite=False):
+def fetch_class_data(class_name, overwrite=False, pretty=False):
     """Fetch and save class data from wiki."""
     filepath = WIKI_DATA_DIR / "classes" / f"{class_name}.json"
 
@@ -161,12 +167,14 @@ def fetch_class_data(class_name, overwrite=False):
     }
 
     # Save to file
-    save_wiki_data(filepath, wiki_data)
+    save_wiki_data(filepath, wiki_data, pretty=pretty)
     print(f"  ✅ Saved to {filepath}")
     return True
 
 
-def fetch_subclass_data(class_name, subclass_name, overwrite=False):
+def fetch_subclass_data(
+    class_name, subclass_name, overwrite=False, pretty=False
+):
     """Fetch and save subclass data from wiki."""
     filepath = WIKI_DATA_DIR / "subclasses" / class_name / f"{subclass_name}.json"
 
@@ -198,12 +206,12 @@ def fetch_subclass_data(class_name, subclass_name, overwrite=False):
     }
 
     # Save to file
-    save_wiki_data(filepath, wiki_data)
+    save_wiki_data(filepath, wiki_data, pretty=pretty)
     print(f"  ✅ Saved to {filepath}")
     return True
 
 
-def fetch_extra_page_data(class_name, page_slug, overwrite=False):
+def fetch_extra_page_data(class_name, page_slug, overwrite=False, pretty=False):
     """Fetch and save an extra class-related page (e.g. warlock invocations)."""
     # page_slug is the wiki path, e.g. "warlock:eldritch-invocation".
     # Strip the "<class>:" prefix to derive the on-disk filename.
@@ -240,7 +248,7 @@ def fetch_extra_page_data(class_name, page_slug, overwrite=False):
     }
 
     filepath.parent.mkdir(parents=True, exist_ok=True)
-    save_wiki_data(filepath, wiki_data)
+    save_wiki_data(filepath, wiki_data, pretty=pretty)
     print(f"  ✅ Saved to {filepath}")
     return True
 
@@ -271,6 +279,11 @@ Examples:
         action="store_true",
         help="Overwrite existing cached files (default: skip existing files)",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Write indented JSON (default: compact)",
+    )
     parser.add_argument(
         "--class",
         dest="class_filter",
@@ -305,7 +318,9 @@ Examples:
     class_failed = 0
 
     for class_name in classes_to_fetch:
-        result = fetch_class_data(class_name, overwrite=args.overwrite)
+        result = fetch_class_data(
+            class_name, overwrite=args.overwrite, pretty=args.pretty
+        )
         if result:
             # Check if it was actually fetched or skipped
             filepath = WIKI_DATA_DIR / "classes" / f"{class_name}.json"
@@ -326,7 +341,10 @@ Examples:
         if class_name in SUBCLASSES:
             for subclass in SUBCLASSES[class_name]:
                 result = fetch_subclass_data(
-                    class_name, subclass, overwrite=args.overwrite
+                    class_name,
+                    subclass,
+                    overwrite=args.overwrite,
+                    pretty=args.pretty,
                 )
                 if result:
                     subclass_success += 1
@@ -343,7 +361,10 @@ Examples:
     for class_name in classes_to_fetch:
         for page_slug in CLASS_EXTRA_PAGES.get(class_name, []):
             result = fetch_extra_page_data(
-                class_name, page_slug, overwrite=args.overwrite
+                class_name,
+                page_slug,
+                overwrite=args.overwrite,
+                pretty=args.pretty,
             )
             if result:
                 extra_success += 1
@@ -33,6 +33,11 @@ SPECIES = [
 # Wiki data directory
 WIKI_DATA_DIR = Path("wiki_data")
 
+# Cache files are written compact by default; --pretty switches to indented
+# output for hand inspection.
+JSON_DUMP_OPTIONS = {"separators": (",", ":")}
+PRETTY_JSON_DUMP_OPTIONS = {"indent": 2}
+
 
 def fetch_wiki_page(url):
     """Fetch a page from the wiki."""
@@ -64,14 +69,15 @@ def extract_page_content(soup):
     return content
 
 
-def save_wiki_data(filepath, data):
+def save_wiki_data(filepath, data, pretty=False):
     """Save wiki data to a JSON file."""
+    dump_options = PRETTY_JSON_DUMP_OPTIONS if pretty else JSON_DUMP_OPTIONS
     filepath.parent.mkdir(parents=True, exist_ok=True)
     with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        json.dump(data, f, ensure_ascii=False, **dump_options)
 
 
-def fetch_species_data(species_name, overwrite=False):
+def fetch_species_data(species_name, overwrite=False, pretty=False):
     """Fetch and save species data from wiki."""
     filepath = WIKI_DATA_DIR / "species" / f"{species_name}.json"
 
@@ -102,7 +108,7 @@ def fetch_species_data(species_name, overwrite=False):
     }
 
     # Save to file
-    save_wiki_data(filepath, wiki_data)
+    save_wiki_data(filepath, wiki_data, pretty=pretty)
     print(f"  ✅ Saved to {filepath}")
     return True
 
@@ -133,6 +139,11 @@ Examples:
         action="store_true",
         help="Overwrite existing cached files (default: skip existing files)",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Write indented JSON (default: compact)",
+    )
     parser.add_argument(
         "--species",
         dest="species_filter",
@@ -167,7 +178,9 @@ Examples:
     species_failed = 0
 
     for species_name in species_to_fetch:
-        result = fetch_species_data(species_name, overwrite=args.overwrite)
+        result = fetch_species_data(
+            species_name, overwrite=args.overwrite, pretty=args.pretty
+        )
         if result:
             # Check if it was actually fetched or skipped
             filepath = WIKI_DATA_DIR / "species" / f"{species_name}.json"
@@ -109,6 +109,13 @@ def parse_spell_tabs(html):
     return result
 
 
+def write_json_file(filepath, data):
+    """Stream data to filepath as indented JSON with a trailing newline."""
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
 def write_cantrips_file(class_name, cantrips, overwrite=False):
     """Write the {class}_cantrips.json file."""
     filepath = SPELLS_DIR / f"{class_name}_cantrips.json"
@@ -117,7 +124,7 @@ def write_cantrips_file(class_name, cantrips, overwrite=False):
         return False
 
     data = {"cantrips": cantrips}
-    filepath.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n")
+    write_json_file(filepath, data)
     print(f"  ✅ Wrote {filepath.name} ({len(cantrips)} cantrips)")
     return True
 
@@ -139,7 +146,7 @@ def write_spells_file(class_name, spells_by_level, overwrite=False):
         if level_key in spells_by_level and spells_by_level[level_key]:
             data[label] = spells_by_level[level_key]
 
-    filepath.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n")
+    write_json_file(filepath, data)
     total = sum(len(v) for v in data.values())
     print(f"  ✅ Wrote {filepath.name} ({total} spells across {len(data)} levels)")
     return True
@@ -162,7 +169,7 @@ def write_class_list_file(class_name, cantrips, spells_by_level, overwrite=False
         if level_key in spells_by_level and spells_by_level[level_key]:
             data["spells_by_level"][level_key] = spells_by_level[level_key]
 
-    filepath.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n")
+    write_json_file(filepath, data)
     print(f"  ✅ Wrote {filepath.name}")
     return True
 